@@ -54,3 +54,23 @@ async def get_current_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
+
+
+async def get_current_admin(
+    current_user: User = Depends(get_current_user)
+) -> User:
+    # [SECURITY] Admins are listed in settings.ADMIN_USER_IDS
+    if current_user.id not in config.settings.ADMIN_USER_IDS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin only")
+    return current_user
+
+
+async def get_current_admin_detached(token: str = Depends(reusable_oauth2)) -> User:
+    """
+    get_current_admin in its own short-lived session: the connection is back
+    in the pool before the endpoint runs. Also callable directly, with
+    `await reusable_oauth2(request)`, to guard part of an endpoint.
+    """
+    async with db.AsyncSessionLocal() as session:
+        user = await get_current_user(session, token)
+    return await get_current_admin(user)
@@ -1,9 +1,11 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from app.core import db
+from app.core.http_cache import conditional_get
+from app.core.serialization import respond, validate_many
 from app.api import deps
 from app.crud import achievement as achievement_crud
 from app.models.models import User
@@ -13,27 +15,28 @@ router = APIRouter()
 logger = structlog.get_logger()
 
 
-@router.get("/me", response_model=AchievementList)
-def get_my_achievements(
-    session: Session = Depends(db.get_db),
+@router.get("/me", response_model=AchievementList,
+            dependencies=[Depends(conditional_get("achievements", per_user=True))])
+async def get_my_achievements(
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get all achievements for current user."""
-    achievements = achievement_crud.get_user_achievements(session, current_user.id)
-    return AchievementList(
-        achievements=[AchievementResponse.from_orm(a) for a in achievements],
+    achievements = await achievement_crud.get_user_achievements(session, current_user.id)
+    return respond(AchievementList(
+        achievements=validate_many(AchievementResponse, achievements),
         total_count=len(achievements)
-    )
+    ))
 
 
 @router.post("", response_model=AchievementResponse, status_code=201)
-def create_achievement(
+async def create_achievement(
     achievement_in: AchievementCreate,
-    session: Session = Depends(db.get_db),
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Create a new achievement (admin only in production)."""
-    achievement = achievement_crud.create_achievement(
+    achievement = await achievement_crud.create_achievement(
         session,
         user_id=current_user.id,
         title=achievement_in.title,
@@ -46,13 +49,13 @@ def create_achievement(
 
 
 @router.get("/{achievement_id}", response_model=AchievementResponse)
-def get_achievement(
+async def get_achievement(
     achievement_id: str,
-    session: Session = Depends(db.get_db),
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get specific achievement."""
-    achievement = achievement_crud.get_achievement(session, achievement_id)
+    achievement = await achievement_crud.get_achievement(session, achievement_id)
     if not achievement:
         raise HTTPException(status_code=404, detail="Achievement not found")
     if achievement.user_id != current_user.id:
@@ -61,17 +64,17 @@ def get_achievement(
 
 
 @router.delete("/{achievement_id}", status_code=204)
-def delete_achievement(
+async def delete_achievement(
     achievement_id: str,
-    session: Session = Depends(db.get_db),
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Delete an achievement."""
-    achievement = achievement_crud.get_achievement(session, achievement_id)
+    achievement = await achievement_crud.get_achievement(session, achievement_id)
     if not achievement:
         raise HTTPException(status_code=404, detail="Achievement not found")
     if achievement.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    achievement_crud.delete_achievement(session, achievement_id)
+    await achievement_crud.delete_achievement(session, achievement_id)
     logger.info("achievement.deleted", achievement_id=achievement_id)
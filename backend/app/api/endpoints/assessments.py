@@ -1,8 +1,7 @@
 from datetime import datetime
-import random
 import uuid
 import structlog
-from typing import List, Dict
+from typing import Dict, List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -10,60 +9,175 @@ from sqlalchemy import select
 from app.core.context import RequestContext
 from app.api import deps
 from app.core import db
+from app.core.assessments import RELOAD_CHECK_S, CompiledAssessment, assessment_catalog
+from app.core.http_cache import conditional_get, response_cache
+from app.core.serialization import respond
+from app.crud import assessment as assessment_crud
 from app.schemas.assessment import (
-    AssessmentConfig, AssessmentCreate, AssessmentResponse, 
-    Question, AnswerSubmission, AssessmentResult
+    AssessmentConfig, AssessmentCreate, AssessmentResponse,
+    AnswerSubmission, AssessmentResult
 )
 from app.models.models import Assessment, User
 
 router = APIRouter()
 logger = structlog.get_logger()
 
-# [MOCK] Content Repository
-# In prod, this would be in a DB table "assessment_definitions"
-AVAILABLE_ASSESSMENTS = [
-    AssessmentConfig(
-        id="asm_healthcare_basics",
-        title="Healthcare Informatics Basics",
-        description="Core concepts of EHR, interoperability (FHIR), and patient data privacy.",
-        category="Healthcare",
-        estimated_time_minutes=15,
-        question_count=5
-    ),
-    AssessmentConfig(
-        id="asm_urban_planning",
-        title="Smart City Infrastructure",
-        description="IoT sensors, traffic flow algorithms, and sustainable energy grids.",
-        category="Urban Planning",
-        estimated_time_minutes=20,
-        question_count=5
-    ),
-     AssessmentConfig(
-        id="asm_python_ds",
-        title="Python for Data Science",
-        description="Pandas, NumPy, and basic ML concepts.",
-        category="Tech",
-        estimated_time_minutes=10,
-        question_count=5
-    )
+# [DEFAULTS] Seeded into assessment_definitions when it has no active definition;
+# edit the stored rows (load_assessments.py) rather than these
+DEFAULT_DEFINITIONS = [
+    {
+        "id": "asm_healthcare_basics",
+        "title": "Healthcare Informatics Basics",
+        "description": "Core concepts of EHR, interoperability (FHIR), and patient data privacy.",
+        "category": "Healthcare",
+        "estimated_time_minutes": 15,
+        "questions": [
+            {"id": "q1", "text": "What does FHIR stand for?", "domain": "interoperability",
+             "options": ["Fast Health Interoperability Resources", "Federal Health Insurance Regulation", "Future Health Information Record"], "correct": 0},
+            {"id": "q2", "text": "Which standard is used for imaging?", "domain": "interoperability",
+             "options": ["DICOM", "HL7", "X12"], "correct": 0},
+            {"id": "q3", "text": "In FHIR, what is the basic unit of exchange?", "domain": "interoperability",
+             "options": ["Segment", "Resource", "Message header"], "correct": 1},
+            {"id": "q4", "text": "Which US law governs the privacy of patient health information?", "domain": "privacy",
+             "options": ["HIPAA", "FERPA", "SOX"], "correct": 0},
+            {"id": "q5", "text": "What is the main purpose of an EHR?", "domain": "ehr",
+             "options": ["Billing insurers", "A longitudinal digital record of a patient's care", "Scheduling staff"], "correct": 1},
+        ],
+        "domains": {
+            "interoperability": {
+                "gap": "Found gaps in foundational knowledge, specifically in interoperability standards.",
+                "recommendations": ["Review Module 1: Introduction to FHIR", "Practice: Mock dataset exercises"],
+            },
+            "privacy": {
+                "gap": "Patient data privacy rules need another look.",
+                "recommendations": ["Watch: 'Data Privacy in Healthcare' (15m)"],
+            },
+            "ehr": {
+                "gap": "The role of electronic health records is not yet clear.",
+                "recommendations": ["Review Module 2: EHR Fundamentals"],
+            },
+        },
+        "on_pass": {
+            "gap": "Excellent command of core concepts. You are ready for advanced modules.",
+            "recommendations": ["Advanced Certification", "Project: Build a real-world app"],
+        },
+    },
+    {
+        "id": "asm_urban_planning",
+        "title": "Smart City Infrastructure",
+        "description": "IoT sensors, traffic flow algorithms, and sustainable energy grids.",
+        "category": "Urban Planning",
+        "estimated_time_minutes": 20,
+        "questions": [
+            {"id": "q1", "text": "Which protocol is common for low-power IoT sensor networks?", "domain": "iot",
+             "options": ["LoRaWAN", "FTP", "SMTP"], "correct": 0},
+            {"id": "q2", "text": "What does edge computing do for city sensors?", "domain": "iot",
+             "options": ["Processes data near the sensor", "Stores data on tape", "Replaces the sensors"], "correct": 0},
+            {"id": "q3", "text": "Adaptive traffic signals primarily optimise for?", "domain": "traffic",
+             "options": ["Lamp lifetime", "Queue length and delay", "Road surface wear"], "correct": 1},
+            {"id": "q4", "text": "Which model is classic for macroscopic traffic flow?", "domain": "traffic",
+             "options": ["Lighthill-Whitham-Richards", "Black-Scholes", "Lotka-Volterra"], "correct": 0},
+            {"id": "q5", "text": "What lets a smart grid balance intermittent solar supply?", "domain": "energy",
+             "options": ["Demand response and storage", "Higher voltage everywhere", "Fewer meters"], "correct": 0},
+        ],
+        "domains": {
+            "iot": {
+                "gap": "Sensor networking and edge processing need work.",
+                "recommendations": ["Course: IoT Networks for Cities"],
+            },
+            "traffic": {
+                "gap": "Traffic flow modelling is a gap.",
+                "recommendations": ["Review: Traffic Flow Theory basics", "Practice: Signal timing simulation"],
+            },
+            "energy": {
+                "gap": "Smart grid balancing concepts are missing.",
+                "recommendations": ["Course: Sustainable Energy Grids"],
+            },
+        },
+        "on_pass": {
+            "gap": "Solid grasp of smart city infrastructure.",
+            "recommendations": ["Project: City sensor dashboard"],
+        },
+    },
+    {
+        "id": "asm_python_ds",
+        "title": "Python for Data Science",
+        "description": "Pandas, NumPy, and basic ML concepts.",
+        "category": "Tech",
+        "estimated_time_minutes": 10,
+        "questions": [
+            {"id": "q1", "text": "Which pandas method drops rows with missing values?", "domain": "pandas",
+             "options": ["dropna()", "fillna()", "isna()"], "correct": 0},
+            {"id": "q2", "text": "How do you select rows by label in pandas?", "domain": "pandas",
+             "options": [".iloc", ".loc", ".at_index"], "correct": 1},
+            {"id": "q3", "text": "What does NumPy broadcasting do?", "domain": "numpy",
+             "options": ["Sends arrays over the network", "Aligns shapes for element-wise operations", "Sorts arrays in place"], "correct": 1},
+            {"id": "q4", "text": "Why split data into train and test sets?", "domain": "ml",
+             "options": ["To estimate performance on unseen data", "To train faster", "To reduce memory"], "correct": 0},
+            {"id": "q5", "text": "A model that scores well on training data but poorly on test data is?", "domain": "ml",
+             "options": ["Underfitting", "Overfitting", "Regularised"], "correct": 1},
+        ],
+        "domains": {
+            "pandas": {
+                "gap": "Data wrangling with pandas needs practice.",
+                "recommendations": ["Practice: pandas exercises"],
+            },
+            "numpy": {
+                "gap": "Array operations in NumPy are a gap.",
+                "recommendations": ["Review: NumPy broadcasting"],
+            },
+            "ml": {
+                "gap": "Core machine learning evaluation concepts are missing.",
+                "recommendations": ["Course: Intro to Machine Learning"],
+            },
+        },
+        "on_pass": {
+            "gap": "Ready for applied machine learning projects.",
+            "recommendations": ["Project: End-to-end ML notebook"],
+        },
+    },
 ]
 
-MOCK_QUESTIONS = {
-    "asm_healthcare_basics": [
-        Question(id="q1", text="What does FHIR stand for?", options=["Fast Health Interoperability Resources", "Federal Health Insurance Regulation", "Future Health Information Record"]),
-        Question(id="q2", text="Which standard is used for imaging?", options=["DICOM", "HL7", "X12"]),
-    ],
-    # ... others implied
-}
 
-@router.get("/available", response_model=List[AssessmentConfig])
+def _invalidate_available() -> None:
+    response_cache.invalidate("assessments")
+
+
+# [CACHE] Compiled definitions changed: drop the cached /available validator
+assessment_catalog.on_reload.append(_invalidate_available)
+
+
+async def _load_definitions(session: AsyncSession):
+    definitions = await assessment_crud.get_active_definitions(session)
+    if not definitions:
+        await assessment_crud.seed_definitions(session, DEFAULT_DEFINITIONS)
+        definitions = await assessment_crud.get_active_definitions(session)
+    return definitions
+
+
+async def _catalog(session: AsyncSession) -> Dict[str, CompiledAssessment]:
+    return await assessment_catalog.definitions(
+        lambda: assessment_crud.get_definitions_fingerprint(session),
+        lambda: _load_definitions(session),
+    )
+
+
+@router.get(
+    "/available",
+    response_model=List[AssessmentConfig],
+    # [PERFORMANCE] Catalogue without auth: safe for shared caches. Validators live no
+    # longer than a catalog check, so an edited definition is served within minutes
+    dependencies=[Depends(conditional_get("assessments", max_age=300, server_ttl=RELOAD_CHECK_S, public=True))]
+)
 async def list_assessments(
+    session: AsyncSession = Depends(db.get_db),
     ctx: RequestContext = Depends(deps.get_request_context)
 ):
     """
     List all assessments available to the user.
     """
-    return AVAILABLE_ASSESSMENTS
+    catalog = await _catalog(session)
+    return respond([assessment.config for assessment in catalog.values()])
 
 @router.post("/start", response_model=AssessmentResponse)
 async def start_assessment(
@@ -77,42 +191,41 @@ async def start_assessment(
     Start a new assessment session.
     """
     # 1. Validate Config
-    config = next((a for a in AVAILABLE_ASSESSMENTS if a.id == data.assessment_config_id), None)
-    if not config:
+    assessment = (await _catalog(db)).get(data.assessment_config_id)
+    if assessment is None:
         raise HTTPException(status_code=404, detail="Assessment type not found")
-    
+
     # 2. Create Session in DB
     # [ID] Generate UUID
     session_id = str(uuid.uuid4())
-    
+
     # [MOCK] using a hardcoded user_id for now since we don't have full Auth middleware active in this turn
     # In reality, use ctx.user_id or from token
-    user_id = "u1" 
-    
+    user_id = "u1"
+
+    created_at = datetime.utcnow()
     new_assessment = Assessment(
         id=session_id,
         user_id=user_id,
-        title=config.title,
+        title=assessment.title,
         status="started",
-        score=0.0
+        score=0.0,
+        # Submit grades only against this version of the definition (409 once it changed)
+        raw_results={"definition_id": assessment.id, "version": assessment.version},
+        created_at=created_at
     )
     db.add(new_assessment)
     await db.commit()
-    
+
+    logger.info("assessment_started", id=session_id, title=assessment.title, **ctx.log_kwargs())
+
     # 3. Return with Questions
-    questions = MOCK_QUESTIONS.get(config.id, [])
-    if not questions:
-        # Fallback for mocked items without questions
-        questions = [Question(id="q_gen", text="Placeholder question?", options=["Yes", "No"])]
-        
-    logger.info("assessment_started", id=session_id, title=config.title, **ctx.log_kwargs())
-    
     return AssessmentResponse(
         id=session_id,
-        title=config.title,
+        title=assessment.title,
         status="started",
-        created_at=new_assessment.created_at or datetime.utcnow(), # Handle commit refresh
-        questions=questions
+        created_at=created_at,
+        questions=assessment.questions
     )
 
 @router.post("/{assessment_id}/submit", response_model=AssessmentResult)
@@ -128,51 +241,56 @@ async def submit_assessment(
     # 1. Fetch Assessment
     result = await db.execute(select(Assessment).where(Assessment.id == assessment_id))
     assessment = result.scalars().first()
-    
+
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment session not found")
-        
+
     if assessment.status == "completed":
         raise HTTPException(status_code=400, detail="Assessment already completed")
 
-    # 2. Calculate Score (Mock Logic)
-    # [MAGIC] Random score for demo unless actually checking answers
-    # In prod, fetch correct answers from DB and compare
-    score = random.randint(40, 100)
-    
-    # 3. Generate Gap Analysis [ALGO]
-    passed = score >= 70
-    gap_analysis = ""
-    recommendations = []
-    
-    if passed:
-        gap_analysis = "Excellent command of core concepts. You are ready for advanced modules."
-        recommendations = ["Advanced Certification", "Project: Build a real-world app"]
-    else:
-        gap_analysis = "Found gaps in foundational knowledge, specifically in interoperability standards."
-        recommendations = [
-            "Review Module 1: Introduction to FHIR",
-            "Watch: 'Data Privacy in Healthcare' (15m)",
-            "Practice: Mock dataset exercises"
-        ]
-        
-    # 4. Save
-    assessment.score = float(score)
+    # 2. Grade: score and per-domain gaps in one pass [ALGO]
+    started = assessment.raw_results or {}
+    definition = (await _catalog(db)).get(started.get("definition_id"))
+    if definition is not None and started.get("version", definition.version) > definition.version:
+        # Started through a worker that already loaded a newer version: catch up
+        assessment_catalog.invalidate()
+        definition = (await _catalog(db)).get(started.get("definition_id"))
+    if definition is None:
+        # Sessions started before definitions were stored only have the title
+        definition = assessment_catalog.by_title(assessment.title)
+    if definition is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Assessment definition no longer available")
+    if started.get("version", definition.version) != definition.version:
+        # The answer key the questions came from is gone: never grade against another one
+        logger.warning("assessment_definition_changed", id=assessment_id, started=started.get("version"),
+                       current=definition.version, **ctx.log_kwargs())
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                            detail="Assessment changed since it was started; please start it again")
+
+    grade = definition.grade((a.question_id, a.selected_option_index) for a in answers)
+
+    # 3. Save
+    assessment.score = grade.score
     assessment.status = "completed"
     assessment.raw_results = {
-        "answers_count": len(answers), 
-        "gap_text": gap_analysis,
-        "recommendations": recommendations
+        "definition_id": definition.id,
+        "version": definition.version,
+        "answers_count": len(answers),
+        "answered": grade.answered,
+        "correct": grade.correct,
+        "weak_domains": grade.weak_domains,
+        "gap_text": grade.gap_analysis,
+        "recommendations": grade.recommendations
     }
-    
+
     await db.commit()
-    
-    logger.info("assessment_completed", id=assessment_id, score=score, **ctx.log_kwargs())
-    
+
+    logger.info("assessment_completed", id=assessment_id, score=grade.score, **ctx.log_kwargs())
+
     return AssessmentResult(
         assessment_id=assessment_id,
-        score=float(score),
-        passed=passed,
-        gap_analysis=gap_analysis,
-        recommended_actions=recommendations
+        score=grade.score,
+        passed=grade.passed,
+        gap_analysis=grade.gap_analysis,
+        recommended_actions=grade.recommendations
     )
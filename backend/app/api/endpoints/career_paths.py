@@ -0,0 +1,109 @@
+import heapq
+import math
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.core import db
+from app.core.career_matrix import CareerMatrix, career_progress
+from app.core.serialization import respond, validate_many
+from app.api import deps
+from app.crud import career_path as career_crud
+from app.models.models import User
+from app.schemas.career_path import (
+    CareerPathCreate, CareerPathList, CareerPathResponse, CareerProgressResponse
+)
+
+router = APIRouter()
+logger = structlog.get_logger()
+
+
+async def _user_scores(session: AsyncSession, user_id: str):
+    matrix = await career_progress.matrix(lambda: career_crud.get_path_requirements(session))
+    levels = matrix.user_levels(await career_crud.get_user_skill_levels(session, user_id))
+    return matrix, levels, career_progress.scores(matrix, user_id, levels)
+
+
+def _progress(matrix: CareerMatrix, row: int, levels: dict, score: float) -> CareerProgressResponse:
+    met, missing = matrix.breakdown(row, levels)
+    return CareerProgressResponse(
+        path_id=matrix.path_ids[row],
+        path_title=matrix.titles[row],
+        progress_percentage=round(score * 100, 1),
+        current_skills=met,
+        missing_skills=missing,
+        estimated_completion_months=math.ceil(matrix.months[row] * (1 - score))
+    )
+
+
+@router.get("", response_model=CareerPathList)
+async def list_career_paths(
+    session: AsyncSession = Depends(db.get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    industry: Optional[str] = Query(None),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """Get career paths, optionally for one industry."""
+    paths = await career_crud.get_career_paths(session, skip, limit, industry)
+    return respond(CareerPathList(
+        paths=validate_many(CareerPathResponse, paths),
+        total_count=len(paths)
+    ))
+
+
+@router.post("", response_model=CareerPathResponse, status_code=201)
+async def create_career_path(
+    path_in: CareerPathCreate,
+    session: AsyncSession = Depends(db.get_db),
+    current_user: User = Depends(deps.get_current_admin)
+):
+    """Create a career path. Admin only: it rebuilds the requirement matrix for every user."""
+    path = await career_crud.create_career_path(session, **path_in.model_dump())
+    logger.info("career_path.created", path_id=path.id, user_id=current_user.id)
+    return respond(CareerPathResponse.model_validate(path), status_code=201)
+
+
+@router.get("/me/matches", response_model=List[CareerProgressResponse])
+async def get_best_matching_paths(
+    session: AsyncSession = Depends(db.get_db),
+    limit: int = Query(5, ge=1, le=50),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """
+    The career paths the current user is closest to completing.
+
+    Scores every path in one pass over the requirement matrix; the result
+    is cached per user until their skills change.
+    """
+    matrix, levels, scores = await _user_scores(session, current_user.id)
+    best = heapq.nlargest(limit, range(len(matrix)), key=scores.__getitem__)
+    return respond([_progress(matrix, row, levels, scores[row]) for row in best])
+
+
+@router.get("/{path_id}", response_model=CareerPathResponse)
+async def get_career_path(
+    path_id: str,
+    session: AsyncSession = Depends(db.get_db),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """Get a specific career path."""
+    path = await career_crud.get_career_path(session, path_id)
+    if not path:
+        raise HTTPException(status_code=404, detail="Career path not found")
+    return respond(CareerPathResponse.model_validate(path))
+
+
+@router.get("/{path_id}/progress", response_model=CareerProgressResponse)
+async def get_career_progress(
+    path_id: str,
+    session: AsyncSession = Depends(db.get_db),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """Current user's progress on one career path."""
+    matrix, levels, scores = await _user_scores(session, current_user.id)
+    row = matrix.row_of(path_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Career path not found")
+    return respond(_progress(matrix, row, levels, scores[row]))
@@ -1,11 +1,14 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 import structlog
 
 from app.core import db
+from app.core.http_cache import conditional_get
+from app.core.serialization import respond, validate_many
 from app.api import deps
-from app.crud import course as course_crud, quiz as quiz_crud
+from app.crud import course as course_crud, skill_gap as skill_gap_crud
 from app.models.models import User, UserSkill, SkillGapRecord
 from app.schemas.course import CourseResponse, CourseList, RecommendedCourseResponse
 
@@ -13,7 +16,11 @@ router = APIRouter()
 logger = structlog.get_logger()
 
 
-@router.get("", response_model=CourseList)
+# [PERFORMANCE] Catalogue reads are polled far more than courses change
+COURSES_CACHE = Depends(conditional_get("courses", max_age=60, server_ttl=300))
+
+
+@router.get("", response_model=CourseList, dependencies=[COURSES_CACHE])
 async def list_courses(
     db: AsyncSession = Depends(db.get_db),
     skip: int = Query(0, ge=0),
@@ -23,14 +30,14 @@ async def list_courses(
 ):
     """Get list of available courses."""
     if difficulty:
-        courses = course_crud.get_courses_by_difficulty(db, difficulty)
+        courses = await course_crud.get_courses_by_difficulty(db, difficulty)
     else:
-        courses = course_crud.get_all_courses(db, skip, limit)
+        courses = await course_crud.get_all_courses(db, skip, limit)
     
-    return CourseList(
-        courses=[CourseResponse.from_orm(c) for c in courses],
+    return respond(CourseList(
+        courses=validate_many(CourseResponse, courses),
         total_count=len(courses)
-    )
+    ))
 
 
 @router.get("/recommendations", response_model=List[RecommendedCourseResponse])
@@ -41,14 +48,15 @@ async def get_recommended_courses(
     """Get AI-powered course recommendations based on skill gaps and user proficiency."""
     
     # Step 1: Get user's current skills
-    user_skills = db.query(UserSkill).filter(UserSkill.user_id == current_user.id).all()
+    user_skills_result = await db.execute(select(UserSkill).where(UserSkill.user_id == current_user.id))
+    user_skills = user_skills_result.scalars().all()
     user_skills_dict = {skill.skill_name: skill.proficiency for skill in user_skills}
     
     # Step 2: Identify skill gaps from quiz performance
-    skill_gaps = quiz_crud.identify_skill_gaps(db, current_user.id)
+    skill_gaps = await skill_gap_crud.get_skill_gaps(db, current_user.id)
     
     # Step 3: Get all available courses
-    all_courses = course_crud.get_all_courses(db, 0, 100)
+    all_courses = await course_crud.get_all_courses(db, 0, 100)
     
     recommendations = []
     
@@ -125,7 +133,7 @@ async def get_recommended_courses(
     for rec in sorted(recommendations, key=lambda x: x["relevance_score"], reverse=True):
         if rec["course"].id not in seen_course_ids:
             unique_recommendations.append(RecommendedCourseResponse(
-                course=CourseResponse.from_orm(rec["course"]),
+                course=CourseResponse.model_validate(rec["course"]),
                 relevance_score=rec["relevance_score"],
                 match_reason=rec["match_reason"]
             ))
@@ -138,31 +146,31 @@ async def get_recommended_courses(
         skill_gaps_count=len(skill_gaps)
     )
     
-    return unique_recommendations[:20]  # Return top 20 recommendations
+    return respond(unique_recommendations[:20])  # Return top 20 recommendations
 
 
-@router.get("/{course_id}", response_model=CourseResponse)
+@router.get("/{course_id}", response_model=CourseResponse, dependencies=[COURSES_CACHE])
 async def get_course(
     course_id: str,
     db: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get a specific course."""
-    course = course_crud.get_course(db, course_id)
+    course = await course_crud.get_course(db, course_id)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
-    return CourseResponse.from_orm(course)
+    return respond(CourseResponse.model_validate(course))
 
 
-@router.get("/by-skill/{skill_name}", response_model=CourseList)
+@router.get("/by-skill/{skill_name}", response_model=CourseList, dependencies=[COURSES_CACHE])
 async def get_courses_by_skill(
     skill_name: str,
     db: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get courses for a specific skill."""
-    courses = course_crud.get_courses_by_skill(db, skill_name)
-    return CourseList(
-        courses=[CourseResponse.from_orm(c) for c in courses],
+    courses = await course_crud.get_courses_by_skill(db, skill_name)
+    return respond(CourseList(
+        courses=validate_many(CourseResponse, courses),
         total_count=len(courses)
-    )
+    ))
@@ -0,0 +1,171 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+import structlog
+
+from app.core import db
+from app.core.context import RequestContext
+from app.core.serialization import respond, validate_many
+from app.api import deps
+from app.crud import (
+    achievement as achievement_crud,
+    course as course_crud,
+    mentorship as mentorship_crud,
+    notification as notification_crud,
+    project as project_crud,
+    skill_gap as skill_gap_crud,
+)
+from app.models.models import User, UserSkill
+from app.schemas.achievement import AchievementResponse
+from app.schemas.course import CourseResponse, RecommendedCourseResponse
+from app.schemas.dashboard import DashboardNotifications, DashboardResponse
+from app.schemas.mentorship import MentorshipResponse
+from app.schemas.notification import NotificationResponse
+from app.schemas.project import ProjectResponse
+from app.schemas.user import Skill, UserProfile
+
+router = APIRouter()
+logger = structlog.get_logger()
+
+# [TIMEOUT] Per-section budgets, capped by what is left of the request budget
+SECTION_BUDGETS_MS = {
+    "profile": 200,
+    "achievements": 150,
+    "projects": 150,
+    "recommendations": 300,
+    "mentors": 150,
+    "notifications": 150,
+}
+# [PERFORMANCE] Keep the payload compact: the dashboard only shows the top items
+SECTION_LIMIT = 5
+
+
+async def _profile_skills(session: AsyncSession, user_id: str) -> List[Skill]:
+    result = await session.execute(select(UserSkill).where(UserSkill.user_id == user_id))
+    return [
+        Skill(id=str(s.id), name=s.skill_name, level=s.proficiency, category="General")
+        for s in result.scalars().all()
+    ]
+
+
+async def _achievements(session: AsyncSession, user_id: str) -> List[AchievementResponse]:
+    achievements = await achievement_crud.get_user_achievements(session, user_id, limit=SECTION_LIMIT)
+    return validate_many(AchievementResponse, achievements)
+
+
+async def _projects(session: AsyncSession, user_id: str) -> List[ProjectResponse]:
+    projects = await project_crud.get_user_projects(session, user_id, limit=SECTION_LIMIT)
+    return validate_many(ProjectResponse, projects)
+
+
+async def _recommendations(session: AsyncSession, user_id: str) -> List[RecommendedCourseResponse]:
+    """Courses for the user's top skill gaps (a trimmed-down /courses/recommendations)."""
+    gaps = await skill_gap_crud.get_skill_gaps(session, user_id)
+    recommendations = {}
+    for gap in gaps[:3]:
+        courses = await course_crud.get_courses_by_skill_id(session, gap["skill_id"], limit=SECTION_LIMIT)
+        for course in courses:
+            if course.id in recommendations:
+                continue
+            gap_priority = 100 - (gap["gap_level"] * 5)
+            relevance = (gap_priority / 100) * 80 + (course.rating / 5) * 20
+            recommendations[course.id] = RecommendedCourseResponse(
+                course=CourseResponse.model_validate(course),
+                relevance_score=min(relevance, 100),
+                match_reason=f"Recommended to address gap in {gap['skill_name']}"
+            )
+    ranked = sorted(recommendations.values(), key=lambda r: r.relevance_score, reverse=True)
+    return ranked[:SECTION_LIMIT]
+
+
+async def _mentors(session: AsyncSession, user_id: str) -> List[MentorshipResponse]:
+    mentorships = await mentorship_crud.get_mentorships_for_user(session, user_id, as_mentee=True)
+    return validate_many(MentorshipResponse, mentorships[:SECTION_LIMIT])
+
+
+async def _notifications(session: AsyncSession, user_id: str) -> DashboardNotifications:
+    recent = await notification_crud.get_user_notifications(session, user_id, 0, SECTION_LIMIT)
+    unread = await notification_crud.get_unread_count(session, user_id)
+    return DashboardNotifications(
+        recent=validate_many(NotificationResponse, recent),
+        unread_count=unread
+    )
+
+
+SECTIONS: Dict[str, Callable[[AsyncSession, str], Awaitable[Any]]] = {
+    "profile": _profile_skills,
+    "achievements": _achievements,
+    "projects": _projects,
+    "recommendations": _recommendations,
+    "mentors": _mentors,
+    "notifications": _notifications,
+}
+
+
+async def _load_section(name: str, user_id: str, ctx: RequestContext) -> Any:
+    """
+    Run one section on its own session so sections execute concurrently.
+    Raises on failure or timeout; the caller decides how to degrade.
+    """
+    async def run():
+        async with db.AsyncSessionLocal() as session:
+            return await SECTIONS[name](session, user_id)
+
+    return await asyncio.wait_for(run(), timeout=ctx.budget(SECTION_BUDGETS_MS[name]))
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    ctx: RequestContext = Depends(deps.get_request_context),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """
+    Aggregated dashboard: profile, achievements, projects, course
+    recommendations, mentors and notifications.
+
+    Authenticates once, then fans the independent reads out concurrently.
+    A section that errors or exceeds its budget is returned empty and
+    listed in `degraded_sections` instead of failing the whole page.
+    """
+    names = list(SECTIONS)
+    results = await asyncio.gather(
+        *(_load_section(name, current_user.id, ctx) for name in names),
+        return_exceptions=True
+    )
+
+    sections: Dict[str, Any] = {}
+    degraded: List[str] = []
+    for name, result in zip(names, results):
+        if isinstance(result, BaseException):
+            degraded.append(name)
+            logger.warning(
+                "dashboard.section_degraded",
+                section=name,
+                reason="timeout" if isinstance(result, asyncio.TimeoutError) else type(result).__name__,
+                **ctx.log_kwargs()
+            )
+        else:
+            sections[name] = result
+
+    profile = UserProfile(
+        id=current_user.id,
+        email=current_user.email,
+        full_name=current_user.full_name or "",
+        title=current_user.title,
+        skills=sections.get("profile", []),
+        is_partial_data="profile" in degraded,
+        details="Skills could not be loaded" if "profile" in degraded else None
+    )
+
+    return respond(DashboardResponse(
+        profile=profile,
+        achievements=sections.get("achievements", []),
+        projects=sections.get("projects", []),
+        recommendations=sections.get("recommendations", []),
+        mentors=sections.get("mentors", []),
+        notifications=sections.get("notifications", DashboardNotifications()),
+        is_partial_data=bool(degraded),
+        degraded_sections=degraded
+    ))
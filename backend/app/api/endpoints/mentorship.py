@@ -1,11 +1,14 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from app.core import db
+from app.core.serialization import respond, validate_many
+from app.core.achievements import achievement_counters, publish
 from app.api import deps
 from app.crud import mentorship as mentorship_crud
+from app.crud.writers import write_achievement_counters
 from app.models.models import User
 from app.schemas.mentorship import (
     MentorshipCreate, MentorshipResponse, MentorshipList, 
@@ -17,45 +20,47 @@ logger = structlog.get_logger()
 
 
 @router.get("/mentees", response_model=MentorshipList)
-def get_my_mentees(
-    session: Session = Depends(db.get_db),
+async def get_my_mentees(
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get all mentees for current mentor."""
-    mentorships = mentorship_crud.get_mentorships_for_user(session, current_user.id, as_mentee=False)
-    return MentorshipList(
-        mentorships=[MentorshipResponse.from_orm(m) for m in mentorships],
+    mentorships = await mentorship_crud.get_mentorships_for_user(session, current_user.id, as_mentee=False)
+    return respond(MentorshipList(
+        mentorships=validate_many(MentorshipResponse, mentorships),
         total_count=len(mentorships)
-    )
+    ))
 
 
 @router.get("/mentors", response_model=MentorshipList)
-def get_my_mentors(
-    session: Session = Depends(db.get_db),
+async def get_my_mentors(
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get all mentors for current mentee."""
-    mentorships = mentorship_crud.get_mentorships_for_user(session, current_user.id, as_mentee=True)
-    return MentorshipList(
-        mentorships=[MentorshipResponse.from_orm(m) for m in mentorships],
+    mentorships = await mentorship_crud.get_mentorships_for_user(session, current_user.id, as_mentee=True)
+    return respond(MentorshipList(
+        mentorships=validate_many(MentorshipResponse, mentorships),
         total_count=len(mentorships)
-    )
+    ))
 
 
 @router.get("/available-mentors", response_model=List[MentorAvailableResponse])
-def get_available_mentors(
+async def get_available_mentors(
     skill_focus: str = Query(...),
-    session: Session = Depends(db.get_db),
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Find available mentors for a specific skill."""
-    mentors = mentorship_crud.get_available_mentors(session, skill_focus)
+    mentors = await mentorship_crud.get_available_mentors(session, skill_focus)
+    # [PERFORMANCE] One grouped count instead of a query per mentor
+    mentee_counts = await mentorship_crud.get_mentee_counts(session, [m.id for m in mentors])
     mentor_responses = []
     
     for mentor in mentors:
         if mentor.id != current_user.id:
             expertise = [s.skill_name for s in mentor.skills]
-            mentee_count = len(mentorship_crud.get_mentorships_for_user(session, mentor.id, as_mentee=False))
+            mentee_count = mentee_counts.get(mentor.id, 0)
             
             mentor_responses.append(MentorAvailableResponse(
                 id=mentor.id,
@@ -71,17 +76,17 @@ def get_available_mentors(
 
 
 @router.post("", response_model=MentorshipResponse, status_code=201)
-def create_mentorship(
+async def create_mentorship(
     mentorship_in: MentorshipCreate,
-    session: Session = Depends(db.get_db),
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Request mentorship from a mentor."""
-    mentor = session.query(User).filter(User.id == mentorship_in.mentor_id).first()
+    mentor = await session.get(User, mentorship_in.mentor_id)
     if not mentor:
         raise HTTPException(status_code=404, detail="Mentor not found")
     
-    mentorship = mentorship_crud.create_mentorship(
+    mentorship = await mentorship_crud.create_mentorship(
         session,
         mentor_id=mentorship_in.mentor_id,
         mentee_id=current_user.id,
@@ -93,13 +98,13 @@ def create_mentorship(
 
 
 @router.get("/{mentorship_id}", response_model=MentorshipResponse)
-def get_mentorship(
+async def get_mentorship(
     mentorship_id: str,
-    session: Session = Depends(db.get_db),
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get mentorship details."""
-    mentorship = mentorship_crud.get_mentorship(session, mentorship_id)
+    mentorship = await mentorship_crud.get_mentorship(session, mentorship_id)
     if not mentorship:
         raise HTTPException(status_code=404, detail="Mentorship not found")
     
@@ -110,38 +115,42 @@ def get_mentorship(
 
 
 @router.patch("/{mentorship_id}", response_model=MentorshipResponse)
-def update_mentorship(
+async def update_mentorship(
     mentorship_id: str,
     mentorship_in: MentorshipUpdate,
-    session: Session = Depends(db.get_db),
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Update mentorship status."""
-    mentorship = mentorship_crud.get_mentorship(session, mentorship_id)
+    mentorship = await mentorship_crud.get_mentorship(session, mentorship_id)
     if not mentorship:
         raise HTTPException(status_code=404, detail="Mentorship not found")
     
     if mentorship.mentor_id != current_user.id:
         raise HTTPException(status_code=403, detail="Only mentor can update status")
     
-    updated = mentorship_crud.update_mentorship_status(session, mentorship_id, mentorship_in.status)
+    previous_status = mentorship.status
+    updated = await mentorship_crud.update_mentorship_status(session, mentorship_id, mentorship_in.status)
     logger.info("mentorship.updated", mentorship_id=mentorship_id, status=mentorship_in.status)
+    if mentorship_in.status == "completed" and previous_status != "completed":
+        publish("mentorship.completed", mentor_id=updated.mentor_id, mentee_id=updated.mentee_id)
+        await achievement_counters.flush_if_due(write_achievement_counters)
     return MentorshipResponse.from_orm(updated)
 
 
 @router.delete("/{mentorship_id}", status_code=204)
-def cancel_mentorship(
+async def cancel_mentorship(
     mentorship_id: str,
-    session: Session = Depends(db.get_db),
+    session: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
     """Cancel a mentorship."""
-    mentorship = mentorship_crud.get_mentorship(session, mentorship_id)
+    mentorship = await mentorship_crud.get_mentorship(session, mentorship_id)
     if not mentorship:
         raise HTTPException(status_code=404, detail="Mentorship not found")
     
     if mentorship.mentor_id != current_user.id and mentorship.mentee_id != current_user.id:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    mentorship_crud.delete_mentorship(session, mentorship_id)
+    await mentorship_crud.delete_mentorship(session, mentorship_id)
     logger.info("mentorship.cancelled", mentorship_id=mentorship_id)
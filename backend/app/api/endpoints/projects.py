@@ -1,11 +1,14 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from app.core import db
+from app.core.serialization import respond, validate_many
+from app.core.counters import endorsement_counts
+from app.core.achievements import achievement_counters, publish
 from app.api import deps
-from app.crud import project as project_crud
+from app.crud import endorsement as endorsement_crud, project as project_crud
+from app.crud.writers import write_achievement_counters, write_endorsement_counts
 from app.models.models import User
 from app.schemas.project import ProjectResponse, ProjectCreate, ProjectUpdate, ProjectList
 
@@ -19,11 +22,11 @@ async def get_my_projects(
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get all projects for current user."""
-    projects = project_crud.get_user_projects(db, current_user.id)
-    return ProjectList(
-        projects=[ProjectResponse.from_orm(p) for p in projects],
+    projects = await project_crud.get_user_projects(db, current_user.id)
+    return respond(ProjectList(
+        projects=validate_many(ProjectResponse, projects),
         total_count=len(projects)
-    )
+    ))
 
 
 @router.post("", response_model=ProjectResponse, status_code=201)
@@ -33,7 +36,7 @@ async def create_project(
     current_user: User = Depends(deps.get_current_user)
 ):
     """Create a new project in portfolio."""
-    project = project_crud.create_project(
+    project = await project_crud.create_project(
         db,
         user_id=current_user.id,
         title=project_in.title,
@@ -45,6 +48,8 @@ async def create_project(
         start_date=project_in.start_date
     )
     logger.info("project.created", user_id=current_user.id, project_id=project.id)
+    publish("project.created", user_id=current_user.id)
+    await achievement_counters.flush_if_due(write_achievement_counters)
     return ProjectResponse.from_orm(project)
 
 
@@ -55,7 +60,7 @@ async def get_project(
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get a specific project."""
-    project = project_crud.get_project(db, project_id)
+    project = await project_crud.get_project(db, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return ProjectResponse.from_orm(project)
@@ -69,14 +74,14 @@ async def update_project(
     current_user: User = Depends(deps.get_current_user)
 ):
     """Update a project."""
-    project = project_crud.get_project(db, project_id)
+    project = await project_crud.get_project(db, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     if project.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Access denied")
     
     update_data = project_in.dict(exclude_unset=True)
-    updated_project = project_crud.update_project(db, project_id, **update_data)
+    updated_project = await project_crud.update_project(db, project_id, **update_data)
     logger.info("project.updated", project_id=project_id)
     return ProjectResponse.from_orm(updated_project)
 
@@ -88,13 +93,13 @@ async def delete_project(
     current_user: User = Depends(deps.get_current_user)
 ):
     """Delete a project."""
-    project = project_crud.get_project(db, project_id)
+    project = await project_crud.get_project(db, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     if project.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Access denied")
     
-    project_crud.delete_project(db, project_id)
+    await project_crud.delete_project(db, project_id)
     logger.info("project.deleted", project_id=project_id)
 
 
@@ -104,9 +109,23 @@ async def endorse_project(
     db: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
-    """Endorse a project (increment endorsement count)."""
-    project = project_crud.increment_endorsements(db, project_id)
+    """
+    Endorse a project, at most once per user (repeats are a no-op).
+
+    The count is not read-modified-written: the increment goes to a
+    coalescing buffer flushed as `endorsement_count = endorsement_count + n`,
+    and the response includes this worker's unflushed increments.
+    """
+    project = await project_crud.get_project(db, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    logger.info("project.endorsed", project_id=project_id, endorser_id=current_user.id)
-    return ProjectResponse.from_orm(project)
+    response = ProjectResponse.model_validate(project)
+
+    if await endorsement_crud.add_endorsement(db, project_id, current_user.id):
+        endorsement_counts.add(project_id)
+        publish("project.endorsed", owner_id=response.user_id)
+        logger.info("project.endorsed", project_id=project_id, endorser_id=current_user.id)
+    response.endorsement_count += endorsement_counts.pending(project_id)
+    await endorsement_counts.flush_if_due(write_endorsement_counts)
+    await achievement_counters.flush_if_due(write_achievement_counters)
+    return respond(response)
@@ -1,278 +1,41 @@
-import uuid
-import random
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Dict, Optional, Tuple
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
+from pydantic_core import to_json
 
 from app.core import db
+from app.core.serialization import respond, respond_spliced
+from app.core.question_bank import bank_skill, question_bank
+from app.core.quiz_assembly import assemble_quiz, build_questions
+from app.core.quiz_pool import quiz_pool
+from app.core.quiz_sessions import QuizSession, quiz_sessions
+from app.core.achievements import achievement_counters, publish
+from app.core.answer_buffer import FLUSH_BATCH, answer_buffer, graded_answers, timed_entries
+from app.core.irt import (
+    MIN_QUESTIONS, TARGET_STANDARD_ERROR, AbilityEstimate, Item, expected_score, item_bank, next_item,
+)
 from app.api import deps
-from app.crud import quiz as quiz_crud
-from app.models.models import User, UserSkill
+from app.crud import (
+    question_calibration as calibration_crud, quiz as quiz_crud, skill as skill_crud,
+    skill_gap as skill_gap_crud,
+)
+from app.crud.writers import write_achievement_counters, write_answer_log
+from app.models.models import Quiz, User
 from app.schemas.quiz import (
-    QuizCreate, QuizResponse, QuizQuestion, QuizAnswerSubmission,
-    QuizResult, SkillGap, SkillGapAnalysis, QuizStats, QuizScore
+    QuizCreate, QuizResponse, QuizAnswerSubmission, QuizAnswerProgress,
+    QuizResult, SkillGap, SkillGapAnalysis, QuizStats, QuizScore, AdaptiveQuizCreate, AdaptiveQuizState
 )
 
 router = APIRouter()
 logger = structlog.get_logger()
 
-# [MOCK] Question Bank - In production, this would be in database
-QUESTION_BANK = {
-    "Python": {
-        "Beginner": [
-            {
-                "id": "q_py_b_1",
-                "text": "What is the output of print(2 ** 3)?",
-                "options": ["6", "8", "9", "5"],
-                "correct": 1,
-                "topic": "Basic Operations"
-            },
-            {
-                "id": "q_py_b_2",
-                "text": "Which of the following is a valid variable name in Python?",
-                "options": ["2var", "var-name", "var_name", "var name"],
-                "correct": 2,
-                "topic": "Variables"
-            },
-            {
-                "id": "q_py_b_3",
-                "text": "What is the result of 'hello'.upper()?",
-                "options": ["hello", "HELLO", "'HELLO'", "Error"],
-                "correct": 1,
-                "topic": "String Methods"
-            },
-            {
-                "id": "q_py_b_4",
-                "text": "What does len([1, 2, 3, 4]) return?",
-                "options": ["3", "4", "5", "Error"],
-                "correct": 1,
-                "topic": "Lists"
-            },
-            {
-                "id": "q_py_b_5",
-                "text": "Which keyword is used to create a function in Python?",
-                "options": ["function", "def", "define", "func"],
-                "correct": 1,
-                "topic": "Functions"
-            },
-            {
-                "id": "q_py_b_6",
-                "text": "What type is the value None in Python?",
-                "options": ["NoneType", "Null", "Zero", "Empty"],
-                "correct": 0,
-                "topic": "Data Types"
-            },
-            {
-                "id": "q_py_b_7",
-                "text": "How do you create a dictionary in Python?",
-                "options": ["{}", "[]", "()", "{}with keys"],
-                "correct": 0,
-                "topic": "Dictionaries"
-            },
-            {
-                "id": "q_py_b_8",
-                "text": "What is the output of list(range(3))?",
-                "options": ["[1, 2, 3]", "[0, 1, 2]", "[0, 1, 2, 3]", "[3]"],
-                "correct": 1,
-                "topic": "Loops"
-            },
-        ],
-        "Intermediate": [
-            {
-                "id": "q_py_i_1",
-                "text": "What is the purpose of *args in a function?",
-                "options": ["Fixed arguments", "Variable length argument list", "Keyword arguments", "Default arguments"],
-                "correct": 1,
-                "topic": "Function Arguments"
-            },
-            {
-                "id": "q_py_i_2",
-                "text": "What does a list comprehension do?",
-                "options": ["Compresses lists", "Creates a list in a concise way", "Copies lists", "Sorts lists"],
-                "correct": 1,
-                "topic": "List Comprehensions"
-            },
-            {
-                "id": "q_py_i_3",
-                "text": "What is the output of [i for i in range(3)]?",
-                "options": ["[1, 2, 3]", "[0, 1, 2]", "[0, 1, 2, 3]", "Error"],
-                "correct": 1,
-                "topic": "List Comprehensions"
-            },
-            {
-                "id": "q_py_i_4",
-                "text": "Which statement creates an iterator object in Python?",
-                "options": ["iter()", "iterator()", "next()", "iterate()"],
-                "correct": 0,
-                "topic": "Iterators"
-            },
-            {
-                "id": "q_py_i_5",
-                "text": "What does the 'with' statement do?",
-                "options": ["Creates scope", "Manages resources", "Imports modules", "Defines classes"],
-                "correct": 1,
-                "topic": "Context Managers"
-            },
-        ],
-        "Advanced": [
-            {
-                "id": "q_py_a_1",
-                "text": "What is a metaclass in Python?",
-                "options": ["A subclass of a class", "A class whose instances are classes", "A superclass", "An abstract class"],
-                "correct": 1,
-                "topic": "Metaclasses"
-            },
-            {
-                "id": "q_py_a_2",
-                "text": "What is the GIL in Python?",
-                "options": ["Global Interface Language", "Global Interpreter Lock", "Global Iteration Library", "Global Integer Limit"],
-                "correct": 1,
-                "topic": "Threading"
-            },
-            {
-                "id": "q_py_a_3",
-                "text": "How does Python's garbage collection work?",
-                "options": ["Manual cleanup", "Reference counting", "Mark and sweep", "Both B and C"],
-                "correct": 3,
-                "topic": "Memory Management"
-            },
-        ],
-    },
-    "Data Science": {
-        "Beginner": [
-            {
-                "id": "q_ds_b_1",
-                "text": "What does 'DataFrame' refer to in Pandas?",
-                "options": ["A picture frame", "A 2D labeled data structure", "A reference frame", "A data frame rate"],
-                "correct": 1,
-                "topic": "Pandas"
-            },
-            {
-                "id": "q_ds_b_2",
-                "text": "What is NumPy primarily used for?",
-                "options": ["Numerical computing", "Web development", "GUI design", "Database management"],
-                "correct": 0,
-                "topic": "NumPy"
-            },
-        ],
-        "Intermediate": [
-            {
-                "id": "q_ds_i_1",
-                "text": "What is cross-validation used for?",
-                "options": ["Data cleaning", "Model evaluation", "Feature scaling", "Data augmentation"],
-                "correct": 1,
-                "topic": "Model Evaluation"
-            },
-        ],
-        "Advanced": [
-            {
-                "id": "q_ds_a_1",
-                "text": "What is the difference between bias and variance?",
-                "options": ["Bias is good, variance is bad", "They are the same", "Bias-variance tradeoff in model complexity", "Bias is for regression, variance is for classification"],
-                "correct": 2,
-                "topic": "Model Selection"
-            },
-        ],
-    },
-    "JavaScript": {
-        "Beginner": [
-            {
-                "id": "q_js_b_1",
-                "text": "What does 'DOM' stand for?",
-                "options": ["Document Object Model", "Display Object Module", "Data Organization Method", "Digital Output Manager"],
-                "correct": 0,
-                "topic": "DOM"
-            },
-            {
-                "id": "q_js_b_2",
-                "text": "How do you declare a variable in modern JavaScript?",
-                "options": ["var", "let", "const", "All of the above"],
-                "correct": 3,
-                "topic": "Variables"
-            },
-        ],
-        "Intermediate": [
-            {
-                "id": "q_js_i_1",
-                "text": "What are Promises in JavaScript?",
-                "options": ["Variables that promise values", "Objects for asynchronous operations", "Guarantees about code execution", "Future values"],
-                "correct": 1,
-                "topic": "Async Programming"
-            },
-        ],
-    },
-    "Web Development": {
-        "Beginner": [
-            {
-                "id": "q_web_b_1",
-                "text": "What does HTML stand for?",
-                "options": ["Hyper Text Markup Language", "High Tech Modern Language", "Home Tool Markup Language", "Hyperlinks and Text Markup Language"],
-                "correct": 0,
-                "topic": "HTML Basics"
-            },
-        ],
-    },
-    "Machine Learning": {
-        "Beginner": [
-            {
-                "id": "q_ml_b_1",
-                "text": "What is supervised learning?",
-                "options": ["Learning with a teacher", "Learning with labeled data", "Learning without data", "Learning in groups"],
-                "correct": 1,
-                "topic": "ML Basics"
-            },
-        ],
-    }
-}
-
-
-def get_questions_for_skill(skill_name: str, difficulty: str, count: int) -> List[Dict]:
-    """Get questions from question bank for a skill and difficulty."""
-    if skill_name not in QUESTION_BANK:
-        # If skill not in bank, return general questions
-        return _generate_generic_questions(skill_name, difficulty, count)
-    
-    if difficulty not in QUESTION_BANK[skill_name]:
-        return _generate_generic_questions(skill_name, difficulty, count)
-    
-    available = QUESTION_BANK[skill_name][difficulty]
-    selected = random.sample(available, min(count, len(available)))
-    
-    return selected
-
-
-def _generate_generic_questions(skill_name: str, difficulty: str, count: int) -> List[Dict]:
-    """Generate generic questions for skills not in database."""
-    difficulty_map = {
-        "Beginner": "fundamental",
-        "Intermediate": "practical",
-        "Advanced": "expert"
-    }
-    
-    topics_map = {
-        "Beginner": ["Basics", "Introduction", "Fundamentals", "Getting Started"],
-        "Intermediate": ["Practical Application", "Problem Solving", "Implementation", "Design Patterns"],
-        "Advanced": ["Expert Level", "System Design", "Optimization", "Architecture"]
-    }
-    
-    questions = []
-    for i in range(count):
-        questions.append({
-            "id": f"q_generic_{uuid.uuid4().hex[:8]}",
-            "text": f"In {skill_name} at {difficulty} level, what is the best practice for topic {i+1}?",
-            "options": [
-                f"Best practice for {skill_name} concept A",
-                f"Best practice for {skill_name} concept B",
-                f"Best practice for {skill_name} concept C",
-                f"Best practice for {skill_name} concept D"
-            ],
-            "correct": random.randint(0, 3),
-            "topic": topics_map.get(difficulty, ["General"])[0]
-        })
-    
-    return questions
+# difficulty_level of adaptive quizzes: questions span every level of the bank
+ADAPTIVE = "Adaptive"
+# Answers accepted per /answers request
+MAX_ANSWER_BATCH = 10
 
 
 @router.post("/generate", response_model=QuizResponse)
@@ -281,56 +44,35 @@ async def generate_quiz(
     db: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
-    """Generate a new quiz based on skill and difficulty."""
+    """
+    Generate a new quiz based on skill and difficulty.
+
+    Questions come pre-sampled and pre-serialized from the quiz pool, so the
+    request only inserts the quiz row.
+    """
     
     # Validate skill name
     if not config.skill_name:
         raise HTTPException(status_code=400, detail="Skill name is required")
     
-    # Get questions
-    questions_list = get_questions_for_skill(
-        config.skill_name,
-        config.difficulty_level,
-        config.question_count
-    )
+    # [PERFORMANCE] O(1) claim; assembled inline only when the pool is empty.
+    # Any spelling of a bank skill shares the pool kept under the bank's spelling
+    key = (bank_skill(config.skill_name) or config.skill_name, config.difficulty_level, config.question_count)
+    pooled = quiz_pool.claim(key) or assemble_quiz(key)
     
-    if not questions_list:
+    if pooled is None:
         raise HTTPException(status_code=404, detail="No questions available for this skill")
     
-    # Create quiz in database
-    questions_data = {
-        "questions": [
-            {
-                "id": q["id"],
-                "text": q["text"],
-                "options": q["options"],
-                "topic": q.get("topic", "General")
-            }
-            for q in questions_list
-        ]
-    }
-    
     quiz = await quiz_crud.create_quiz(
         db,
         user_id=current_user.id,
         skill_name=config.skill_name,
         difficulty_level=config.difficulty_level,
         question_count=config.question_count,
-        questions_data=questions_data
+        questions_data=pooled.questions_data
     )
     
-    # Convert to response format
-    questions = [
-        QuizQuestion(
-            id=q["id"],
-            text=q["text"],
-            options=q["options"],
-            difficulty_level=config.difficulty_level,
-            skill_tested=config.skill_name,
-            topic=q.get("topic", "General")
-        )
-        for q in questions_list
-    ]
+    quiz_sessions.put(_session_of(quiz, pooled.questions_json))
     
     logger.info(
         "quiz_generated",
@@ -339,15 +81,65 @@ async def generate_quiz(
         difficulty=config.difficulty_level
     )
     
-    return QuizResponse(
+    return respond_spliced(QuizResponse(
         id=quiz.id,
         skill_name=quiz.skill_name,
         difficulty_level=quiz.difficulty_level,
         title=quiz.title,
         status=quiz.status,
         question_count=quiz.question_count,
-        created_at=quiz.created_at,
-        questions=questions
+        created_at=quiz.created_at
+    ), questions=pooled.questions_json)
+
+
+def _answer_key(quiz: Quiz) -> Dict[str, int]:
+    """{question id: correct option} for the quiz's own questions, from the bank."""
+    correct = {
+        q["id"]: q["correct"]
+        for q in question_bank().get(bank_skill(quiz.skill_name), {}).get(quiz.difficulty_level, [])
+    }
+    return {
+        q["id"]: correct[q["id"]]
+        for q in (quiz.questions_data or {}).get("questions", []) if q["id"] in correct
+    }
+
+
+def _session_of(quiz: Quiz, questions_json: Optional[bytes] = None) -> QuizSession:
+    return QuizSession.from_row(quiz, _answer_key(quiz), questions_json)
+
+
+async def _get_session(db: AsyncSession, quiz_id: str) -> Optional[QuizSession]:
+    """The quiz from the session cache, or read from the database and cached."""
+    session = quiz_sessions.get(quiz_id)
+    if session is None:
+        quiz = await quiz_crud.get_quiz(db, quiz_id)
+        if quiz is None:
+            return None
+        session = quiz_sessions.put(_session_of(quiz))
+    return session
+
+
+def _questions_json(session: QuizSession) -> bytes:
+    """The session's rendered questions, built once per cached session."""
+    if session.questions_json is None:
+        questions = build_questions(list(session.questions), session.difficulty_level, session.skill_name)
+        session = replace(session, questions_json=to_json(questions))
+        if quiz_sessions.get(session.id) is not None:
+            quiz_sessions.put(session)
+    return session.questions_json
+
+
+def _session_response(session: QuizSession) -> QuizResponse:
+    return QuizResponse(
+        id=session.id,
+        skill_name=session.skill_name,
+        difficulty_level=session.difficulty_level,
+        title=session.title,
+        status=session.status,
+        question_count=session.question_count,
+        created_at=session.created_at,
+        started_at=session.started_at,
+        completed_at=session.completed_at
     )
 
 
@@ -358,76 +150,171 @@ async def start_quiz(
     current_user: User = Depends(deps.get_current_user)
 ):
     """Start a quiz session."""
-    quiz = await quiz_crud.get_quiz(db, quiz_id)
+    session = await _get_session(db, quiz_id)
     
-    if not quiz:
+    if not session:
         raise HTTPException(status_code=404, detail="Quiz not found")
     
-    if quiz.user_id != current_user.id:
+    if session.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to start this quiz")
     
-    quiz = await quiz_crud.start_quiz(db, quiz_id)
-    
-    # Reconstruct questions for response
-    questions = []
-    if quiz.questions_data and "questions" in quiz.questions_data:
-        for q in quiz.questions_data["questions"]:
-            questions.append(QuizQuestion(
-                id=q["id"],
-                text=q["text"],
-                options=q["options"],
-                difficulty_level=quiz.difficulty_level,
-                skill_tested=quiz.skill_name,
-                topic=q.get("topic", "General")
-            ))
+    started_at = datetime.utcnow()
+    if not await quiz_crud.start_quiz(db, quiz_id, started_at):
+        quiz_sessions.evict(quiz_id)
+        raise HTTPException(status_code=409, detail="Quiz already submitted")
+    session = quiz_sessions.put(replace(session, status="in_progress", started_at=started_at))
     
     logger.info("quiz_started", quiz_id=quiz_id, user_id=current_user.id)
     
-    return QuizResponse(
-        id=quiz.id,
+    return respond_spliced(_session_response(session), questions=_questions_json(session))
+
+
+@router.post("/{quiz_id}/answers", response_model=QuizAnswerProgress)
+async def record_answers(
+    quiz_id: str,
+    answers: List[QuizAnswerSubmission],
+    db: AsyncSession = Depends(db.get_db),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """
+    Record answers as they are given, one or a few at a time, with the time
+    spent on each. Answers are buffered and written to the quiz in batches;
+    /submit then only finalises. Re-answering a question replaces the answer.
+    """
+    if not answers or len(answers) > MAX_ANSWER_BATCH:
+        raise HTTPException(status_code=400, detail=f"Send between 1 and {MAX_ANSWER_BATCH} answers")
+
+    session = answer_buffer.get(quiz_id)
+    if session is None:
+        quiz = await quiz_crud.get_quiz(db, quiz_id)
+        if not quiz:
+            raise HTTPException(status_code=404, detail="Quiz not found")
+        if quiz.user_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to answer this quiz")
+        if quiz.difficulty_level == ADAPTIVE:
+            raise HTTPException(status_code=400, detail="Adaptive quizzes are answered one question at a time")
+        if quiz.status == "completed":
+            raise HTTPException(status_code=409, detail="Quiz already submitted")
+        if quiz.started_at is None:
+            raise HTTPException(status_code=409, detail="Start the quiz first")
+        session = answer_buffer.open(quiz)
+    elif session.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to answer this quiz")
+
+    unknown = [a.question_id for a in answers if a.question_id not in session.question_ids]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Questions not in this quiz: {', '.join(unknown)}")
+
+    answer_buffer.append(session, [(a.question_id, a.selected_option_index, a.time_spent_ms) for a in answers])
+    if session.pending >= FLUSH_BATCH:
+        await answer_buffer.flush(session, write_answer_log)
+
+    return QuizAnswerProgress(quiz_id=quiz_id, answered=len(session.answered), question_count=session.question_count)
+
+
+def _performance(score_percentage: float) -> Tuple[str, List[str], List[str]]:
+    """(performance level, strength areas, weak areas) for a score."""
+    if score_percentage >= 80:
+        return "Excellent", ["Most topics", "Key concepts", "Practical application"], []
+    if score_percentage >= 60:
+        return "Good", ["Core concepts", "Basic understanding"], ["Advanced topics", "Edge cases"]
+    if score_percentage >= 40:
+        return "Needs Improvement", ["Basic understanding"], ["Core concepts", "Practical application", "Advanced topics"]
+    return "Review Required", [], ["All major topics", "Fundamentals", "Core concepts"]
+
+
+def _next_steps(score_percentage: float) -> List[str]:
+    if score_percentage >= 80:
+        return [
+            "Try the next difficulty level",
+            "Take another quiz on a different skill",
+            "Work on a project using this skill"
+        ]
+    if score_percentage >= 60:
+        return [
+            "Review weak areas",
+            "Take practice quiz again",
+            "Study recommended resources"
+        ]
+    return [
+        "Review fundamentals carefully",
+        "Take beginner level quiz first",
+        "Seek mentorship on this skill"
+    ]
+
+
+def _quiz_result(quiz: Quiz) -> QuizResult:
+    """Result of a completed quiz, rebuilt from what submission stored."""
+    performance_data = quiz.performance_data or {}
+    score_percentage = quiz.score or 0
+    weak_areas = performance_data.get("weak_areas", [])
+    return QuizResult(
+        quiz_id=quiz.id,
         skill_name=quiz.skill_name,
         difficulty_level=quiz.difficulty_level,
-        title=quiz.title,
-        status=quiz.status,
-        question_count=quiz.question_count,
-        created_at=quiz.created_at,
-        started_at=quiz.started_at,
-        questions=questions
+        score=score_percentage,
+        passed=score_percentage >= 70,
+        total_questions=quiz.question_count,
+        correct_answers=quiz.correct_answers or 0,
+        incorrect_answers=quiz.question_count - (quiz.correct_answers or 0),
+        time_taken_seconds=quiz.time_taken_seconds or 0,
+        performance_summary=performance_data.get("performance_level", ""),
+        strength_areas=performance_data.get("strength_areas", []),
+        weak_areas=weak_areas,
+        # Recommended topics based on weak areas
+        recommended_topics=weak_areas if weak_areas else ["Review fundamentals"],
+        next_steps=_next_steps(score_percentage)
     )
 
 
 @router.post("/{quiz_id}/submit", response_model=QuizResult)
 async def submit_quiz(
     quiz_id: str,
-    answers: List[QuizAnswerSubmission],
+    answers: List[QuizAnswerSubmission] = Body(default=[]),
     db: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
-    """Submit quiz answers and get results."""
-    quiz = await quiz_crud.get_quiz(db, quiz_id)
+    """
+    Submit quiz answers and get results.
+
+    Grades the answers recorded through /answers plus any in the body. One
+    read (quiz, gap row and proficiency) and one commit. Submitting an
+    already completed quiz returns the stored result instead of re-grading.
+    """
+    buffered = answer_buffer.get(quiz_id)
+    if buffered is not None and buffered.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to submit this quiz")
+    # Detached first, so the row read below already holds everything the buffer wrote
+    buffered = await answer_buffer.detach(quiz_id)
+    submission = await quiz_crud.get_quiz_for_submission(db, quiz_id)
     
-    if not quiz:
+    if not submission:
         raise HTTPException(status_code=404, detail="Quiz not found")
+    quiz = submission.quiz
     
     if quiz.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to submit this quiz")
-    
-    # Calculate score
-    correct_count = 0
-    answers_dict = {}
-    
-    if quiz.questions_data and "questions" in quiz.questions_data:
-        questions = quiz.questions_data["questions"]
-        
-        for answer in answers:
-            # Find the correct answer
-            question = next((q for q in QUESTION_BANK.get(quiz.skill_name, {}).get(quiz.difficulty_level, [])
-                           if q["id"] == answer.question_id), None)
-            
-            answers_dict[answer.question_id] = answer.selected_option_index
-            
-            if question and question["correct"] == answer.selected_option_index:
-                correct_count += 1
+    if quiz.difficulty_level == ADAPTIVE:
+        raise HTTPException(status_code=400, detail="Adaptive quizzes are answered one question at a time")
+
+    if quiz.status == "completed":
+        return _quiz_result(quiz)
+    
+    # [PERFORMANCE] Usually everything arrived through /answers: this is only finalisation
+    log = list(quiz.answer_log or [])
+    if buffered is not None:
+        log += buffered.log[buffered.persisted:]
+    log += timed_entries(
+        [(a.question_id, a.selected_option_index, a.time_spent_ms) for a in answers],
+        quiz.started_at,
+        sum(entry[2] or 0 for entry in log)
+    )
+    answers_dict, _ = graded_answers(log)
+
+    # Calculate score: the cached session already holds the answer key
+    cached = quiz_sessions.get(quiz_id)
+    answer_key = cached.answer_key if cached is not None else _answer_key(quiz)
+    correct_count = sum(1 for question_id, option in answers_dict.items() if answer_key.get(question_id) == option)
     
     # Calculate time taken
     time_taken = 0
@@ -437,22 +324,7 @@ async def submit_quiz(
     # Determine performance level
     score_percentage = (correct_count / quiz.question_count * 100) if quiz.question_count > 0 else 0
     
-    if score_percentage >= 80:
-        performance = "Excellent"
-        strength_areas = ["Most topics", "Key concepts", "Practical application"]
-        weak_areas = []
-    elif score_percentage >= 60:
-        performance = "Good"
-        strength_areas = ["Core concepts", "Basic understanding"]
-        weak_areas = ["Advanced topics", "Edge cases"]
-    elif score_percentage >= 40:
-        performance = "Needs Improvement"
-        strength_areas = ["Basic understanding"]
-        weak_areas = ["Core concepts", "Practical application", "Advanced topics"]
-    else:
-        performance = "Review Required"
-        strength_areas = []
-        weak_areas = ["All major topics", "Fundamentals", "Core concepts"]
+    performance, strength_areas, weak_areas = _performance(score_percentage)
     
     # Record the quiz results
     performance_data = {
@@ -465,34 +337,20 @@ async def submit_quiz(
         "weak_areas": weak_areas
     }
     
-    quiz = await quiz_crud.submit_quiz(
+    submitted = await quiz_crud.submit_quiz(
         db,
-        quiz_id,
+        submission,
         answers_dict,
         correct_count,
         time_taken,
-        performance_data
+        performance_data,
+        answer_log=log
     )
-    
-    # Record skill gap if score is below 70%
-    if score_percentage < 70:
-        current_skill = db.query(UserSkill).filter(
-            UserSkill.user_id == current_user.id,
-            UserSkill.skill_name == quiz.skill_name
-        ).first()
-        
-        current_level = current_skill.proficiency if current_skill else 0
-        required_level = min(10, max(current_level + 2, 5))
-        
-        await quiz_crud.record_skill_gap(
-            db,
-            current_user.id,
-            quiz.skill_name,
-            current_level,
-            required_level,
-            "quiz",
-            quiz_id
-        )
+    quiz_sessions.evict(quiz_id)
+    if not submitted:
+        # A concurrent submission completed it first: answer with its result
+        logger.info("quiz_submit_duplicate", quiz_id=quiz_id)
+        return _quiz_result(await quiz_crud.get_quiz(db, quiz_id))
     
     logger.info(
         "quiz_submitted",
@@ -501,46 +359,165 @@ async def submit_quiz(
         correct=correct_count,
         total=quiz.question_count
     )
+    publish("quiz.completed", user_id=quiz.user_id, score=score_percentage)
+    await achievement_counters.flush_if_due(write_achievement_counters)
     
-    # Recommended topics based on weak areas
-    recommended_topics = weak_areas if weak_areas else ["Review fundamentals"]
-    
-    next_steps = []
-    if score_percentage >= 80:
-        next_steps = [
-            "Try the next difficulty level",
-            "Take another quiz on a different skill",
-            "Work on a project using this skill"
-        ]
-    elif score_percentage >= 60:
-        next_steps = [
-            "Review weak areas",
-            "Take practice quiz again",
-            "Study recommended resources"
-        ]
-    else:
-        next_steps = [
-            "Review fundamentals carefully",
-            "Take beginner level quiz first",
-            "Seek mentorship on this skill"
-        ]
-    
-    return QuizResult(
+    return _quiz_result(quiz)
+
+
+async def _adaptive_items(db: AsyncSession, skill_name: str) -> List[Item]:
+    async def load():
+        return question_bank(), await calibration_crud.get_difficulties(db)
+    # The item bank is keyed by the bank's spelling, whatever spelling the quiz was stored under
+    skill = bank_skill(skill_name)
+    return await item_bank.items(skill, load) if skill is not None else []
+
+
+def _item_payload(item: Item) -> dict:
+    q = item.question
+    return {"id": q["id"], "text": q["text"], "options": q["options"],
+            "topic": q.get("topic", "General"), "level": item.label}
+
+
+def _adaptive_state(quiz: Quiz, state: dict, question: Optional[dict] = None,
+                    result: Optional[QuizResult] = None) -> AdaptiveQuizState:
+    if quiz.status == "completed" and "ability" in (quiz.performance_data or {}):
+        # The final estimate is stored with the results
+        state = {"ability": quiz.performance_data["ability"],
+                 "variance": quiz.performance_data["standard_error"] ** 2}
+    return AdaptiveQuizState(
         quiz_id=quiz.id,
         skill_name=quiz.skill_name,
-        difficulty_level=quiz.difficulty_level,
-        score=score_percentage,
-        passed=score_percentage >= 70,
-        total_questions=quiz.question_count,
-        correct_answers=correct_count,
-        incorrect_answers=quiz.question_count - correct_count,
-        time_taken_seconds=time_taken,
-        performance_summary=performance,
-        strength_areas=strength_areas,
-        weak_areas=weak_areas,
-        recommended_topics=recommended_topics,
-        next_steps=next_steps
+        status=quiz.status,
+        questions_answered=len(quiz.answers_submitted or {}),
+        ability=state["ability"],
+        standard_error=state["variance"] ** 0.5,
+        question=build_questions([question], question["level"], quiz.skill_name)[0] if question else None,
+        result=result
+    )
+
+
+@router.post("/adaptive", response_model=AdaptiveQuizState)
+async def start_adaptive_quiz(
+    config: AdaptiveQuizCreate,
+    db: AsyncSession = Depends(db.get_db),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """
+    Start an adaptive quiz. Each answer updates the ability estimate and the
+    next question is the one most informative at that estimate; the quiz ends
+    once the estimate is precise enough or max_questions is reached.
+    """
+    skill_id = await skill_crud.get_skill_id(db, config.skill_name, create=True)
+    skill_name = skill_crud.display_name(db, skill_id, config.skill_name)
+    items = await _adaptive_items(db, skill_name)
+    estimate = AbilityEstimate()
+    first = next_item(estimate, items, ())
+    if first is None:
+        raise HTTPException(status_code=404, detail="No questions available for adaptive quizzes on this skill")
+
+    state = {"ability": estimate.ability, "variance": estimate.variance, "max_questions": config.max_questions}
+    question = _item_payload(first)
+    quiz = await quiz_crud.create_quiz(
+        db,
+        current_user.id,
+        skill_name,
+        ADAPTIVE,
+        1,
+        {"questions": [question], "adaptive": state},
+        status="in_progress",
+        started_at=datetime.utcnow()
     )
+    logger.info("adaptive_quiz_started", quiz_id=quiz.id, skill=skill_name, bank_size=len(items))
+    return _adaptive_state(quiz, state, question)
+
+
+@router.post("/{quiz_id}/answer", response_model=AdaptiveQuizState)
+async def answer_adaptive_question(
+    quiz_id: str,
+    answer: QuizAnswerSubmission,
+    db: AsyncSession = Depends(db.get_db),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """Answer the current question of an adaptive quiz."""
+    submission = await quiz_crud.get_quiz_for_submission(db, quiz_id)
+    if not submission:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    quiz = submission.quiz
+    if quiz.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to answer this quiz")
+    state = (quiz.questions_data or {}).get("adaptive")
+    if state is None:
+        raise HTTPException(status_code=400, detail="Not an adaptive quiz")
+    if quiz.status == "completed":
+        return _adaptive_state(quiz, state, result=_quiz_result(quiz))
+
+    asked = quiz.questions_data["questions"]
+    if answer.question_id != asked[-1]["id"]:
+        raise HTTPException(status_code=409, detail="Answer the current question")
+
+    items = await _adaptive_items(db, quiz.skill_name)
+    by_id = {item.id: item for item in items}
+    answers = {**(quiz.answers_submitted or {}), answer.question_id: answer.selected_option_index}
+
+    # [IRT] Online update: the whole session state is (ability, variance)
+    estimate = AbilityEstimate(state["ability"], state["variance"])
+    item = by_id.get(answer.question_id)
+    if item is not None:
+        estimate.update(item.difficulty, item.question["correct"] == answer.selected_option_index)
+    state = {**state, "ability": estimate.ability, "variance": estimate.variance}
+
+    following = None
+    precise = len(answers) >= MIN_QUESTIONS and estimate.standard_error <= TARGET_STANDARD_ERROR
+    if len(answers) < state["max_questions"] and not precise:
+        following = next_item(estimate, items, answers)
+
+    if following is not None:
+        question = _item_payload(following)
+        recorded = await quiz_crud.record_adaptive_answer(
+            db, submission, answers, {"questions": asked + [question], "adaptive": state}
+        )
+        quiz_sessions.evict(quiz_id)
+        if not recorded:
+            raise HTTPException(status_code=409, detail="Question already answered")
+        return _adaptive_state(quiz, state, question)
+
+    # Finished: score on the bank's scale so it compares with fixed-difficulty quizzes
+    score_percentage = expected_score(estimate.ability, items)
+    correct_count = sum(
+        1 for question_id, option in answers.items()
+        if question_id in by_id and by_id[question_id].question["correct"] == option
+    )
+    performance, strength_areas, weak_areas = _performance(score_percentage)
+    performance_data = {
+        "score_percentage": score_percentage,
+        "performance_level": performance,
+        "correct_answers": correct_count,
+        "incorrect_answers": len(answers) - correct_count,
+        "total_questions": len(answers),
+        "strength_areas": strength_areas,
+        "weak_areas": weak_areas,
+        "ability": estimate.ability,
+        "standard_error": estimate.standard_error,
+    }
+    time_taken = int((datetime.utcnow() - quiz.started_at).total_seconds()) if quiz.started_at else 0
+    submitted = await quiz_crud.submit_quiz(
+        db, submission, answers, correct_count, time_taken, performance_data, score=score_percentage
+    )
+    quiz_sessions.evict(quiz_id)
+    if not submitted:
+        quiz = await quiz_crud.get_quiz(db, quiz_id)
+    else:
+        publish("quiz.completed", user_id=quiz.user_id, score=score_percentage)
+        await achievement_counters.flush_if_due(write_achievement_counters)
+    logger.info(
+        "adaptive_quiz_completed",
+        quiz_id=quiz_id,
+        questions=len(answers),
+        ability=round(estimate.ability, 3),
+        standard_error=round(estimate.standard_error, 3)
+    )
+    return _adaptive_state(quiz, state, result=_quiz_result(quiz))
 
 
 @router.get("", response_model=List[QuizResponse])
@@ -561,17 +538,9 @@ async def list_user_quizzes(
         if quiz.status == "not_started" and quiz.questions_data:
             # Only return questions if quiz hasn't started
             if "questions" in quiz.questions_data:
-                questions = [
-                    QuizQuestion(
-                        id=q["id"],
-                        text=q["text"],
-                        options=q["options"],
-                        difficulty_level=quiz.difficulty_level,
-                        skill_tested=quiz.skill_name,
-                        topic=q.get("topic", "General")
-                    )
-                    for q in quiz.questions_data["questions"]
-                ]
+                questions = build_questions(
+                    quiz.questions_data["questions"], quiz.difficulty_level, quiz.skill_name
+                )
         
         response.append(QuizResponse(
             id=quiz.id,
@@ -586,7 +555,7 @@ async def list_user_quizzes(
             questions=questions if quiz.status == "not_started" else None
         ))
     
-    return response
+    return respond(response)
 
 
 @router.get("/stats", response_model=QuizStats)
@@ -614,7 +583,7 @@ async def get_skill_gaps(
     current_user: User = Depends(deps.get_current_user)
 ):
     """Get skill gaps identified from quiz performance."""
-    gaps = await quiz_crud.identify_skill_gaps(db, current_user.id)
+    gaps = await skill_gap_crud.get_skill_gaps(db, current_user.id)
     
     # Convert to SkillGap objects
     skill_gaps = [
@@ -644,41 +613,18 @@ async def get_quiz_details(
     db: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
-    """Get details of a specific quiz."""
-    quiz = await quiz_crud.get_quiz(db, quiz_id)
+    """Get details of a specific quiz. Active quizzes are served from the session cache."""
+    session = await _get_session(db, quiz_id)
     
-    if not quiz:
+    if not session:
         raise HTTPException(status_code=404, detail="Quiz not found")
     
-    if quiz.user_id != current_user.id:
+    if session.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view this quiz")
     
-    questions = []
-    if quiz.questions_data and "questions" in quiz.questions_data:
-        questions = [
-            QuizQuestion(
-                id=q["id"],
-                text=q["text"],
-                options=q["options"],
-                difficulty_level=quiz.difficulty_level,
-                skill_tested=quiz.skill_name,
-                topic=q.get("topic", "General")
-            )
-            for q in quiz.questions_data["questions"]
-        ]
-    
-    return QuizResponse(
-        id=quiz.id,
-        skill_name=quiz.skill_name,
-        difficulty_level=quiz.difficulty_level,
-        title=quiz.title,
-        status=quiz.status,
-        question_count=quiz.question_count,
-        created_at=quiz.created_at,
-        started_at=quiz.started_at,
-        completed_at=quiz.completed_at,
-        questions=questions if quiz.status == "not_started" else None
-    )
+    if session.status == "not_started":
+        return respond_spliced(_session_response(session), questions=_questions_json(session))
+    return respond(_session_response(session))
 
 
 def _level_to_proficiency(level: int) -> str:
@@ -4,6 +4,8 @@ import structlog
 
 from app.core import db
 from app.api import deps
+from app.core.user_settings import NOTIFICATION_BITS, PRIVACY_BITS, masks, unpack
+from app.crud import user_settings as settings_crud
 from app.models.models import User
 from app.schemas.user import (
     NotificationSettingsBase,
@@ -23,22 +25,10 @@ async def get_user_settings(
     """
     Get current user's settings (notifications and privacy).
     """
-    # For now, return default settings
-    # In a real implementation, these would be fetched from the database
+    flags = await settings_crud.get_settings(db, current_user.id)
     return UserSettingsResponse(
-        notifications=NotificationSettingsBase(
-            email_achievements=True,
-            email_mentorship=True,
-            email_courses=True,
-            email_connections=True,
-            push_enabled=True
-        ),
-        privacy=PrivacySettingsBase(
-            profile_public=True,
-            show_achievements=True,
-            show_projects=True,
-            show_skills=True
-        )
+        notifications=NotificationSettingsBase(**unpack(flags, NOTIFICATION_BITS)),
+        privacy=PrivacySettingsBase(**unpack(flags, PRIVACY_BITS))
     )
 
 
@@ -50,11 +40,13 @@ async def update_notification_settings(
     current_user: User = Depends(deps.get_current_user)
 ):
     """
-    Update notification settings for the current user.
+    Update notification settings for the current user. Fields left out keep their value.
     """
-    # TODO: Implement database storage for notification settings
-    # For now, just return the submitted settings
-    return settings_in
+    flags = await settings_crud.update_settings(
+        db, current_user.id, *masks(settings_in.model_dump(exclude_unset=True))
+    )
+    logger.info("notification_settings_updated", user_id=current_user.id)
+    return NotificationSettingsBase(**unpack(flags, NOTIFICATION_BITS))
 
 
 @router.patch("/settings/privacy", response_model=PrivacySettingsBase)
@@ -65,11 +57,13 @@ async def update_privacy_settings(
     current_user: User = Depends(deps.get_current_user)
 ):
     """
-    Update privacy settings for the current user.
+    Update privacy settings for the current user. Fields left out keep their value.
     """
-    # TODO: Implement database storage for privacy settings
-    # For now, just return the submitted settings
-    return settings_in
+    flags = await settings_crud.update_settings(
+        db, current_user.id, *masks(settings_in.model_dump(exclude_unset=True))
+    )
+    logger.info("privacy_settings_updated", user_id=current_user.id)
+    return PrivacySettingsBase(**unpack(flags, PRIVACY_BITS))
 
 
 @router.post("/settings/password")
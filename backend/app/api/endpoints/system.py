@@ -1,8 +1,20 @@
-from fastapi import APIRouter, Depends, status
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import text
+import structlog
+
+from app.core import db, health
 from app.core.context import RequestContext
-from app.api.deps import get_request_context
+from app.core.health import CachedProbe
+from app.core.profiler import MAX_SECONDS, ProfilerBusy, profiler
+from app.core.serialization import respond
+from app.api.deps import get_current_admin_detached, get_request_context, reusable_oauth2
+from app.models.models import User
 
 router = APIRouter()
+logger = structlog.get_logger()
 
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check(
@@ -19,25 +31,147 @@ async def health_check(
         "cid": ctx.cid
     }
 
+async def _ping_database() -> None:
+    async with db.engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+# [PERFORMANCE] Probe results are shared for PROBE_TTL_S across all /ready callers
+database_probe = CachedProbe("database", _ping_database)
+
+
 @router.get("/ready", status_code=status.HTTP_200_OK)
 async def readiness_check(
     ctx: RequestContext = Depends(get_request_context)
 ):
     """
     Readiness probe.
-    Checks connections to DB, Cache, etc.
-    Returns 503 if critical deps are down.
+    Checks the DB and this worker's load (pool saturation, event-loop lag,
+    requests in flight). Returns 503 if the DB is down or the worker is
+    overloaded, so load balancers shed traffic early.
     """
     # [PATTERN] fail-fast but degrade gracefully if non-critical
-    # Mocking a dependency check
-    # if not db.is_connected():
-    #     raise UpstreamError("database", "Connection refused")
-    
-    return {
-        "status": "ready",
+    database = await database_probe.status()
+    pool = health.pool_status(db.engine)
+    reasons = health.overload_reasons(health.loop_lag.last_ms, pool.get("saturation"), health.in_flight.count)
+    ready = database["status"] == "ok" and not reasons
+
+    content = {
+        "status": "ready" if ready else "unavailable",
         "checks": {
-            "database": "ok", # Mock
-            "cache": "ok"     # Mock
+            "database": {**database, **pool},
+            # Caches are in-process (app.core): nothing external to probe
+            "cache": {"status": "ok", "backend": "in_process"},
+        },
+        "load": {
+            "event_loop_lag_ms": None if health.loop_lag.last_ms is None else round(health.loop_lag.last_ms, 2),
+            "in_flight": health.in_flight.count,
+            "in_flight_peak": health.in_flight.peak,
+            "overloaded": reasons,
         },
         "cid": ctx.cid
     }
+    if not ready:
+        logger.warning("readiness.unavailable", database=database["status"], overloaded=reasons)
+    return respond(content, status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+def _prometheus() -> str:
+    """Text exposition format, for a Prometheus scrape."""
+    lines = [
+        "# HELP event_loop_lag_ms Event-loop scheduling lag over the last samples.",
+        "# TYPE event_loop_lag_ms summary",
+    ]
+    for q, value in health.loop_lag.percentiles().items():
+        lines.append(f'event_loop_lag_ms{{quantile="{q}"}} {value:.3f}')
+    lines += [
+        "# HELP event_loop_lag_max_ms Largest event-loop lag since start.",
+        "# TYPE event_loop_lag_max_ms gauge",
+        f"event_loop_lag_max_ms {health.loop_lag.max_ms:.3f}",
+        "# HELP event_loop_blocked_total Event-loop stalls over the debug threshold.",
+        "# TYPE event_loop_blocked_total counter",
+        f"event_loop_blocked_total {health.blocking_detector.total}",
+        "# HELP http_requests_in_flight Requests being handled by this worker.",
+        "# TYPE http_requests_in_flight gauge",
+        f"http_requests_in_flight {health.in_flight.count}",
+    ]
+    pool = health.pool_status(db.engine)
+    if "checked_out" in pool:
+        lines += [
+            "# HELP db_pool_checked_out Database connections in use.",
+            "# TYPE db_pool_checked_out gauge",
+            f"db_pool_checked_out {pool['checked_out']}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(
+    request: Request,
+    format: str = Query("prometheus", pattern="^(prometheus|json)$")
+):
+    """
+    Worker metrics: event-loop lag percentiles, blocking-call stalls, load.
+    `format=json` (admins only) adds the recorded stacks of the last stalls
+    (loop debug mode).
+    """
+    if format == "prometheus":
+        return PlainTextResponse(_prometheus(), media_type="text/plain; version=0.0.4")
+    # [SECURITY] Stall stacks show file paths and source lines
+    await get_current_admin_detached(await reusable_oauth2(request))
+    return respond({
+        "event_loop_lag_ms": {
+            **{f"p{int(q * 100)}": round(v, 3) for q, v in health.loop_lag.percentiles().items()},
+            "max": round(health.loop_lag.max_ms, 3),
+        },
+        "blocked": {
+            "total": health.blocking_detector.total,
+            "threshold_ms": health.blocking_detector.threshold_ms,
+            "incidents": list(health.blocking_detector.incidents),
+        },
+        "in_flight": health.in_flight.count,
+        "db_pool": health.pool_status(db.engine),
+    })
+
+
+def _endpoint_routes(routes, prefix: str = ""):
+    """(endpoint code object, "METHOD /path") of every API route, through included routers."""
+    for route in routes:
+        if isinstance(route, APIRoute):
+            code = getattr(route.endpoint, "__code__", None)
+            if code is not None:
+                yield code, f"{','.join(sorted(route.methods))} {prefix}{route.path}"
+        elif hasattr(route, "original_router"):
+            # Routers included without being flattened into the app's route list
+            context = getattr(route, "include_context", None)
+            yield from _endpoint_routes(route.original_router.routes, prefix + (getattr(context, "prefix", "") or ""))
+
+
+@router.get("/profile")
+async def profile_worker(
+    request: Request,
+    seconds: float = Query(10, gt=0, le=MAX_SECONDS),
+    format: str = Query("speedscope", pattern="^(speedscope|collapsed)$"),
+    tag_routes: bool = Query(True),
+    # Not get_current_admin: its request session would hold a pooled connection while sampling
+    admin: User = Depends(get_current_admin_detached)
+):
+    """
+    Sample this worker's event loop for `seconds` under live traffic.
+    Returns speedscope JSON (open in speedscope.app) or collapsed stacks
+    (flamegraph.pl). With `tag_routes`, samples inside an endpoint are
+    rooted at its route. Only the worker serving this request is profiled.
+    """
+    routes = dict(_endpoint_routes(request.app.routes)) if tag_routes else None
+    logger.info("profiler.start", seconds=seconds, user_id=admin.id)
+    try:
+        result = await profiler.profile(seconds, routes)
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    if format == "collapsed":
+        response = PlainTextResponse(result.collapsed())
+    else:
+        response = respond(result.speedscope(name=f"pid {os.getpid()}, {result.duration_s}s"))
+    response.headers["X-Profile-Samples"] = str(result.samples)
+    response.headers["X-Profile-Idle-Samples"] = str(result.idle)
+    return response
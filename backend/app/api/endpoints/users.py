@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from app.core import db
+from app.core.http_cache import conditional_get
 from app.api import deps
 from app.crud import user as user_crud
 from app.models.models import User
@@ -28,7 +29,8 @@ def map_user_to_schema(user: User) -> UserProfile:
         skills=skills_mapped
     )
 
-@router.get("/me", response_model=UserProfile)
+@router.get("/me", response_model=UserProfile,
+            dependencies=[Depends(conditional_get("profile", per_user=True))])
 async def read_users_me(
     db: AsyncSession = Depends(db.get_db),
     current_user: User = Depends(deps.get_current_user)
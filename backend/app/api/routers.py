@@ -0,0 +1,111 @@
+from typing import List, Tuple
+
+import structlog
+from fastapi import FastAPI
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+API = settings.API_V1_STR
+
+# (module in app.api.endpoints, prefix, tags), in inclusion order
+ROUTERS: List[Tuple[str, str, List[str]]] = [
+    ("system", "/system", ["system"]),
+    ("users", "/users", ["users"]),
+    # [AUTH] Mount auth routes
+    ("auth", API + "/auth", ["auth"]),
+    # [DOMAIN] Assessments
+    ("assessments", API + "/assessments", ["assessments"]),
+    # [NEW FEATURES] Additional endpoints
+    ("achievements", API + "/achievements", ["achievements"]),
+    ("projects", API + "/projects", ["projects"]),
+    ("courses", API + "/courses", ["courses"]),
+    ("mentorship", API + "/mentorships", ["mentorships"]),
+    ("notifications", API + "/notifications", ["notifications"]),
+    ("quiz", API + "/quizzes", ["quizzes"]),
+    ("settings", API + "/users", ["settings"]),
+    # [PERFORMANCE] One aggregated read for the dashboard page
+    ("dashboard", API + "/dashboard", ["dashboard"]),
+    ("career_paths", API + "/career-paths", ["career-paths"]),
+]
+
+
+def _include(application: FastAPI, module: str, prefix: str, tags: List[str]) -> None:
+    # __import__ rather than importlib.import_module: it takes the interpreter's
+    # import path, so `-X importtime` (python -m bench startup) reports each module
+    router = __import__(f"app.api.endpoints.{module}", fromlist=["router"]).router
+    application.include_router(router, prefix=prefix, tags=tags)
+
+
+class LazyRouter(BaseRoute):
+    """
+    Stand-in for an endpoint module that is not imported yet. The first
+    request under its prefix imports the module, swaps its routes in for
+    this placeholder, and is routed again. Loading is synchronous, so
+    concurrent first requests load the module once.
+    """
+    def __init__(self, application: FastAPI, module: str, prefix: str, tags: List[str]):
+        self.application = application
+        self.module = module
+        self.prefix = prefix
+        self.tags = tags
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path == self.prefix or path.startswith(self.prefix + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params):
+        raise NoMatchFound(name, path_params)
+
+    def load(self) -> None:
+        routes = self.application.router.routes
+        if self not in routes:
+            return  # Loaded by a concurrent request
+        count = len(routes)
+        _include(self.application, self.module, self.prefix, self.tags)
+        # Keep the inclusion order: the new routes take the placeholder's place
+        added = routes[count:]
+        del routes[count:]
+        index = routes.index(self)
+        routes[index:index + 1] = added
+        self.application.openapi_schema = None
+        logger.info("routers.loaded", module=self.module)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.load()
+        await self.application.router(scope, receive, send)
+
+
+def load_all(application: FastAPI) -> None:
+    """Import every module still behind a LazyRouter (e.g. to build the OpenAPI schema)."""
+    for route in list(application.router.routes):
+        if isinstance(route, LazyRouter):
+            route.load()
+
+
+def include_routers(application: FastAPI, lazy: bool = False) -> None:
+    """
+    Add every router in ROUTERS. With `lazy`, each endpoint module is
+    imported on the first request under its prefix instead of at startup:
+    a cold worker only pays for the routes it serves. The OpenAPI schema
+    loads them all first, so it stays complete.
+    """
+    for module, prefix, tags in ROUTERS:
+        if lazy:
+            application.router.routes.append(LazyRouter(application, module, prefix, tags))
+        else:
+            _include(application, module, prefix, tags)
+    if lazy:
+        openapi = application.openapi
+
+        def complete_openapi():
+            load_all(application)
+            return openapi()
+
+        application.openapi = complete_openapi
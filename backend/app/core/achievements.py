@@ -0,0 +1,80 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.counters import CounterBuffer
+
+PASS_SCORE = 70
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Award `badge_name` once the user's `counter` reaches `threshold`."""
+    badge_name: str
+    title: str
+    description: str
+    counter: str
+    threshold: int
+
+
+RULES = [
+    Rule("first_quiz", "First Quiz", "Completed your first quiz", "quizzes_completed", 1),
+    Rule("quiz_regular", "Quiz Regular", "Passed 10 quizzes", "quizzes_passed", 10),
+    Rule("quiz_master", "Quiz Master", "Passed 50 quizzes", "quizzes_passed", 50),
+    Rule("perfect_score", "Perfect Score", "Scored 100% on a quiz", "perfect_quizzes", 1),
+    Rule("first_project", "First Project", "Added your first project", "projects_created", 1),
+    Rule("builder", "Builder", "Added 5 projects", "projects_created", 5),
+    Rule("endorsed", "Endorsed", "Received your first endorsement", "endorsements_received", 1),
+    Rule("community_favorite", "Community Favorite", "Received 25 endorsements", "endorsements_received", 25),
+    Rule("mentor", "Mentor", "Completed a mentorship as a mentor", "mentorships_mentored", 1),
+    Rule("lifelong_learner", "Lifelong Learner", "Completed a mentorship as a mentee", "mentorships_completed", 1),
+]
+
+# Domain event -> (counter, field holding the user id, condition) for each counter it increments
+EVENTS: Dict[str, List[Tuple[str, str, Optional[Callable[[dict], bool]]]]] = {
+    "quiz.completed": [
+        ("quizzes_completed", "user_id", None),
+        ("quizzes_passed", "user_id", lambda e: e["score"] >= PASS_SCORE),
+        ("perfect_quizzes", "user_id", lambda e: e["score"] >= 100),
+    ],
+    "project.created": [("projects_created", "user_id", None)],
+    "project.endorsed": [("endorsements_received", "owner_id", None)],
+    "mentorship.completed": [
+        ("mentorships_mentored", "mentor_id", None),
+        ("mentorships_completed", "mentee_id", None),
+    ],
+}
+
+
+def _index(rules: List[Rule]) -> Dict[str, Tuple[List[int], List[Rule]]]:
+    by_counter: Dict[str, List[Rule]] = {}
+    for rule in rules:
+        by_counter.setdefault(rule.counter, []).append(rule)
+    index = {}
+    for counter, counter_rules in by_counter.items():
+        counter_rules.sort(key=lambda r: r.threshold)
+        index[counter] = ([r.threshold for r in counter_rules], counter_rules)
+    return index
+
+
+_RULES_BY_COUNTER = _index(RULES)
+
+
+def triggered(counter: str, old: int, new: int) -> List[Rule]:
+    """Rules whose threshold a counter crossed going from `old` to `new`: a bisect, not a scan."""
+    entry = _RULES_BY_COUNTER.get(counter)
+    if entry is None or new <= old:
+        return []
+    thresholds, rules = entry
+    return rules[bisect_right(thresholds, old):bisect_right(thresholds, new)]
+
+
+# [ACHIEVEMENTS] Counter increments, keyed by (user id, counter), coalesced between flushes
+achievement_counters = CounterBuffer("achievement_counters")
+
+
+def publish(event: str, **data) -> None:
+    """Record a domain event: bumps the user counters it maps to. Badges are awarded on flush."""
+    for counter, user_field, condition in EVENTS.get(event, ()):
+        if condition is None or condition(data):
+            achievement_counters.add((data[user_field], counter))
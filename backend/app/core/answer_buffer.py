@@ -0,0 +1,172 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+# [PERFORMANCE] Answers are written to the quiz row every FLUSH_BATCH answers,
+# or FLUSH_INTERVAL_S after the oldest unwritten one by the background flusher.
+# With several workers and a batch of 1, /submit on any worker sees every answer acknowledged.
+FLUSH_BATCH = settings.ANSWER_FLUSH_BATCH
+FLUSH_INTERVAL_S = 10
+# Sessions idle this long (and fully written) are dropped from memory
+SESSION_TTL_S = 2 * 60 * 60
+
+# (question id, selected option, client-measured ms or None)
+Answer = Tuple[str, int, Optional[int]]
+# write(quiz_id, full log, entries already stored) -> the stored log, or None once the quiz is completed
+Writer = Callable[[str, list, int], Awaitable[Optional[list]]]
+
+
+def timed_entries(answers: Sequence[Answer], started_at: Optional[datetime], elapsed_ms: int,
+                  now: Optional[datetime] = None) -> List[list]:
+    """
+    Log entries [question id, option, ms] for answers received together.
+
+    The time since the previous answer (or the quiz start) is measured on the
+    server; a batch splits it in proportion to the client's per-answer
+    timings when every answer has one, evenly otherwise. Entry times therefore
+    always sum to the wall time since the start.
+    """
+    if not answers:
+        return []
+    available = 0
+    if started_at is not None:
+        total_ms = int(((now or datetime.utcnow()) - started_at).total_seconds() * 1000)
+        available = max(total_ms - elapsed_ms, 0)
+    weights = [a[2] for a in answers]
+    if any(w is None for w in weights) or not sum(weights):
+        weights = [1] * len(answers)
+    total_weight = sum(weights)
+    entries, assigned = [], 0
+    for i, (answer, weight) in enumerate(zip(answers, weights)):
+        ms = available - assigned if i == len(answers) - 1 else available * weight // total_weight
+        assigned += ms
+        entries.append([answer[0], answer[1], ms])
+    return entries
+
+
+def graded_answers(log: Sequence[list]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """({question id: final option}, {question id: total ms}) from a log; later answers win."""
+    answers, times = {}, {}
+    for question_id, option, ms in log:
+        answers[question_id] = option
+        times[question_id] = times.get(question_id, 0) + (ms or 0)
+    return answers, times
+
+
+@dataclass
+class AnswerSession:
+    """One in-progress quiz answered incrementally: log[:persisted] is already on the quiz row."""
+    quiz_id: str
+    user_id: str
+    question_ids: FrozenSet[str]
+    question_count: int
+    started_at: Optional[datetime]
+    log: List[list] = field(default_factory=list)
+    persisted: int = 0
+    elapsed_ms: int = 0
+    answered: set = field(default_factory=set)
+    pending_since: Optional[float] = None
+    last_used: float = field(default_factory=time.monotonic)
+    closed: bool = False  # Detached for finalisation: no more writes
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def pending(self) -> int:
+        return len(self.log) - self.persisted
+
+    def adopt(self, stored: list, tail: Sequence[list] = ()) -> None:
+        """Take `stored` as the persisted log, followed by the entries not yet written."""
+        self.log = list(stored) + list(tail)
+        self.persisted = len(stored)
+        self.elapsed_ms = sum(entry[2] or 0 for entry in self.log)
+        self.answered = {entry[0] for entry in self.log}
+
+
+class AnswerBuffer:
+    """
+    Process-wide, append-only answer buffer for quizzes answered one question
+    (or a few) at a time. Appends are in memory; the quiz row is written in
+    batches, guarded on its answer_log_length, so a session rebases onto
+    whatever another worker wrote in between.
+    """
+    def __init__(self):
+        self._sessions: Dict[str, AnswerSession] = {}
+
+    def get(self, quiz_id: str) -> Optional[AnswerSession]:
+        session = self._sessions.get(quiz_id)
+        if session is not None:
+            session.last_used = time.monotonic()
+        return session
+
+    def open(self, quiz) -> AnswerSession:
+        """The session of a loaded quiz row; an existing one wins if opened concurrently."""
+        session = AnswerSession(
+            quiz_id=quiz.id,
+            user_id=quiz.user_id,
+            question_ids=frozenset(q["id"] for q in (quiz.questions_data or {}).get("questions", [])),
+            question_count=quiz.question_count,
+            started_at=quiz.started_at,
+        )
+        session.adopt(quiz.answer_log or [])
+        return self._sessions.setdefault(quiz.id, session)
+
+    def append(self, session: AnswerSession, answers: Sequence[Answer]) -> None:
+        entries = timed_entries(answers, session.started_at, session.elapsed_ms)
+        session.log.extend(entries)
+        session.elapsed_ms += sum(entry[2] for entry in entries)
+        session.answered.update(entry[0] for entry in entries)
+        if session.pending_since is None:
+            session.pending_since = time.monotonic()
+
+    async def flush(self, session: AnswerSession, write: Writer) -> None:
+        async with session.lock:
+            if session.closed or session.pending == 0:
+                return
+            written = len(session.log)
+            stored = await write(session.quiz_id, list(session.log), session.persisted)
+            if stored is None:
+                # Completed meanwhile (e.g. submitted through another worker): nothing more to write
+                self._sessions.pop(session.quiz_id, None)
+                return
+            # Entries appended while writing stay pending
+            tail = session.log[written:]
+            session.adopt(stored, tail)
+            session.pending_since = time.monotonic() if tail else None
+
+    async def detach(self, quiz_id: str) -> Optional[AnswerSession]:
+        """Remove a session for finalisation, once any write in flight has finished."""
+        session = self._sessions.get(quiz_id)
+        if session is None:
+            return None
+        async with session.lock:
+            session.closed = True
+            self._sessions.pop(quiz_id, None)
+        return session
+
+    async def flush_due(self, write: Writer, force: bool = False) -> None:
+        now = time.monotonic()
+        for session in list(self._sessions.values()):
+            if session.pending and (force or now - session.pending_since >= FLUSH_INTERVAL_S):
+                try:
+                    await self.flush(session, write)
+                except Exception as exc:
+                    logger.error("answer_buffer.flush_failed", quiz_id=session.quiz_id, error=str(exc))
+            elif not session.pending and now - session.last_used >= SESSION_TTL_S:
+                self._sessions.pop(session.quiz_id, None)
+
+    async def run_flusher(self, write: Writer) -> None:
+        """Background task: write answers that have waited FLUSH_INTERVAL_S."""
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL_S / 2)
+            await self.flush_due(write)
+
+
+answer_buffer = AnswerBuffer()
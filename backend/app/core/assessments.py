@@ -0,0 +1,197 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+PASS_SCORE = 70.0
+# Domain share (0-1) below which the domain's gap rule applies
+DOMAIN_THRESHOLD = 0.7
+# How often a worker checks whether stored definitions changed
+RELOAD_CHECK_S = 30
+
+
+class InvalidDefinition(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class GapRule:
+    domain: str
+    threshold: float
+    gap_text: str
+    recommendations: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Grade:
+    score: float  # 0-100
+    passed: bool
+    correct: int
+    answered: int
+    weak_domains: List[str]
+    gap_analysis: str
+    recommendations: List[str]
+
+
+class CompiledAssessment:
+    """
+    A stored definition compiled for grading: question id -> (correct option,
+    domain index, weight), with per-domain totals and gap rules in parallel
+    lists, so grading is one dict lookup per answer and one pass overall.
+    """
+    __slots__ = ("id", "version", "title", "config", "questions", "pass_score",
+                 "_key", "_rules", "_totals", "_total", "_on_pass", "_on_fail")
+
+    def __init__(self, definition: dict, version: int = 1):
+        try:
+            self.id = definition["id"]
+            self.title = definition["title"]
+            questions = definition["questions"]
+            domains = definition.get("domains", {})
+        except (KeyError, TypeError) as exc:
+            raise InvalidDefinition(f"missing field {exc}") from exc
+        if not questions:
+            raise InvalidDefinition(f"{self.id}: no questions")
+        self.version = version
+        self.pass_score = float(definition.get("pass_score", PASS_SCORE))
+
+        domain_index: Dict[str, int] = {}
+        self._rules: List[GapRule] = []
+        self._totals: List[float] = []
+        self._key: Dict[str, Tuple[int, int, float]] = {}
+        self.questions: List[dict] = []
+        for q in questions:
+            options = q.get("options") or []
+            correct = q.get("correct")
+            if not isinstance(correct, int) or not 0 <= correct < len(options):
+                raise InvalidDefinition(f"{self.id}/{q.get('id')}: correct option out of range")
+            if q["id"] in self._key:
+                raise InvalidDefinition(f"{self.id}/{q['id']}: duplicate question id")
+            domain = q.get("domain", "general")
+            index = domain_index.get(domain)
+            if index is None:
+                index = domain_index[domain] = len(self._rules)
+                rule = domains.get(domain, {})
+                self._rules.append(GapRule(
+                    domain=domain,
+                    threshold=float(rule.get("threshold", DOMAIN_THRESHOLD)),
+                    gap_text=rule.get("gap", f"Found gaps in {domain}."),
+                    recommendations=tuple(rule.get("recommendations", ())),
+                ))
+                self._totals.append(0.0)
+            weight = float(q.get("weight", 1.0))
+            self._key[q["id"]] = (correct, index, weight)
+            self._totals[index] += weight
+            # What the client sees: never the answer key
+            self.questions.append({"id": q["id"], "text": q["text"], "options": list(options)})
+        self._total = sum(self._totals)
+        self._on_pass = definition.get("on_pass", {})
+        self._on_fail = definition.get("on_fail", {})
+        self.config = {
+            "id": self.id,
+            "title": self.title,
+            "description": definition.get("description", ""),
+            "category": definition.get("category", "General"),
+            "estimated_time_minutes": int(definition.get("estimated_time_minutes", 15)),
+            "question_count": len(self.questions),
+        }
+
+    def grade(self, answers: Iterable[Tuple[str, int]]) -> Grade:
+        """Score and gap analysis in one pass; unknown and repeated question ids are ignored."""
+        earned = [0.0] * len(self._totals)
+        seen = set()
+        correct = 0
+        for question_id, option in answers:
+            entry = self._key.get(question_id)
+            if entry is None or question_id in seen:
+                continue
+            seen.add(question_id)
+            if option == entry[0]:
+                earned[entry[1]] += entry[2]
+                correct += 1
+
+        score = 100.0 * sum(earned) / self._total if self._total else 0.0
+        weak = [rule for rule, got, total in zip(self._rules, earned, self._totals) if got < rule.threshold * total]
+        passed = score >= self.pass_score
+        if weak:
+            gap_analysis = " ".join(rule.gap_text for rule in weak)
+            recommendations = list(dict.fromkeys(r for rule in weak for r in rule.recommendations))
+        else:
+            outcome = self._on_pass if passed else self._on_fail
+            gap_analysis = outcome.get("gap", "")
+            recommendations = list(outcome.get("recommendations", ()))
+        return Grade(
+            score=round(score, 2),
+            passed=passed,
+            correct=correct,
+            answered=len(seen),
+            weak_domains=[rule.domain for rule in weak],
+            gap_analysis=gap_analysis,
+            recommendations=recommendations,
+        )
+
+
+class AssessmentCatalog:
+    """
+    Process-wide compiled assessment definitions. Every RELOAD_CHECK_S a
+    worker compares a cheap fingerprint of the stored definitions (count,
+    latest update) and recompiles only if it changed: edits go live without
+    a restart. An invalid definition is logged and skipped; its previous
+    compiled version keeps serving.
+    """
+    def __init__(self):
+        self._compiled: Dict[str, CompiledAssessment] = {}
+        self._fingerprint = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self.on_reload: List[Callable[[], None]] = []
+
+    def invalidate(self) -> None:
+        """Check the stored definitions on the next access."""
+        self._checked_at = 0.0
+
+    async def definitions(self, fingerprint: Callable[[], Awaitable[tuple]],
+                          load: Callable[[], Awaitable[Sequence[Tuple[dict, int]]]]) -> Dict[str, CompiledAssessment]:
+        """`fingerprint` returns a tuple that changes with any edit; `load` returns [(definition, version)]."""
+        if time.monotonic() - self._checked_at < RELOAD_CHECK_S:
+            return self._compiled
+        async with self._lock:
+            if time.monotonic() - self._checked_at < RELOAD_CHECK_S:
+                return self._compiled
+            current = await fingerprint()
+            if current != self._fingerprint:
+                self._reload(await load())
+                # Seeding on first load changes the fingerprint: take it after loading
+                self._fingerprint = await fingerprint()
+            self._checked_at = time.monotonic()
+        return self._compiled
+
+    def _reload(self, definitions: Sequence[Tuple[dict, int]]) -> None:
+        compiled = {}
+        for definition, version in definitions:
+            try:
+                assessment = CompiledAssessment(definition, version)
+            except InvalidDefinition as exc:
+                logger.error("assessments.invalid_definition", error=str(exc))
+                previous = self._compiled.get((definition or {}).get("id"))
+                if previous is not None:
+                    compiled[previous.id] = previous
+                continue
+            compiled[assessment.id] = assessment
+        self._compiled = compiled
+        logger.info("assessments.compiled", definitions=len(compiled))
+        for callback in self.on_reload:
+            callback()
+
+    def get(self, assessment_id: str) -> Optional[CompiledAssessment]:
+        return self._compiled.get(assessment_id)
+
+    def by_title(self, title: str) -> Optional[CompiledAssessment]:
+        return next((a for a in self._compiled.values() if a.title == title), None)
+
+
+assessment_catalog = AssessmentCatalog()
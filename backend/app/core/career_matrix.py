@@ -0,0 +1,181 @@
+import asyncio
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# [CACHE] Paths are admin-managed and rarely change; other workers pick up writes after this
+MATRIX_TTL_S = 300
+USER_CACHE_SIZE = 2048
+
+
+@dataclass(frozen=True)
+class PathRequirements:
+    """The columns of a CareerPath the matrix needs (no descriptions)."""
+    id: str
+    title: str
+    required_skills: Dict[int, float]  # skill registry id -> required level
+    estimated_months: int
+
+
+class CareerMatrix:
+    """
+    Read-only requirement matrix over every career path.
+
+    Stored sparse, both ways round:
+      rows:     path -> (skill columns, required levels), for missing-skill lists
+      postings: skill -> (paths, required levels), for scoring
+
+    Scoring a user walks only the postings of the skills they hold, so the
+    cost is proportional to how many paths mention those skills, not to
+    paths x skills. Progress is the mean over a path's requirements of
+    min(user_level / required_level, 1).
+    """
+    def __init__(self, paths: Sequence[PathRequirements], skill_names: Dict[int, str], version: int = 0):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.path_ids: List[str] = []
+        self.titles: List[str] = []
+        self.months = array("I")
+        self.skill_names: List[str] = []
+        self._columns: Dict[int, int] = {}
+        self._row_skills: List[array] = []
+        self._row_levels: List[array] = []
+        self._inv_required = array("d")
+        self._index: Dict[str, int] = {}
+
+        postings: List[Tuple[array, array]] = []
+        for row, path in enumerate(paths):
+            self._index[path.id] = row
+            self.path_ids.append(path.id)
+            self.titles.append(path.title)
+            self.months.append(max(path.estimated_months or 0, 0))
+            skills, levels = array("I"), array("f")
+            for skill_id, level in (path.required_skills or {}).items():
+                column = self._column(skill_id, skill_names.get(skill_id, str(skill_id)), postings)
+                required = max(float(level or 0), 0.0)
+                skills.append(column)
+                levels.append(required)
+                postings[column][0].append(row)
+                postings[column][1].append(required)
+            self._row_skills.append(skills)
+            self._row_levels.append(levels)
+            self._inv_required.append(1.0 / len(skills) if skills else 0.0)
+        self._postings = postings
+
+    def _column(self, skill_id: int, name: str, postings: List[Tuple[array, array]]) -> int:
+        column = self._columns.get(skill_id)
+        if column is None:
+            column = self._columns[skill_id] = len(self.skill_names)
+            self.skill_names.append(name)
+            postings.append((array("I"), array("f")))
+        return column
+
+    def __len__(self) -> int:
+        return len(self.path_ids)
+
+    def row_of(self, path_id: str) -> Optional[int]:
+        return self._index.get(path_id)
+
+    def user_levels(self, skills: Dict[int, float]) -> Dict[int, float]:
+        """User skills ({skill_id: level}) -> {column: level}; skills no path asks for are dropped."""
+        levels: Dict[int, float] = {}
+        for skill_id, level in skills.items():
+            column = self._columns.get(skill_id)
+            if column is not None:
+                levels[column] = max(levels.get(column, 0.0), float(level or 0))
+        return levels
+
+    def score(self, levels: Dict[int, float]) -> array:
+        """Progress (0-1) for every path, in row order."""
+        credit = array("d", bytes(8 * len(self.path_ids)))
+        for column, level in levels.items():
+            rows, required = self._postings[column]
+            for row, needed in zip(rows, required):
+                credit[row] += 1.0 if level >= needed else level / needed
+        inv = self._inv_required
+        # Paths without requirements are complete by definition
+        return array("f", (c * inv[r] if inv[r] else 1.0 for r, c in enumerate(credit)))
+
+    def breakdown(self, row: int, levels: Dict[int, float]) -> Tuple[List[str], List[str]]:
+        """(met, missing) required skills of one path."""
+        met, missing = [], []
+        for column, needed in zip(self._row_skills[row], self._row_levels[row]):
+            (met if levels.get(column, 0.0) >= needed else missing).append(self.skill_names[column])
+        return met, missing
+
+
+@dataclass
+class _UserEntry:
+    version: int
+    fingerprint: int
+    scores: array
+
+
+class CareerProgressService:
+    """
+    Owns the process-wide matrix and a per-user LRU of score vectors.
+
+    A user's entry is keyed by a fingerprint of their skills, so any change
+    to their skills (profile edit, quiz result) is a cache miss without the
+    writers having to know about this cache.
+    """
+    def __init__(self, user_cache_size: int = USER_CACHE_SIZE):
+        self._matrix: Optional[CareerMatrix] = None
+        self._version = 0
+        self._build_lock = asyncio.Lock()
+        self._users: "OrderedDict[str, _UserEntry]" = OrderedDict()
+        self._user_cache_size = user_cache_size
+
+    def invalidate(self) -> None:
+        """Drop the matrix (call after creating, editing or deleting a path)."""
+        self._matrix = None
+        self._users.clear()
+
+    def forget(self, user_id: str) -> None:
+        """Drop one user's scores (their skills changed; the fingerprint would miss anyway)."""
+        self._users.pop(user_id, None)
+
+    async def matrix(self, load) -> CareerMatrix:
+        """`load` is an async callable returning (Sequence[PathRequirements], {skill_id: name})."""
+        current = self._matrix
+        if current is not None and time.monotonic() - current.built_at < MATRIX_TTL_S:
+            return current
+        async with self._build_lock:
+            current = self._matrix
+            if current is None or time.monotonic() - current.built_at >= MATRIX_TTL_S:
+                started = time.perf_counter()
+                self._version += 1
+                paths, skill_names = await load()
+                current = CareerMatrix(paths, skill_names, version=self._version)
+                self._matrix = current
+                self._users.clear()
+                logger.info(
+                    "career_matrix.built",
+                    paths=len(current),
+                    skills=len(current.skill_names),
+                    duration_ms=round((time.perf_counter() - started) * 1000, 2)
+                )
+        return current
+
+    def scores(self, matrix: CareerMatrix, user_id: str, levels: Dict[int, float]) -> array:
+        fingerprint = hash(frozenset(levels.items()))
+        entry = self._users.get(user_id)
+        if entry is not None and entry.version == matrix.version and entry.fingerprint == fingerprint:
+            self._users.move_to_end(user_id)
+            return entry.scores
+
+        scores = matrix.score(levels)
+        self._users[user_id] = _UserEntry(matrix.version, fingerprint, scores)
+        self._users.move_to_end(user_id)
+        while len(self._users) > self._user_cache_size:
+            self._users.popitem(last=False)
+        return scores
+
+
+career_progress = CareerProgressService()
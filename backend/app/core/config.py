@@ -26,6 +26,24 @@ class Settings(BaseSettings):
     
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
 
+    # [OBSERVABILITY] Record the stack of event-loop stalls longer than the threshold
+    # (always on in staging, so blocking regressions show up before production)
+    LOOP_DEBUG: bool = False
+    LOOP_BLOCK_THRESHOLD_MS: int = 100
+
+    # [SECURITY] Users allowed on admin endpoints (e.g. /system/profile); none by default
+    ADMIN_USER_IDS: List[str] = []
+    # [PERFORMANCE] Import endpoint modules on first use and skip the quiz pool warm-up:
+    # faster cold starts for autoscaled / serverless workers, at the cost of a slower
+    # first request per router (python -m bench startup)
+    LAZY_ROUTERS: bool = False
+
+    # [SCALING] Per-worker state that other workers can make stale (see serve.py).
+    # The defaults suit one worker; serve.py tightens both when it starts several:
+    # every answer written through, and cached quiz state re-read after a few seconds
+    ANSWER_FLUSH_BATCH: int = 5
+    QUIZ_SESSION_MAX_AGE_S: int = 30 * 60
+
     @field_validator("SECRET_KEY")
     @classmethod
     def check_min_length_secret(cls, v: str, info) -> str:
@@ -0,0 +1,80 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Hashable
+
+import structlog
+
+logger = structlog.get_logger()
+
+# [PERFORMANCE] Buffered increments are written at most this often, or sooner
+# once this many are waiting
+FLUSH_INTERVAL_S = 2
+FLUSH_THRESHOLD = 500
+
+# write({key: delta}) applies the deltas atomically in the database
+Writer = Callable[[Dict[Hashable, int]], Awaitable[None]]
+
+
+class CounterBuffer:
+    """
+    Process-wide write coalescing for hot counters.
+
+    Increments accumulate in memory per key and are written as one
+    `count = count + n` per key and flush, so a popular row is updated a few
+    times a second however many increments it gets, and never read-modified-
+    written. Several workers each flush their own deltas; the additions
+    commute.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._deltas: Dict[Hashable, int] = {}
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def add(self, key: Hashable, n: int = 1) -> None:
+        self._deltas[key] = self._deltas.get(key, 0) + n
+        self._buffered += abs(n)
+
+    def pending(self, key: Hashable) -> int:
+        """Increments for `key` not written yet (add to the stored count for read-your-writes)."""
+        return self._deltas.get(key, 0)
+
+    def due(self) -> bool:
+        return bool(self._deltas) and (
+            self._buffered >= FLUSH_THRESHOLD or time.monotonic() - self._last_flush >= FLUSH_INTERVAL_S
+        )
+
+    async def flush(self, write: Writer) -> int:
+        """Write every buffered delta. Returns the number of keys written."""
+        async with self._lock:
+            self._last_flush = time.monotonic()
+            deltas, self._deltas, self._buffered = self._deltas, {}, 0
+            deltas = {key: n for key, n in deltas.items() if n}
+            if not deltas:
+                return 0
+            try:
+                await write(deltas)
+            except Exception:
+                # Put them back for the next flush
+                for key, n in deltas.items():
+                    self.add(key, n)
+                raise
+            return len(deltas)
+
+    async def flush_if_due(self, write: Writer) -> None:
+        """Flush from a request when due, so counts also reach the database without the background task."""
+        if self.due():
+            await self.flush(write)
+
+    async def run_flusher(self, write: Writer) -> None:
+        """Background task: flush every FLUSH_INTERVAL_S."""
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL_S)
+            try:
+                await self.flush(write)
+            except Exception as exc:
+                logger.error("counter_buffer.flush_failed", counter=self.name, error=str(exc))
+
+
+endorsement_counts = CounterBuffer("project_endorsements")
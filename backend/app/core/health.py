@@ -0,0 +1,192 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Sequence
+
+import structlog
+
+logger = structlog.get_logger()
+
+# [RESILIENCE] A worker past any of these reports 503 on /system/ready, so
+# load balancers route around it before requests start timing out
+MAX_LOOP_LAG_MS = 250
+MAX_POOL_SATURATION = 0.9
+MAX_IN_FLIGHT = 256
+
+# Dependency probes are reused this long: orchestrator polling costs at most
+# one probe per worker per interval
+PROBE_TTL_S = 5
+PROBE_TIMEOUT_S = 2
+
+# The lag sampler wakes up this often; percentiles cover the last LAG_WINDOW samples (5 min)
+LAG_INTERVAL_S = 0.5
+LAG_WINDOW = 600
+
+# [OBSERVABILITY] Loop debug mode: a loop stalled this long has its stack recorded
+BLOCK_THRESHOLD_MS = 100
+MAX_INCIDENTS = 50
+
+
+class InFlight:
+    """Requests currently being handled by this worker (incremented by the timing middleware)."""
+    def __init__(self):
+        self.count = 0
+        self.peak = 0
+
+    def __enter__(self):
+        self.count += 1
+        self.peak = max(self.peak, self.count)
+        return self
+
+    def __exit__(self, *exc):
+        self.count -= 1
+        return False
+
+
+class LoopLag:
+    """
+    Event-loop scheduling lag: how late a sleep of LAG_INTERVAL_S wakes up.
+    Anything blocking the loop (sync I/O, heavy CPU) shows up here. The last
+    LAG_WINDOW samples are kept for percentiles.
+    """
+    def __init__(self, window: int = LAG_WINDOW):
+        self.last_ms: Optional[float] = None
+        self.max_ms = 0.0
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, lag_ms: float) -> None:
+        self.last_ms = lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+        self._samples.append(lag_ms)
+
+    def percentiles(self, quantiles: Sequence[float] = (0.5, 0.9, 0.99)) -> Dict[float, float]:
+        """Nearest-rank percentiles of the window ({} before the first sample)."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {}
+        return {q: samples[min(int(q * len(samples)), len(samples) - 1)] for q in quantiles}
+
+    async def run(self) -> None:
+        """Background task: sample the lag every LAG_INTERVAL_S."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(LAG_INTERVAL_S)
+            self.record(max(loop.time() - started - LAG_INTERVAL_S, 0.0) * 1000)
+
+
+class BlockingDetector:
+    """
+    Debug watchdog for blocking calls. A task on the loop bumps a heartbeat
+    every few milliseconds; a thread checks it, and when the loop has not
+    come back for `threshold_ms` it records the loop thread's stack at that
+    moment, i.e. the code that is blocking. One incident per stall; the
+    last MAX_INCIDENTS are kept.
+    """
+    def __init__(self, threshold_ms: float = BLOCK_THRESHOLD_MS):
+        self.threshold_ms = threshold_ms
+        self.incidents: Deque[Dict[str, Any]] = deque(maxlen=MAX_INCIDENTS)
+        self.total = 0
+        self._beat = time.monotonic()
+        self._loop_thread: Optional[int] = None
+        self._stop = threading.Event()
+
+    async def run(self) -> None:
+        """Background task: heartbeat on the loop, plus the watchdog thread."""
+        self._loop_thread = threading.get_ident()
+        self._stop.clear()
+        watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        watchdog.start()
+        interval = self.threshold_ms / 4000
+        try:
+            while True:
+                self._beat = time.monotonic()
+                await asyncio.sleep(interval)
+        finally:
+            self._stop.set()
+
+    def _watch(self) -> None:
+        threshold = self.threshold_ms / 1000
+        stalled_since = None
+        while not self._stop.wait(threshold / 2):
+            beat = self._beat
+            blocked = time.monotonic() - beat
+            if blocked < threshold:
+                stalled_since = None
+                continue
+            if stalled_since == beat:
+                continue  # Same stall, already recorded
+            stalled_since = beat
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = traceback.format_stack(frame) if frame is not None else []
+            self.total += 1
+            # blocked_ms: how long the loop had been stuck when the stack was taken
+            self.incidents.append({"at": time.time(), "blocked_ms": round(blocked * 1000, 1), "stack": stack})
+            logger.warning("event_loop.blocked", blocked_ms=round(blocked * 1000, 1),
+                           where=stack[-1].strip() if stack else None)
+
+
+def pool_status(engine) -> Dict[str, Any]:
+    """Checked-out connections against the pool's capacity (size + overflow); pools without a limit report no saturation."""
+    pool = engine.sync_engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    if not hasattr(pool, "checkedout") or not hasattr(pool, "size"):
+        return status
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    # Unlimited overflow (-1) never saturates
+    capacity = pool.size() + max_overflow if max_overflow >= 0 else 0
+    status.update(
+        size=pool.size(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        saturation=round(pool.checkedout() / capacity, 3) if capacity else None,
+    )
+    return status
+
+
+class CachedProbe:
+    """
+    Runs a dependency check at most once per PROBE_TTL_S; concurrent callers
+    share the probe in flight. A probe that raises or times out is "down".
+    """
+    def __init__(self, name: str, check: Callable[[], Awaitable[None]]):
+        self.name = name
+        self._check = check
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def status(self) -> Dict[str, Any]:
+        if self._result is not None and time.monotonic() - self._checked_at < PROBE_TTL_S:
+            return self._result
+        async with self._lock:
+            if self._result is None or time.monotonic() - self._checked_at >= PROBE_TTL_S:
+                started = time.perf_counter()
+                try:
+                    await asyncio.wait_for(self._check(), timeout=PROBE_TIMEOUT_S)
+                    result = {"status": "ok"}
+                except Exception as exc:
+                    logger.error("readiness.probe_failed", dependency=self.name, error=str(exc) or type(exc).__name__)
+                    result = {"status": "down", "error": type(exc).__name__}
+                result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+                self._result, self._checked_at = result, time.monotonic()
+        return self._result
+
+
+def overload_reasons(lag_ms: Optional[float], saturation: Optional[float], in_flight: int) -> list:
+    reasons = []
+    if lag_ms is not None and lag_ms > MAX_LOOP_LAG_MS:
+        reasons.append("event_loop_lag")
+    if saturation is not None and saturation >= MAX_POOL_SATURATION:
+        reasons.append("db_pool_saturated")
+    if in_flight > MAX_IN_FLIGHT:
+        reasons.append("too_many_requests_in_flight")
+    return reasons
+
+
+in_flight = InFlight()
+loop_lag = LoopLag()
+blocking_detector = BlockingDetector()
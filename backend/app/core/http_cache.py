@@ -0,0 +1,200 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set
+
+from fastapi import Request, Response
+from jose import jwt, JWTError
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Conditional GET policy for one route.
+
+    scope: invalidation group. Writes call `response_cache.invalidate(scope)`.
+    per_user: key (and scope) include the caller, e.g. "user:<id>:achievements".
+    max_age: seconds a client may reuse its copy without revalidating.
+    server_ttl: seconds this worker trusts a cached validator. Invalidation is
+                per process, so this bounds staleness when another worker
+                handled the write.
+    public: allow shared caches (only for routes that need no auth).
+    """
+    scope: str
+    max_age: int = 0
+    server_ttl: int = 60
+    per_user: bool = False
+    public: bool = False
+
+    @property
+    def cache_control(self) -> str:
+        visibility = "public" if self.public else "private"
+        return f"{visibility}, max-age={self.max_age}, must-revalidate"
+
+
+@dataclass
+class _Entry:
+    etag: str
+    scope: str
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    In-process LRU of validators (ETags), keyed by request and grouped by scope.
+
+    Only ETags are stored, not bodies, so memory stays small. An ETag is the
+    hash of the response bytes, i.e. a strong validator by construction.
+    """
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._scopes: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at < time.monotonic():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.etag
+
+    def put(self, key: str, scope: str, etag: str, ttl: int) -> None:
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = _Entry(etag=etag, scope=scope, expires_at=time.monotonic() + ttl)
+            self._scopes.setdefault(scope, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+
+    def invalidate(self, scope: str) -> None:
+        """Forget every validator in a scope (call after any write that changes it)."""
+        with self._lock:
+            for key in list(self._scopes.get(scope, ())):
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            keys = self._scopes.get(entry.scope)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._scopes[entry.scope]
+
+
+response_cache = ResponseCache()
+
+
+def user_scope(user_id: str, name: str) -> str:
+    return f"user:{user_id}:{name}"
+
+
+def _token_subject(request: Request) -> Optional[str]:
+    """
+    JWT subject without a DB lookup. Only used to pick a cache key: a 304
+    reveals nothing the caller does not already hold.
+    """
+    auth = request.headers.get("Authorization", "")
+    if not auth.lower().startswith("bearer "):
+        return None
+    try:
+        payload = jwt.decode(auth[7:], settings.SECRET_KEY, algorithms=["HS256"])
+    except JWTError:
+        return None
+    return payload.get("sub")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [t.strip() for t in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class NotModified(Exception):
+    def __init__(self, etag: str, cache_control: str):
+        self.etag = etag
+        self.cache_control = cache_control
+
+
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return Response(status_code=304, headers={"ETag": exc.etag, "Cache-Control": exc.cache_control})
+
+
+def conditional_get(
+    scope: str,
+    max_age: int = 0,
+    server_ttl: int = 60,
+    per_user: bool = False,
+    public: bool = False,
+) -> Callable:
+    """
+    Route dependency enabling ETag / If-None-Match handling.
+
+    Declare it in the route decorator (`dependencies=[Depends(...)]`) so it
+    runs before get_current_user: a revalidation that matches a cached ETag
+    is answered with 304 before any DB work happens.
+    """
+    policy = CachePolicy(scope=scope, max_age=max_age, server_ttl=server_ttl, per_user=per_user, public=public)
+
+    async def dependency(request: Request) -> None:
+        full_scope = policy.scope
+        if policy.per_user:
+            subject = _token_subject(request)
+            if subject is None:
+                # Unauthenticated: let the route reject it normally
+                return
+            full_scope = user_scope(subject, policy.scope)
+
+        query = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+        key = f"{full_scope}|{request.url.path}?{query}"
+        request.state.http_cache = (key, full_scope, policy)
+
+        etag = response_cache.get(key)
+        if etag is not None and _etag_matches(request.headers.get("If-None-Match"), etag):
+            raise NotModified(etag, policy.cache_control)
+
+    return dependency
+
+
+async def etag_middleware(request: Request, call_next):
+    """
+    Tags successful responses of routes using `conditional_get`: computes the
+    ETag from the body, records it, and downgrades to 304 when the client
+    already has this exact representation.
+    """
+    response = await call_next(request)
+    cache_info = getattr(request.state, "http_cache", None)
+    if cache_info is None or request.method != "GET" or response.status_code != 200:
+        return response
+
+    key, scope, policy = cache_info
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    response_cache.put(key, scope, etag, ttl=policy.server_ttl)
+
+    headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+    headers["ETag"] = etag
+    headers["Cache-Control"] = policy.cache_control
+    if _etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": policy.cache_control})
+    return Response(content=body, status_code=200, headers=headers, media_type=response.media_type)
@@ -0,0 +1,177 @@
+import asyncio
+import math
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# [IRT] Rasch (1PL) model: P(correct) = 1 / (1 + exp(-(ability - difficulty))).
+# Abilities and difficulties share one logit scale centred on 0.
+DIFFICULTY_PRIOR = {"Beginner": -1.0, "Intermediate": 0.0, "Advanced": 1.0}
+PRIOR_VARIANCE = 1.0
+# Adaptive sessions stop once the ability estimate is this precise
+TARGET_STANDARD_ERROR = 0.5
+MIN_QUESTIONS = 3
+BANK_TTL_S = 300
+
+
+def p_correct(ability: float, difficulty: float) -> float:
+    return 1.0 / (1.0 + math.exp(difficulty - ability))
+
+
+def information(ability: float, difficulty: float) -> float:
+    """Fisher information of an item at `ability`; largest where P(correct) = 0.5."""
+    p = p_correct(ability, difficulty)
+    return p * (1.0 - p)
+
+
+@dataclass
+class AbilityEstimate:
+    """
+    Gaussian approximation of the posterior over one user's ability.
+
+    Each answer is folded in with one Newton step on the log posterior, so a
+    session keeps two floats however many questions it asks.
+    """
+    ability: float = 0.0
+    variance: float = PRIOR_VARIANCE
+
+    @property
+    def standard_error(self) -> float:
+        return math.sqrt(self.variance)
+
+    def update(self, difficulty: float, correct: bool) -> None:
+        p = p_correct(self.ability, difficulty)
+        precision = 1.0 / self.variance + p * (1.0 - p)
+        self.ability += ((1.0 if correct else 0.0) - p) / precision
+        self.variance = 1.0 / precision
+
+
+@dataclass(frozen=True)
+class Item:
+    id: str
+    difficulty: float
+    label: str  # Authored difficulty level
+    question: dict
+
+
+def next_item(estimate: AbilityEstimate, items: Sequence[Item], asked: Iterable[str]) -> Optional[Item]:
+    """The unasked item with the most information at the current estimate."""
+    asked = set(asked)
+    best, best_info = None, -1.0
+    for item in items:
+        if item.id in asked:
+            continue
+        info = information(estimate.ability, item.difficulty)
+        if info > best_info:
+            best, best_info = item, info
+    return best
+
+
+def expected_score(ability: float, items: Sequence[Item]) -> float:
+    """Expected percentage correct over the whole bank: comparable with fixed-quiz scores."""
+    if not items:
+        return 0.0
+    return 100.0 * sum(p_correct(ability, item.difficulty) for item in items) / len(items)
+
+
+def calibrate(responses: Iterable[Tuple[str, str, bool]], priors: Dict[str, float],
+              iterations: int = 25) -> Dict[str, Tuple[float, int, int]]:
+    """
+    Joint maximum a posteriori estimation of Rasch item difficulties.
+
+    `responses` are (person, item id, correct) triples; `priors` maps item id
+    to its prior difficulty (from the authored level). Abilities get a N(0, 1)
+    prior and difficulties a N(prior, 1) prior, so sparse or all-correct items
+    stay finite and shrink towards their authored level.
+
+    Returns {item id: (difficulty, responses, correct responses)}.
+    """
+    persons: Dict[str, int] = {}
+    items: Dict[str, int] = {}
+    person_of, item_of, outcome = array("I"), array("I"), array("b")
+    for person, item_id, correct in responses:
+        if item_id not in priors:
+            continue
+        person_of.append(persons.setdefault(person, len(persons)))
+        item_of.append(items.setdefault(item_id, len(items)))
+        outcome.append(1 if correct else 0)
+
+    item_ids = list(items)
+    prior = [priors[i] for i in item_ids]
+    ability = [0.0] * len(persons)
+    difficulty = list(prior)
+    item_n, item_correct = [0] * len(items), [0] * len(items)
+    person_correct = [0] * len(persons)
+    for p, i, u in zip(person_of, item_of, outcome):
+        item_n[i] += 1
+        item_correct[i] += u
+        person_correct[p] += u
+
+    for _ in range(iterations):
+        expected_p, info_p = [0.0] * len(persons), [0.0] * len(persons)
+        for p, i in zip(person_of, item_of):
+            prob = p_correct(ability[p], difficulty[i])
+            expected_p[p] += prob
+            info_p[p] += prob * (1.0 - prob)
+        for p in range(len(persons)):
+            gradient = person_correct[p] - expected_p[p] - ability[p] / PRIOR_VARIANCE
+            ability[p] += gradient / (info_p[p] + 1.0 / PRIOR_VARIANCE)
+
+        expected_i, info_i = [0.0] * len(items), [0.0] * len(items)
+        for p, i in zip(person_of, item_of):
+            prob = p_correct(ability[p], difficulty[i])
+            expected_i[i] += prob
+            info_i[i] += prob * (1.0 - prob)
+        for i in range(len(items)):
+            gradient = expected_i[i] - item_correct[i] - (difficulty[i] - prior[i]) / PRIOR_VARIANCE
+            difficulty[i] += gradient / (info_i[i] + 1.0 / PRIOR_VARIANCE)
+
+    return {
+        item_id: (difficulty[i], item_n[i], item_correct[i])
+        for i, item_id in enumerate(item_ids)
+    }
+
+
+@dataclass
+class _Bank:
+    items: Dict[str, List[Item]] = field(default_factory=dict)  # skill -> items
+    built_at: float = 0.0
+
+
+class ItemBank:
+    """
+    Process-wide adaptive item pool: every bank question per skill with its
+    calibrated difficulty, or the authored-level prior until calibrated.
+    """
+    def __init__(self):
+        self._bank: Optional[_Bank] = None
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self._bank = None
+
+    async def items(self, skill_name: str, load) -> List[Item]:
+        """`load` is an async callable returning ({skill: {level: [question]}}, {question id: difficulty})."""
+        bank = self._bank
+        if bank is None or time.monotonic() - bank.built_at >= BANK_TTL_S:
+            async with self._lock:
+                bank = self._bank
+                if bank is None or time.monotonic() - bank.built_at >= BANK_TTL_S:
+                    questions, difficulties = await load()
+                    bank = self._bank = _Bank(built_at=time.monotonic())
+                    for skill, levels in questions.items():
+                        bank.items[skill] = [
+                            Item(q["id"], difficulties.get(q["id"], DIFFICULTY_PRIOR.get(level, 0.0)), level, q)
+                            for level, level_questions in levels.items()
+                            for q in level_questions
+                        ]
+                    logger.info("item_bank.built", skills=len(bank.items), calibrated=len(difficulties))
+        return bank.items.get(skill_name, [])
+
+
+item_bank = ItemBank()
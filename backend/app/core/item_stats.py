@@ -0,0 +1,79 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Sufficient statistics kept per question: every derived figure can be
+# recomputed from them, and two accumulators merge by adding fields, so the
+# batch job can fold in new quizzes without re-reading old ones.
+SUM_FIELDS = ("responses", "correct", "timed_responses", "time_total",
+              "disc_n", "disc_sum_x", "disc_sum_x2", "disc_sum_xy", "disc_sum_y")
+
+
+@dataclass
+class ItemAccumulator:
+    responses: int = 0
+    correct: int = 0
+    option_counts: List[int] = field(default_factory=list)
+    timed_responses: int = 0
+    time_total: float = 0.0
+    # Point-biserial discrimination: y = item correct, x = rest score of the quiz
+    disc_n: int = 0
+    disc_sum_x: float = 0.0
+    disc_sum_x2: float = 0.0
+    disc_sum_xy: float = 0.0
+    disc_sum_y: float = 0.0
+
+    def add(self, option: int, correct: bool, rest_score: Optional[float], seconds: Optional[float]) -> None:
+        self.responses += 1
+        self.correct += 1 if correct else 0
+        if 0 <= option < 64:
+            if option >= len(self.option_counts):
+                self.option_counts.extend([0] * (option + 1 - len(self.option_counts)))
+            self.option_counts[option] += 1
+        if seconds is not None:
+            self.timed_responses += 1
+            self.time_total += seconds
+        if rest_score is not None:
+            y = 1.0 if correct else 0.0
+            self.disc_n += 1
+            self.disc_sum_x += rest_score
+            self.disc_sum_x2 += rest_score * rest_score
+            self.disc_sum_xy += rest_score * y
+            self.disc_sum_y += y
+
+    def merge(self, other: "ItemAccumulator") -> None:
+        for name in SUM_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        if len(other.option_counts) > len(self.option_counts):
+            self.option_counts.extend([0] * (len(other.option_counts) - len(self.option_counts)))
+        for option, count in enumerate(other.option_counts):
+            self.option_counts[option] += count
+
+    @property
+    def p_value(self) -> Optional[float]:
+        """Share of correct responses (classical item difficulty)."""
+        return self.correct / self.responses if self.responses else None
+
+    @property
+    def discrimination(self) -> Optional[float]:
+        """Correlation between answering this item correctly and the rest of the quiz score."""
+        n = self.disc_n
+        var_x = n * self.disc_sum_x2 - self.disc_sum_x ** 2
+        var_y = n * self.disc_sum_y - self.disc_sum_y ** 2  # y is 0/1, so sum(y^2) = sum(y)
+        if n < 2 or var_x <= 0 or var_y <= 0:
+            return None
+        return (n * self.disc_sum_xy - self.disc_sum_x * self.disc_sum_y) / math.sqrt(var_x * var_y)
+
+    @property
+    def mean_time_seconds(self) -> Optional[float]:
+        return self.time_total / self.timed_responses if self.timed_responses else None
+
+    def distractor_rates(self, correct_option: int) -> Dict[int, float]:
+        """Share of all responses that picked each wrong option."""
+        if not self.responses:
+            return {}
+        return {
+            option: count / self.responses
+            for option, count in enumerate(self.option_counts)
+            if option != correct_option
+        }
@@ -0,0 +1,44 @@
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.core.skill_registry import BUILTIN_ALIASES, normalize_skill, skill_registry
+
+# [PERFORMANCE] Quiz content lives in a data file, parsed on first use (or by
+# the lifespan's pool warm-up) instead of being built on import
+BANK_PATH = Path(__file__).resolve().parent.parent / "data" / "question_bank.json"
+
+# skill -> difficulty -> [{id, text, options, correct, topic}]
+QuestionBank = Dict[str, Dict[str, List[dict]]]
+
+_bank = None
+_skills = None  # lookup key (normalize_skill) -> the bank's spelling
+_lock = threading.Lock()
+
+
+def question_bank() -> QuestionBank:
+    """The question bank, loaded once per process. Treat as read-only: it is shared."""
+    global _bank
+    if _bank is None:
+        with _lock:
+            if _bank is None:
+                with open(BANK_PATH, encoding="utf-8") as f:
+                    _bank = json.load(f)
+    return _bank
+
+
+def bank_skill(name: str) -> Optional[str]:
+    """
+    The bank's spelling of a skill name, or None if the bank has no questions
+    for it. Matched like the skill registry (case, whitespace, aliases), so a
+    quiz stored under any spelling of "Python" finds the Python questions.
+    """
+    global _skills
+    if _skills is None:
+        skills = {normalize_skill(skill): skill for skill in question_bank()}
+        for alias, target in BUILTIN_ALIASES.items():
+            if normalize_skill(target) in skills:
+                skills.setdefault(alias, skills[normalize_skill(target)])
+        _skills = skills
+    return _skills.get(normalize_skill(name)) or _skills.get(normalize_skill(skill_registry.canonical(name)))
@@ -0,0 +1,105 @@
+"""
+Quiz assembly from the question bank: sampling, the rendered questions, and
+the pools kept warm. Used by the /quizzes endpoints and the pool filler
+started with the app, so it must not import any endpoint module.
+"""
+import uuid
+import random
+from typing import List, Dict, Optional
+from pydantic_core import to_json
+
+from app.core.question_bank import bank_skill, question_bank
+from app.core.quiz_pool import PoolKey, PooledQuiz
+from app.core.serialization import validate_many
+from app.schemas.quiz import QuizCreate, QuizQuestion
+
+
+def get_questions_for_skill(skill_name: str, difficulty: str, count: int) -> List[Dict]:
+    """Get questions from question bank for a skill and difficulty."""
+    bank = question_bank()
+    skill = bank_skill(skill_name)
+    if skill is None:
+        # If skill not in bank, return general questions
+        return _generate_generic_questions(skill_name, difficulty, count)
+    
+    if difficulty not in bank[skill]:
+        return _generate_generic_questions(skill_name, difficulty, count)
+    
+    available = bank[skill][difficulty]
+    selected = random.sample(available, min(count, len(available)))
+    
+    return selected
+
+
+def _generate_generic_questions(skill_name: str, difficulty: str, count: int) -> List[Dict]:
+    """Generate generic questions for skills not in database."""
+    difficulty_map = {
+        "Beginner": "fundamental",
+        "Intermediate": "practical",
+        "Advanced": "expert"
+    }
+    
+    topics_map = {
+        "Beginner": ["Basics", "Introduction", "Fundamentals", "Getting Started"],
+        "Intermediate": ["Practical Application", "Problem Solving", "Implementation", "Design Patterns"],
+        "Advanced": ["Expert Level", "System Design", "Optimization", "Architecture"]
+    }
+    
+    questions = []
+    for i in range(count):
+        questions.append({
+            "id": f"q_generic_{uuid.uuid4().hex[:8]}",
+            "text": f"In {skill_name} at {difficulty} level, what is the best practice for topic {i+1}?",
+            "options": [
+                f"Best practice for {skill_name} concept A",
+                f"Best practice for {skill_name} concept B",
+                f"Best practice for {skill_name} concept C",
+                f"Best practice for {skill_name} concept D"
+            ],
+            "correct": random.randint(0, 3),
+            "topic": topics_map.get(difficulty, ["General"])[0]
+        })
+    
+    return questions
+
+
+def build_questions(raw: List[Dict], difficulty_level: str, skill_name: str) -> List[QuizQuestion]:
+    """Question payloads -> QuizQuestion models in a single validator call."""
+    return validate_many(QuizQuestion, [
+        {
+            "id": q["id"],
+            "text": q["text"],
+            "options": q["options"],
+            "difficulty_level": difficulty_level,
+            "skill_tested": skill_name,
+            "topic": q.get("topic", "General"),
+        }
+        for q in raw
+    ])
+
+
+def assemble_quiz(key: PoolKey) -> Optional[PooledQuiz]:
+    """Sample and serialize one quiz: run by the pool filler, or inline on a pool miss."""
+    skill_name, difficulty_level, question_count = key
+    questions_list = get_questions_for_skill(skill_name, difficulty_level, question_count)
+    if not questions_list:
+        return None
+    questions_data = {
+        "questions": [
+            {
+                "id": q["id"],
+                "text": q["text"],
+                "options": q["options"],
+                "topic": q.get("topic", "General")
+            }
+            for q in questions_list
+        ]
+    }
+    questions = build_questions(questions_list, difficulty_level, skill_name)
+    return PooledQuiz(questions_data=questions_data, questions_json=to_json(questions))
+
+
+def default_pool_keys() -> List[PoolKey]:
+    """Pools kept warm from startup: every bank skill and level at the default length."""
+    count = QuizCreate.model_fields["question_count"].default
+    return [(skill, level, count) for skill, levels in question_bank().items() for level in levels]
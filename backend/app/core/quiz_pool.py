@@ -0,0 +1,103 @@
+import asyncio
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# [PERFORMANCE] Ready-to-serve quizzes kept per (skill, difficulty, question count)
+POOL_SIZE = 32
+# Distinct keys pooled; the least recently requested one is dropped beyond this
+MAX_KEYS = 256
+# Filler wakes up at least this often even without misses
+FILL_INTERVAL_S = 5
+
+PoolKey = Tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class PooledQuiz:
+    """A pre-assembled quiz: the row's questions_data and the response's questions, already JSON."""
+    questions_data: dict
+    questions_json: bytes
+
+
+class QuizPool:
+    """
+    Process-wide pools of pre-generated quizzes. /quizzes/generate claims one
+    with a deque pop; a background filler tops the pools back up, one quiz
+    per event-loop turn, so a burst of starts never samples or serializes on
+    the request path.
+    """
+    def __init__(self):
+        self._pools: "OrderedDict[PoolKey, Deque[PooledQuiz]]" = OrderedDict()
+        self._wake = asyncio.Event()
+        self.hits = 0
+        self.misses = 0
+
+    def want(self, keys: Iterable[PoolKey]) -> None:
+        """Keep pools for these keys (e.g. every bank skill and level at startup)."""
+        for key in keys:
+            self._pool(key)
+        self._wake.set()
+
+    def _pool(self, key: PoolKey) -> Deque[PooledQuiz]:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = deque(maxlen=POOL_SIZE)
+            if len(self._pools) > MAX_KEYS:
+                self._pools.popitem(last=False)
+        else:
+            self._pools.move_to_end(key)
+        return pool
+
+    def claim(self, key: PoolKey) -> Optional[PooledQuiz]:
+        """A ready quiz for `key`, or None; either way the key's pool is (re)filled in the background."""
+        pool = self._pool(key)
+        self._wake.set()
+        if pool:
+            self.hits += 1
+            return pool.popleft()
+        self.misses += 1
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        return {"keys": len(self._pools), "ready": sum(len(p) for p in self._pools.values()),
+                "hits": self.hits, "misses": self.misses}
+
+    async def fill(self, build: Callable[[PoolKey], Optional[PooledQuiz]]) -> int:
+        """Top every pool up to POOL_SIZE. Returns the number of quizzes built."""
+        built = 0
+        for key in list(self._pools):
+            pool = self._pools.get(key)
+            while pool is not None and len(pool) < POOL_SIZE:
+                quiz = build(key)
+                if quiz is None:
+                    break
+                pool.append(quiz)
+                built += 1
+                # Yield between quizzes: filling never holds the loop for long
+                await asyncio.sleep(0)
+                pool = self._pools.get(key)
+        return built
+
+    async def run_filler(self, build: Callable[[PoolKey], Optional[PooledQuiz]]) -> None:
+        """Background task: refill after claims, and every FILL_INTERVAL_S."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=FILL_INTERVAL_S)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                built = await self.fill(build)
+            except Exception as exc:
+                logger.error("quiz_pool.fill_failed", error=str(exc))
+                continue
+            if built:
+                logger.info("quiz_pool.filled", built=built, **self.stats())
+
+
+quiz_pool = QuizPool()
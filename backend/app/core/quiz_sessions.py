@@ -0,0 +1,101 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+# [PERFORMANCE] Active quizzes stay cached for as long as a quiz lasts
+QUIZ_DURATION_S = 30 * 60
+# ...or at most this long per put: bounds how stale a quiz started or submitted
+# through another worker can look here
+MAX_AGE_S = settings.QUIZ_SESSION_MAX_AGE_S
+MAX_SESSIONS = 10_000
+
+
+@dataclass(frozen=True)
+class QuizSession:
+    """What start / get need of a quiz row, so in-progress reads skip the JSON columns."""
+    id: str
+    user_id: str
+    skill_name: str
+    difficulty_level: str
+    title: str
+    status: str
+    question_count: int
+    created_at: datetime
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    questions: tuple  # questions_data["questions"]
+    answer_key: Dict[str, int]  # This quiz's questions only; /submit grades from it when cached
+    questions_json: Optional[bytes] = None  # The rendered QuizQuestion list, once built
+
+    @classmethod
+    def from_row(cls, quiz, answer_key: Dict[str, int], questions_json: Optional[bytes] = None) -> "QuizSession":
+        return cls(
+            id=quiz.id,
+            user_id=quiz.user_id,
+            skill_name=quiz.skill_name,
+            difficulty_level=quiz.difficulty_level,
+            title=quiz.title,
+            status=quiz.status,
+            question_count=quiz.question_count,
+            created_at=quiz.created_at,
+            started_at=quiz.started_at,
+            completed_at=quiz.completed_at,
+            questions=tuple((quiz.questions_data or {}).get("questions", ())),
+            answer_key=answer_key,
+            questions_json=questions_json,
+        )
+
+
+class QuizSessionCache:
+    """
+    Process-wide, write-through LRU of active quizzes keyed by quiz id.
+
+    Writers on this worker (generate, start) put the new state; submission
+    and adaptive answers evict. An entry lives QUIZ_DURATION_S from the quiz
+    start (or from caching, before it starts), and at most MAX_AGE_S; on a
+    miss or after eviction the caller reads the row again and puts it back.
+    """
+    def __init__(self, max_entries: int = MAX_SESSIONS):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, QuizSession]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, quiz_id: str) -> Optional[QuizSession]:
+        entry = self._entries.get(quiz_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[quiz_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(quiz_id)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, session: QuizSession) -> QuizSession:
+        """Cache an active quiz (completed ones are not cached). Returns `session`."""
+        self._entries.pop(session.id, None)
+        if session.status == "completed":
+            return session
+        ttl = QUIZ_DURATION_S
+        if session.started_at is not None:
+            ttl -= (datetime.utcnow() - session.started_at).total_seconds()
+        ttl = min(ttl, MAX_AGE_S)
+        if ttl > 0:
+            self._entries[session.id] = (time.monotonic() + ttl, session)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return session
+
+    def evict(self, quiz_id: str) -> None:
+        self._entries.pop(quiz_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+quiz_sessions = QuizSessionCache()
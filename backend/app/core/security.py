@@ -1,32 +1,58 @@
 import secrets
 import structlog
 import asyncio
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt
-from passlib.context import CryptContext
 from app.core.config import settings
 from concurrent.futures import ThreadPoolExecutor
 
-pwd_context = CryptContext(
-    schemes=["bcrypt"], 
-    deprecated="auto",
-    bcrypt__rounds=4  # Dev mode: faster hashing. Use 12+ in production
-)
 logger = structlog.get_logger()
 
+_pwd_context = None
+_pwd_context_lock = threading.Lock()
+
+
+def _get_pwd_context():
+    """
+    [PERFORMANCE] passlib and bcrypt are only needed to log in or sign up:
+    import them on first use, not on every worker start.
+    """
+    global _pwd_context
+    if _pwd_context is None:
+        with _pwd_context_lock:
+            if _pwd_context is None:
+                from passlib.context import CryptContext
+                _pwd_context = CryptContext(
+                    schemes=["bcrypt"], 
+                    deprecated="auto",
+                    bcrypt__rounds=4  # Dev mode: faster hashing. Use 12+ in production
+                )
+    return _pwd_context
+
+
+# Run in the executor, so the first call's import does not block the loop either
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return _get_pwd_context().verify(plain_password, hashed_password)
+
+
+def _hash(password: str) -> str:
+    return _get_pwd_context().hash(password)
+
+
 # Thread pool for CPU-intensive password operations
 _executor = ThreadPoolExecutor(max_workers=4)
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Async password verification to avoid blocking event loop"""
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_executor, pwd_context.verify, plain_password, hashed_password)
+    return await loop.run_in_executor(_executor, _verify, plain_password, hashed_password)
 
 async def get_password_hash(password: str) -> str:
     """Async password hashing to avoid blocking event loop"""
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_executor, pwd_context.hash, password)
+    return await loop.run_in_executor(_executor, _hash, password)
 
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -0,0 +1,59 @@
+from functools import lru_cache
+from typing import Any, Iterable, List, Type, TypeVar
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core (Rust) instead of the stdlib `json`.
+
+    Accepts plain data or already-validated models: models are serialized
+    straight to bytes, without an intermediate dict.
+    """
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def validate_many(model: Type[M], rows: Iterable[Any]) -> List[M]:
+    """
+    Build response models for a whole result set in one validator call.
+
+    Replaces `[Model.from_orm(row) for row in rows]`: the list adapter is
+    compiled once per model and reads ORM attributes directly.
+    """
+    return _list_adapter(model).validate_python(rows, from_attributes=True)
+
+
+def respond(content: Any, status_code: int = 200) -> FastJSONResponse:
+    """
+    Return already-validated content as-is.
+
+    FastAPI skips `response_model` validation for Response objects, so the
+    models are validated exactly once (when built) and rendered once. Keep
+    `response_model` on the route for the OpenAPI schema.
+    """
+    return FastJSONResponse(content, status_code=status_code)
+
+
+def respond_spliced(model: BaseModel, **raw_fields: bytes) -> Response:
+    """
+    Respond with `model` plus fields whose JSON was rendered ahead of time
+    (e.g. pre-generated quiz questions): the bytes are spliced in, not
+    parsed and re-serialized.
+    """
+    body = to_json(model, exclude=set(raw_fields))
+    parts = [body[:-1]]
+    for name, value in raw_fields.items():
+        parts.append(b'%s"%s":%s' % (b"," if len(parts) > 1 or len(body) > 2 else b"", name.encode(), value))
+    parts.append(b"}")
+    return Response(b"".join(parts), media_type="application/json")
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from typing import Optional
+
+# [GAPS] A skill is a gap while the user's average quiz score on it stays below this
+GAP_THRESHOLD = 70.0
+# Weight of the latest score in the recent (exponentially weighted) average
+RECENT_WEIGHT = 0.5
+
+OPEN = "open"
+IN_PROGRESS = "in_progress"
+ADDRESSED = "addressed"
+ACTIVE_STATUSES = (OPEN, IN_PROGRESS)
+
+
+def required_level_for(current_level: int) -> int:
+    """Target proficiency when a gap opens: two levels up, at least 5, at most 10."""
+    return min(10, max(current_level + 2, 5))
+
+
+@dataclass
+class GapState:
+    """
+    Running state of one (user, skill) gap, folded one event at a time.
+
+    Transitions:
+      new / addressed -> open         a score below the threshold while the average is below it
+      open <-> in_progress            the recent average is (not) back above the threshold
+      open / in_progress -> addressed the overall average recovers, or the user's
+                                      proficiency reaches the required level
+    """
+    quiz_count: int = 0
+    avg_score: float = 0.0
+    recent_score: float = 0.0
+    current_level: int = 0
+    required_level: int = 0
+    status: Optional[str] = None
+
+    @property
+    def gap_level(self) -> int:
+        return max(self.required_level - self.current_level, 0)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    def add_score(self, score: float) -> None:
+        score = float(score or 0)
+        self.quiz_count += 1
+        self.avg_score += (score - self.avg_score) / self.quiz_count
+        self.recent_score = score if self.quiz_count == 1 else (
+            self.recent_score + RECENT_WEIGHT * (score - self.recent_score)
+        )
+        if self.avg_score >= GAP_THRESHOLD:
+            self.status = ADDRESSED
+        elif self.is_active:
+            self.status = IN_PROGRESS if self.recent_score >= GAP_THRESHOLD else OPEN
+        elif score < GAP_THRESHOLD:
+            self.status = OPEN
+            self.required_level = required_level_for(self.current_level)
+        elif self.status is None:
+            self.status = ADDRESSED
+
+    def set_level(self, level: int) -> None:
+        self.current_level = level or 0
+        if self.is_active and self.current_level >= self.required_level:
+            self.status = ADDRESSED
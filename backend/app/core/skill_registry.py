@@ -0,0 +1,68 @@
+import threading
+from typing import Dict, Iterable, Optional
+
+
+def normalize_skill(name: str) -> str:
+    """Lookup key for a skill name: trimmed, inner whitespace collapsed, case folded."""
+    return " ".join(name.split()).casefold()
+
+
+# [DEFAULTS] Common spellings, applied when the canonical skill exists
+BUILTIN_ALIASES: Dict[str, str] = {
+    "js": "JavaScript",
+    "ecmascript": "JavaScript",
+    "py": "Python",
+    "python3": "Python",
+    "ml": "Machine Learning",
+    "ds": "Data Science",
+    "web dev": "Web Development",
+    "cloud": "Cloud Infra",
+    "cloud infrastructure": "Cloud Infra",
+    "reactjs": "React",
+    "react.js": "React",
+    "pm": "Project Management",
+    "bioinformatics": "Bio-Informatics",
+    "internet of things": "IoT",
+}
+
+
+class SkillRegistry:
+    """
+    In-process view of the `skills` / `skill_aliases` tables.
+
+    Ids never change once assigned, so entries never go stale; a name this
+    worker has not seen yet is a miss and the caller falls back to the DB
+    (see app.crud.skill.resolve_skill_ids).
+    """
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def lookup(self, name: str) -> Optional[int]:
+        return self._ids.get(normalize_skill(name))
+
+    def name_of(self, skill_id: int) -> Optional[str]:
+        return self._names.get(skill_id)
+
+    def canonical(self, name: str) -> str:
+        """Canonical spelling if the skill (or an alias) is known, else the trimmed input."""
+        skill_id = self.lookup(name)
+        return self._names[skill_id] if skill_id is not None else " ".join(name.split())
+
+    def register(self, skill_id: int, name: str, aliases: Iterable[str] = ()) -> None:
+        with self._lock:
+            self._names[skill_id] = name
+            self._ids[normalize_skill(name)] = skill_id
+            for alias in aliases:
+                self._ids[normalize_skill(alias)] = skill_id
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._names.clear()
+            self.loaded = False
+
+
+skill_registry = SkillRegistry()
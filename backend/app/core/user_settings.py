@@ -0,0 +1,95 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+# [STORAGE] Every boolean setting is one bit of UserSettings.flags.
+# Append new settings with new bits; never renumber.
+NOTIFICATION_BITS: Dict[str, int] = {
+    "email_achievements": 1 << 0,
+    "email_mentorship": 1 << 1,
+    "email_courses": 1 << 2,
+    "email_connections": 1 << 3,
+    "push_enabled": 1 << 4,
+}
+PRIVACY_BITS: Dict[str, int] = {
+    "profile_public": 1 << 8,
+    "show_achievements": 1 << 9,
+    "show_projects": 1 << 10,
+    "show_skills": 1 << 11,
+}
+BITS: Dict[str, int] = {**NOTIFICATION_BITS, **PRIVACY_BITS}
+
+# Users without a row have everything switched on
+DEFAULT_FLAGS = sum(BITS.values())
+
+# [PERFORMANCE] Writes on this worker update the cache; other workers see them
+# once their entry expires
+SETTINGS_TTL_S = 60
+MAX_USERS = 50_000
+
+
+def unpack(flags: int, bits: Mapping[str, int]) -> Dict[str, bool]:
+    return {name: bool(flags & bit) for name, bit in bits.items()}
+
+
+def masks(values: Mapping[str, bool]) -> Tuple[int, int]:
+    """(bits to set, bits to clear) for {setting: on}. Unknown names raise KeyError."""
+    set_mask = clear_mask = 0
+    for name, on in values.items():
+        if on:
+            set_mask |= BITS[name]
+        else:
+            clear_mask |= BITS[name]
+    return set_mask, clear_mask
+
+
+def allows(flags: int, name: str) -> bool:
+    """e.g. allows(flags, "email_mentorship") before sending, allows(flags, "show_projects") before showing."""
+    return bool(flags & BITS[name])
+
+
+class UserSettingsCache:
+    """
+    Process-wide LRU of packed settings flags keyed by user id: an int per
+    user, so caching every active user is cheap. Read-through (see
+    app.crud.user_settings); the writer on this worker puts the new flags.
+    """
+    def __init__(self, max_entries: int = MAX_USERS):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+
+    def get(self, user_id: str) -> Optional[int]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return entry[1]
+
+    def get_many(self, user_ids: Iterable[str]) -> Tuple[Dict[str, int], List[str]]:
+        """(cached flags, ids that missed)."""
+        found, missing = {}, []
+        for user_id in user_ids:
+            flags = self.get(user_id)
+            if flags is None:
+                missing.append(user_id)
+            else:
+                found[user_id] = flags
+        return found, missing
+
+    def put(self, user_id: str, flags: int) -> None:
+        self._entries[user_id] = (time.monotonic() + SETTINGS_TTL_S, flags)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+user_settings_cache = UserSettingsCache()
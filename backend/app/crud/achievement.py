@@ -1,11 +1,14 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from app.models.models import Achievement
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import insert, select, desc, update
+from app.models.models import Achievement, AchievementCounter
+from app.core.achievements import triggered
+from app.core.http_cache import response_cache, user_scope
 import uuid
 
 
-def create_achievement(db: Session, user_id: str, title: str, description: str, badge_name: str, icon_url: Optional[str] = None) -> Achievement:
+async def create_achievement(db: AsyncSession, user_id: str, title: str, description: str, badge_name: str, icon_url: Optional[str] = None) -> Achievement:
     achievement = Achievement(
         id=str(uuid.uuid4()),
         user_id=user_id,
@@ -15,23 +18,79 @@ def create_achievement(db: Session, user_id: str, title: str, description: str,
         icon_url=icon_url
     )
     db.add(achievement)
-    db.commit()
-    db.refresh(achievement)
+    await db.commit()
+    await db.refresh(achievement)
+    response_cache.invalidate(user_scope(user_id, "achievements"))
     return achievement
 
 
-def get_user_achievements(db: Session, user_id: str) -> List[Achievement]:
-    return db.query(Achievement).filter(Achievement.user_id == user_id).all()
+async def _increment_counter(db: AsyncSession, user_id: str, counter: str, n: int) -> int:
+    """Atomic `value = value + n`; returns the new value. Creates the counter on first use."""
+    statement = (
+        update(AchievementCounter)
+        .where(AchievementCounter.user_id == user_id, AchievementCounter.counter == counter)
+        .values(value=AchievementCounter.value + n)
+        .returning(AchievementCounter.value)
+        .execution_options(synchronize_session=False)
+    )
+    while True:
+        value = (await db.execute(statement)).scalar()
+        if value is not None:
+            return value
+        try:
+            async with db.begin_nested():
+                db.add(AchievementCounter(user_id=user_id, counter=counter, value=n))
+                await db.flush()
+            return n
+        except IntegrityError:
+            # Created concurrently: increment it instead
+            continue
+
+
+async def apply_counter_deltas(db: AsyncSession, deltas: Dict[Tuple[str, str], int]) -> int:
+    """
+    Add buffered {(user id, counter): n} increments and award every badge
+    whose threshold they cross, in one transaction. Each increment returns
+    its own old -> new range, so even with concurrent flushes a threshold is
+    crossed, and its badge awarded, exactly once. Returns the badges awarded.
+    """
+    awards = []
+    for (user_id, counter), n in deltas.items():
+        value = await _increment_counter(db, user_id, counter, n)
+        for rule in triggered(counter, value - n, value):
+            awards.append({
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "title": rule.title,
+                "description": rule.description,
+                "badge_name": rule.badge_name,
+            })
+    if awards:
+        await db.execute(insert(Achievement), awards)
+    await db.commit()
+    for user_id in {award["user_id"] for award in awards}:
+        response_cache.invalidate(user_scope(user_id, "achievements"))
+    return len(awards)
+
+
+async def get_user_achievements(db: AsyncSession, user_id: str, limit: Optional[int] = None) -> List[Achievement]:
+    query = select(Achievement).where(Achievement.user_id == user_id).order_by(desc(Achievement.earned_at))
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
 
 
-def get_achievement(db: Session, achievement_id: str) -> Optional[Achievement]:
-    return db.query(Achievement).filter(Achievement.id == achievement_id).first()
+async def get_achievement(db: AsyncSession, achievement_id: str) -> Optional[Achievement]:
+    result = await db.execute(select(Achievement).where(Achievement.id == achievement_id))
+    return result.scalars().first()
 
 
-def delete_achievement(db: Session, achievement_id: str) -> bool:
-    achievement = db.query(Achievement).filter(Achievement.id == achievement_id).first()
+async def delete_achievement(db: AsyncSession, achievement_id: str) -> bool:
+    achievement = await get_achievement(db, achievement_id)
     if achievement:
-        db.delete(achievement)
-        db.commit()
+        await db.delete(achievement)
+        await db.commit()
+        response_cache.invalidate(user_scope(achievement.user_id, "achievements"))
         return True
     return False
@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import List, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, select, update
+from app.models.models import AssessmentDefinition
+
+
+async def get_definitions_fingerprint(db: AsyncSession) -> Tuple[int, int, datetime]:
+    """(count, sum of versions, latest update) of the definitions: changes with any insert, edit or delete."""
+    result = await db.execute(
+        select(
+            func.count(AssessmentDefinition.id),
+            func.coalesce(func.sum(AssessmentDefinition.version), 0),
+            func.max(AssessmentDefinition.updated_at),
+        )
+    )
+    return tuple(result.one())
+
+
+async def get_active_definitions(db: AsyncSession) -> List[Tuple[dict, int]]:
+    """[(definition, version)] of the active definitions."""
+    result = await db.execute(
+        select(AssessmentDefinition.content, AssessmentDefinition.version)
+        .where(AssessmentDefinition.is_active.is_(True))
+        .order_by(AssessmentDefinition.id)
+    )
+    return [(content, version) for content, version in result.all()]
+
+
+async def upsert_definition(db: AsyncSession, definition: dict, is_active: bool = True) -> int:
+    """Create or replace a definition; returns its new version."""
+    result = await db.execute(
+        update(AssessmentDefinition)
+        .where(AssessmentDefinition.id == definition["id"])
+        .values(
+            title=definition["title"],
+            content=definition,
+            is_active=is_active,
+            version=AssessmentDefinition.version + 1,
+            updated_at=datetime.utcnow(),
+        )
+        .returning(AssessmentDefinition.version)
+    )
+    version = result.scalar()
+    if version is None:
+        db.add(AssessmentDefinition(
+            id=definition["id"], title=definition["title"], content=definition,
+            is_active=is_active, version=1, updated_at=datetime.utcnow()
+        ))
+        version = 1
+    await db.commit()
+    return version
+
+
+async def seed_definitions(db: AsyncSession, definitions: Sequence[dict]) -> None:
+    """Insert the definitions that do not exist yet (first start; safe to race with other workers)."""
+    existing = set((await db.execute(select(AssessmentDefinition.id))).scalars().all())
+    for definition in definitions:
+        if definition["id"] in existing:
+            continue
+        try:
+            async with db.begin_nested():
+                db.add(AssessmentDefinition(
+                    id=definition["id"], title=definition["title"], content=definition,
+                    version=1, updated_at=datetime.utcnow()
+                ))
+                await db.flush()
+        except IntegrityError:
+            # Seeded concurrently
+            continue
+    await db.commit()
@@ -0,0 +1,79 @@
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.models.models import CareerPath, UserSkill
+from app.core.career_matrix import PathRequirements, career_progress
+from app.crud import skill as skill_crud
+import uuid
+
+
+async def create_career_path(db: AsyncSession, title: str, description: str, target_role: str, industry: str,
+                             required_skills: dict, estimated_months: int, difficulty_level: str) -> CareerPath:
+    # [NORMALIZATION] Intern requirement names so the matrix can key on registry ids
+    await skill_crud.resolve_skill_ids(db, required_skills)
+    path = CareerPath(
+        id=str(uuid.uuid4()),
+        title=title,
+        description=description,
+        target_role=target_role,
+        industry=industry,
+        required_skills=required_skills,
+        estimated_months=estimated_months,
+        difficulty_level=difficulty_level
+    )
+    db.add(path)
+    await db.commit()
+    await db.refresh(path)
+    career_progress.invalidate()
+    return path
+
+
+async def get_career_path(db: AsyncSession, path_id: str) -> Optional[CareerPath]:
+    result = await db.execute(select(CareerPath).where(CareerPath.id == path_id))
+    return result.scalars().first()
+
+
+async def get_career_paths(db: AsyncSession, skip: int = 0, limit: int = 20,
+                           industry: Optional[str] = None) -> List[CareerPath]:
+    query = select(CareerPath)
+    if industry:
+        query = query.where(CareerPath.industry == industry)
+    result = await db.execute(query.order_by(CareerPath.id).offset(skip).limit(limit))
+    return result.scalars().all()
+
+
+async def get_path_requirements(db: AsyncSession) -> Tuple[List[PathRequirements], Dict[int, str]]:
+    """
+    Every path, reduced to the columns the requirement matrix is built from,
+    with requirement names resolved to skill ids. Also returns {skill_id: name}.
+    """
+    result = await db.execute(
+        select(CareerPath.id, CareerPath.title, CareerPath.required_skills, CareerPath.estimated_months)
+        .order_by(CareerPath.id)
+    )
+    rows = result.all()
+    skill_ids = await skill_crud.resolve_skill_ids(
+        db, {name for r in rows for name in (r.required_skills or {})}
+    )
+    # Publishes any name interned above (rows written before the registry existed)
+    await db.commit()
+
+    paths = []
+    for r in rows:
+        required: Dict[int, float] = {}
+        for name, level in (r.required_skills or {}).items():
+            skill_id = skill_ids.get(name)
+            if skill_id is not None:
+                required[skill_id] = max(required.get(skill_id, 0), level or 0)
+        paths.append(PathRequirements(id=r.id, title=r.title, required_skills=required,
+                                      estimated_months=r.estimated_months or 0))
+    names = {skill_id: skill_crud.display_name(db, skill_id, name) for name, skill_id in skill_ids.items()}
+    return paths, names
+
+
+async def get_user_skill_levels(db: AsyncSession, user_id: str) -> Dict[int, int]:
+    result = await db.execute(
+        select(UserSkill.skill_id, UserSkill.proficiency)
+        .where(UserSkill.user_id == user_id, UserSkill.skill_id.is_not(None))
+    )
+    return dict(result.all())
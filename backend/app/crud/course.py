@@ -1,14 +1,18 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.models.models import Course
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.models.models import Course, CourseSkill
+from app.crud import skill as skill_crud
+from app.core.http_cache import response_cache
 import uuid
 
 
-def create_course(db: Session, title: str, description: str, provider: str, url: str, 
-                  difficulty_level: str, duration_hours: int, skills_covered: List[str], 
-                  rating: float = 0.0) -> Course:
+async def create_course(db: AsyncSession, title: str, description: str, provider: str, url: str,
+                        difficulty_level: str, duration_hours: int, skills_covered: List[str],
+                        rating: float = 0.0) -> Course:
+    course_id = str(uuid.uuid4())
     course = Course(
-        id=str(uuid.uuid4()),
+        id=course_id,
         title=title,
         description=description,
         provider=provider,
@@ -19,31 +23,57 @@ def create_course(db: Session, title: str, description: str, provider: str, url:
         rating=rating
     )
     db.add(course)
-    db.commit()
-    db.refresh(course)
+    await db.flush()
+    # [NORMALIZATION] course_skills mirrors the JSON list so skill lookups can use an index
+    course.skills_covered = await skill_crud.sync_skill_links(
+        db, CourseSkill, CourseSkill.course_id, course_id, skills_covered
+    )
+    await db.commit()
+    await db.refresh(course)
+    response_cache.invalidate("courses")
     return course
 
 
-def get_course(db: Session, course_id: str) -> Optional[Course]:
-    return db.query(Course).filter(Course.id == course_id).first()
+async def get_course(db: AsyncSession, course_id: str) -> Optional[Course]:
+    result = await db.execute(select(Course).where(Course.id == course_id))
+    return result.scalars().first()
+
 
+async def get_courses_by_skill(db: AsyncSession, skill_name: str, limit: Optional[int] = None) -> List[Course]:
+    skill_id = await skill_crud.get_skill_id(db, skill_name)
+    if skill_id is None:
+        return []
+    return await get_courses_by_skill_id(db, skill_id, limit)
 
-def get_courses_by_skill(db: Session, skill_name: str) -> List[Course]:
-    return db.query(Course).filter(Course.skills_covered.contains([skill_name])).all()
+
+async def get_courses_by_skill_id(db: AsyncSession, skill_id: int, limit: Optional[int] = None) -> List[Course]:
+    # [PERFORMANCE] Range scan on ix_course_skills_skill_course instead of scanning the JSON column
+    query = (
+        select(Course)
+        .join(CourseSkill, CourseSkill.course_id == Course.id)
+        .where(CourseSkill.skill_id == skill_id)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
 
 
-def get_all_courses(db: Session, skip: int = 0, limit: int = 10) -> List[Course]:
-    return db.query(Course).offset(skip).limit(limit).all()
+async def get_all_courses(db: AsyncSession, skip: int = 0, limit: int = 10) -> List[Course]:
+    result = await db.execute(select(Course).offset(skip).limit(limit))
+    return result.scalars().all()
 
 
-def get_courses_by_difficulty(db: Session, difficulty_level: str) -> List[Course]:
-    return db.query(Course).filter(Course.difficulty_level == difficulty_level).all()
+async def get_courses_by_difficulty(db: AsyncSession, difficulty_level: str) -> List[Course]:
+    result = await db.execute(select(Course).where(Course.difficulty_level == difficulty_level))
+    return result.scalars().all()
 
 
-def update_course_rating(db: Session, course_id: str, new_rating: float) -> Optional[Course]:
-    course = db.query(Course).filter(Course.id == course_id).first()
+async def update_course_rating(db: AsyncSession, course_id: str, new_rating: float) -> Optional[Course]:
+    course = await get_course(db, course_id)
     if course:
         course.rating = new_rating
-        db.commit()
-        db.refresh(course)
+        await db.commit()
+        await db.refresh(course)
+        response_cache.invalidate("courses")
     return course
@@ -0,0 +1,30 @@
+from typing import Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import bindparam, update
+from app.models.models import Project, ProjectEndorsement
+
+
+async def add_endorsement(db: AsyncSession, project_id: str, endorser_id: str) -> bool:
+    """Record an endorsement. False if this user already endorsed the project."""
+    db.add(ProjectEndorsement(project_id=project_id, endorser_id=endorser_id))
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return False
+    return True
+
+
+async def apply_endorsement_counts(db: AsyncSession, deltas: Dict[str, int]) -> None:
+    """
+    Add buffered endorsement deltas to Project.endorsement_count: one atomic
+    `count = count + n` per project, sent as a single executemany.
+    """
+    await db.execute(
+        update(Project.__table__)
+        .where(Project.__table__.c.id == bindparam("project_id"))
+        .values(endorsement_count=Project.__table__.c.endorsement_count + bindparam("delta")),
+        [{"project_id": project_id, "delta": delta} for project_id, delta in deltas.items()]
+    )
+    await db.commit()
@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, select
+from app.models.models import JobWatermark, QuestionStats, Quiz
+from app.core.item_stats import SUM_FIELDS, ItemAccumulator
+
+
+async def get_watermark(db: AsyncSession, job: str) -> Tuple[Optional[datetime], Optional[str]]:
+    watermark = await db.get(JobWatermark, job)
+    if watermark is None:
+        return None, None
+    return watermark.last_completed_at, watermark.last_id
+
+
+async def get_completed_quizzes_after(db: AsyncSession, completed_at: Optional[datetime], quiz_id: Optional[str],
+                                      before: datetime, limit: int) -> List:
+    """
+    Next chunk of completed quizzes in (completed_at, id) order, strictly after
+    the given key. Keyset pagination: each chunk is an index range scan on
+    ix_quizzes_completed_at_id, however deep into the history it starts.
+    """
+    query = (
+        select(Quiz.id, Quiz.completed_at, Quiz.answers_submitted, Quiz.time_taken_seconds, Quiz.answer_log)
+        .where(Quiz.status == "completed", Quiz.completed_at.is_not(None), Quiz.completed_at < before)
+    )
+    if completed_at is not None:
+        query = query.where(or_(
+            Quiz.completed_at > completed_at,
+            and_(Quiz.completed_at == completed_at, Quiz.id > quiz_id),
+        ))
+    result = await db.execute(query.order_by(Quiz.completed_at, Quiz.id).limit(limit))
+    return result.all()
+
+
+def _accumulator(row: QuestionStats) -> ItemAccumulator:
+    acc = ItemAccumulator(option_counts=list(row.option_counts or []))
+    for name in SUM_FIELDS:
+        setattr(acc, name, getattr(row, name) or 0)
+    return acc
+
+
+async def save_chunk(db: AsyncSession, job: str, deltas: Dict[str, ItemAccumulator], skills: Dict[str, str],
+                     answer_key: Dict[str, int], last_completed_at: datetime, last_id: str, rows: int) -> None:
+    """Fold one chunk's per-question deltas into question_stats and advance the watermark, atomically."""
+    existing = {}
+    if deltas:
+        result = await db.execute(select(QuestionStats).where(QuestionStats.question_id.in_(list(deltas))))
+        existing = {row.question_id: row for row in result.scalars()}
+
+    now = datetime.utcnow()
+    for question_id, delta in deltas.items():
+        row = existing.get(question_id)
+        if row is None:
+            row = QuestionStats(question_id=question_id, skill_name=skills.get(question_id, ""))
+            db.add(row)
+            total = delta
+        else:
+            total = _accumulator(row)
+            total.merge(delta)
+        for name in SUM_FIELDS:
+            setattr(row, name, getattr(total, name))
+        row.option_counts = list(total.option_counts)
+        row.p_value = total.p_value
+        row.discrimination = total.discrimination
+        row.mean_time_seconds = total.mean_time_seconds
+        row.distractor_rates = {
+            str(option): rate for option, rate in total.distractor_rates(answer_key.get(question_id, -1)).items()
+        }
+        row.updated_at = now
+
+    watermark = await db.get(JobWatermark, job)
+    if watermark is None:
+        watermark = JobWatermark(job=job, rows_processed=0)
+        db.add(watermark)
+    watermark.last_completed_at = last_completed_at
+    watermark.last_id = last_id
+    watermark.rows_processed = (watermark.rows_processed or 0) + rows
+    watermark.updated_at = now
+    await db.commit()
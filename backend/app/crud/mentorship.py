@@ -1,59 +1,88 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.models.models import Mentorship, User
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from sqlalchemy.orm import selectinload
+from app.models.models import Mentorship, User, UserSkill
+from app.crud import skill as skill_crud
 import uuid
 from datetime import datetime
 
 
-def create_mentorship(db: Session, mentor_id: str, mentee_id: str, skill_focus: str) -> Mentorship:
+async def create_mentorship(db: AsyncSession, mentor_id: str, mentee_id: str, skill_focus: str) -> Mentorship:
+    skill_focus_id = await skill_crud.get_skill_id(db, skill_focus, create=True)
     mentorship = Mentorship(
         id=str(uuid.uuid4()),
         mentor_id=mentor_id,
         mentee_id=mentee_id,
-        skill_focus=skill_focus,
+        skill_focus=skill_crud.display_name(db, skill_focus_id, skill_focus),
+        skill_focus_id=skill_focus_id,
         status="pending"
     )
     db.add(mentorship)
-    db.commit()
-    db.refresh(mentorship)
-    return mentorship
+    await db.commit()
+    return await get_mentorship(db, mentorship.id)
 
 
-def get_mentorship(db: Session, mentorship_id: str) -> Optional[Mentorship]:
-    return db.query(Mentorship).filter(Mentorship.id == mentorship_id).first()
+async def get_mentorship(db: AsyncSession, mentorship_id: str) -> Optional[Mentorship]:
+    # [PERFORMANCE] Responses always embed the mentor: load it eagerly (async sessions cannot lazy load)
+    result = await db.execute(
+        select(Mentorship).options(selectinload(Mentorship.mentor)).where(Mentorship.id == mentorship_id)
+    )
+    return result.scalars().first()
 
 
-def get_mentorships_for_user(db: Session, user_id: str, as_mentee: bool = True) -> List[Mentorship]:
+async def get_mentorships_for_user(db: AsyncSession, user_id: str, as_mentee: bool = True) -> List[Mentorship]:
+    query = select(Mentorship).options(selectinload(Mentorship.mentor))
     if as_mentee:
-        return db.query(Mentorship).filter(Mentorship.mentee_id == user_id).all()
+        query = query.where(Mentorship.mentee_id == user_id)
     else:
-        return db.query(Mentorship).filter(Mentorship.mentor_id == user_id).all()
+        query = query.where(Mentorship.mentor_id == user_id)
+    result = await db.execute(query.order_by(Mentorship.created_at.desc()))
+    return result.scalars().all()
 
 
-def get_available_mentors(db: Session, skill_focus: str) -> List[User]:
+async def get_available_mentors(db: AsyncSession, skill_focus: str) -> List[User]:
     # Returns users with the skill_focus who have capacity for new mentees
-    return db.query(User).join(User.skills).filter(
-        User.skills.any()  # Has skills
-    ).all()
+    skill_id = await skill_crud.get_skill_id(db, skill_focus)
+    if skill_id is None:
+        return []
+    # [PERFORMANCE] Integer match on the (skill_id, user_id) index instead of a name scan
+    result = await db.execute(
+        select(User)
+        .options(selectinload(User.skills))
+        .where(User.id.in_(select(UserSkill.user_id).where(UserSkill.skill_id == skill_id)))
+    )
+    return result.scalars().all()
+
+
+async def get_mentee_counts(db: AsyncSession, mentor_ids: List[str]) -> dict:
+    """Number of mentorships per mentor, in one grouped query."""
+    if not mentor_ids:
+        return {}
+    result = await db.execute(
+        select(Mentorship.mentor_id, func.count())
+        .where(Mentorship.mentor_id.in_(mentor_ids))
+        .group_by(Mentorship.mentor_id)
+    )
+    return dict(result.all())
 
 
-def update_mentorship_status(db: Session, mentorship_id: str, status: str) -> Optional[Mentorship]:
-    mentorship = db.query(Mentorship).filter(Mentorship.id == mentorship_id).first()
+async def update_mentorship_status(db: AsyncSession, mentorship_id: str, status: str) -> Optional[Mentorship]:
+    mentorship = await get_mentorship(db, mentorship_id)
     if mentorship:
         mentorship.status = status
         if status == "active" and mentorship.started_at is None:
             mentorship.started_at = datetime.utcnow()
         elif status == "completed":
             mentorship.ended_at = datetime.utcnow()
-        db.commit()
-        db.refresh(mentorship)
+        await db.commit()
     return mentorship
 
 
-def delete_mentorship(db: Session, mentorship_id: str) -> bool:
-    mentorship = db.query(Mentorship).filter(Mentorship.id == mentorship_id).first()
+async def delete_mentorship(db: AsyncSession, mentorship_id: str) -> bool:
+    mentorship = await get_mentorship(db, mentorship_id)
     if mentorship:
-        db.delete(mentorship)
-        db.commit()
+        await db.delete(mentorship)
+        await db.commit()
         return True
     return False
@@ -1,11 +1,12 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func
 from app.models.models import Notification
 import uuid
 
 
-def create_notification(db: Session, user_id: str, notif_type: str, title: str, message: str, 
-                       related_id: Optional[str] = None) -> Notification:
+async def create_notification(db: AsyncSession, user_id: str, notif_type: str, title: str, message: str,
+                              related_id: Optional[str] = None) -> Notification:
     notification = Notification(
         id=str(uuid.uuid4()),
         user_id=user_id,
@@ -15,45 +16,59 @@ def create_notification(db: Session, user_id: str, notif_type: str, title: str,
         related_id=related_id
     )
     db.add(notification)
-    db.commit()
-    db.refresh(notification)
+    await db.commit()
+    await db.refresh(notification)
     return notification
 
 
-def get_user_notifications(db: Session, user_id: str, skip: int = 0, limit: int = 10) -> List[Notification]:
-    return db.query(Notification).filter(
-        Notification.user_id == user_id
-    ).order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
+async def get_notification(db: AsyncSession, notification_id: str) -> Optional[Notification]:
+    result = await db.execute(select(Notification).where(Notification.id == notification_id))
+    return result.scalars().first()
 
 
-def get_unread_count(db: Session, user_id: str) -> int:
-    return db.query(Notification).filter(
-        Notification.user_id == user_id,
-        Notification.is_read == False
-    ).count()
+async def get_user_notifications(db: AsyncSession, user_id: str, skip: int = 0, limit: int = 10) -> List[Notification]:
+    result = await db.execute(
+        select(Notification)
+        .where(Notification.user_id == user_id)
+        .order_by(Notification.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def get_unread_count(db: AsyncSession, user_id: str) -> int:
+    result = await db.execute(
+        select(func.count()).select_from(Notification).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        )
+    )
+    return result.scalar_one()
 
 
-def mark_as_read(db: Session, notification_id: str) -> Optional[Notification]:
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
+async def mark_as_read(db: AsyncSession, notification_id: str) -> Optional[Notification]:
+    notification = await get_notification(db, notification_id)
     if notification:
         notification.is_read = True
-        db.commit()
-        db.refresh(notification)
+        await db.commit()
+        await db.refresh(notification)
     return notification
 
 
-def mark_multiple_as_read(db: Session, notification_ids: List[str]) -> int:
-    count = db.query(Notification).filter(
-        Notification.id.in_(notification_ids)
-    ).update({"is_read": True})
-    db.commit()
-    return count
+async def mark_multiple_as_read(db: AsyncSession, notification_ids: List[str], user_id: Optional[str] = None) -> int:
+    query = update(Notification).where(Notification.id.in_(notification_ids))
+    if user_id is not None:
+        query = query.where(Notification.user_id == user_id)
+    result = await db.execute(query.values(is_read=True))
+    await db.commit()
+    return result.rowcount
 
 
-def delete_notification(db: Session, notification_id: str) -> bool:
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
+async def delete_notification(db: AsyncSession, notification_id: str) -> bool:
+    notification = await get_notification(db, notification_id)
     if notification:
-        db.delete(notification)
-        db.commit()
+        await db.delete(notification)
+        await db.commit()
         return True
     return False
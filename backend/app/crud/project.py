@@ -1,15 +1,18 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.models.models import Project
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, desc, delete
+from app.models.models import Project, ProjectEndorsement, ProjectSkill
+from app.crud import skill as skill_crud
 import uuid
 from datetime import datetime
 
 
-def create_project(db: Session, user_id: str, title: str, description: str, skills_used: List[str], 
-                   github_url: Optional[str] = None, demo_url: Optional[str] = None, 
-                   image_url: Optional[str] = None, start_date: Optional[datetime] = None) -> Project:
+async def create_project(db: AsyncSession, user_id: str, title: str, description: str, skills_used: List[str],
+                         github_url: Optional[str] = None, demo_url: Optional[str] = None,
+                         image_url: Optional[str] = None, start_date: Optional[datetime] = None) -> Project:
+    project_id = str(uuid.uuid4())
     project = Project(
-        id=str(uuid.uuid4()),
+        id=project_id,
         user_id=user_id,
         title=title,
         description=description,
@@ -20,43 +23,68 @@ def create_project(db: Session, user_id: str, title: str, description: str, skil
         start_date=start_date
     )
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await db.flush()
+    # [NORMALIZATION] project_skills mirrors the JSON list so skill lookups can use an index
+    project.skills_used = await skill_crud.sync_skill_links(
+        db, ProjectSkill, ProjectSkill.project_id, project_id, skills_used
+    )
+    await db.commit()
+    await db.refresh(project)
     return project
 
 
-def get_user_projects(db: Session, user_id: str) -> List[Project]:
-    return db.query(Project).filter(Project.user_id == user_id).all()
+async def get_user_projects(db: AsyncSession, user_id: str, limit: Optional[int] = None) -> List[Project]:
+    query = select(Project).where(Project.user_id == user_id).order_by(desc(Project.created_at))
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def get_projects_by_skill(db: AsyncSession, skill_name: str, limit: Optional[int] = None) -> List[Project]:
+    skill_id = await skill_crud.get_skill_id(db, skill_name)
+    if skill_id is None:
+        return []
+    # [PERFORMANCE] Range scan on ix_project_skills_skill_project instead of scanning the JSON column
+    query = (
+        select(Project)
+        .join(ProjectSkill, ProjectSkill.project_id == Project.id)
+        .where(ProjectSkill.skill_id == skill_id)
+        .order_by(desc(Project.created_at))
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
 
 
-def get_project(db: Session, project_id: str) -> Optional[Project]:
-    return db.query(Project).filter(Project.id == project_id).first()
+async def get_project(db: AsyncSession, project_id: str) -> Optional[Project]:
+    result = await db.execute(select(Project).where(Project.id == project_id))
+    return result.scalars().first()
 
 
-def update_project(db: Session, project_id: str, **kwargs) -> Optional[Project]:
-    project = db.query(Project).filter(Project.id == project_id).first()
+async def update_project(db: AsyncSession, project_id: str, **kwargs) -> Optional[Project]:
+    project = await get_project(db, project_id)
     if project:
         for key, value in kwargs.items():
             if value is not None and hasattr(project, key):
                 setattr(project, key, value)
-        db.commit()
-        db.refresh(project)
+        if kwargs.get("skills_used") is not None:
+            project.skills_used = await skill_crud.sync_skill_links(
+                db, ProjectSkill, ProjectSkill.project_id, project.id, kwargs["skills_used"]
+            )
+        await db.commit()
+        await db.refresh(project)
     return project
 
 
-def delete_project(db: Session, project_id: str) -> bool:
-    project = db.query(Project).filter(Project.id == project_id).first()
+async def delete_project(db: AsyncSession, project_id: str) -> bool:
+    project = await get_project(db, project_id)
     if project:
-        db.delete(project)
-        db.commit()
+        await db.execute(delete(ProjectSkill).where(ProjectSkill.project_id == project_id))
+        await db.execute(delete(ProjectEndorsement).where(ProjectEndorsement.project_id == project_id))
+        await db.delete(project)
+        await db.commit()
         return True
     return False
 
-
-def increment_endorsements(db: Session, project_id: str) -> Optional[Project]:
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if project:
-        project.endorsement_count += 1
-        db.commit()
-        db.refresh(project)
-    return project
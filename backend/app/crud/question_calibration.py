@@ -0,0 +1,33 @@
+from typing import Dict, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, insert, select
+from app.models.models import QuestionCalibration
+from app.core.irt import item_bank
+
+
+async def get_difficulties(db: AsyncSession) -> Dict[str, float]:
+    """{question id: calibrated difficulty}."""
+    result = await db.execute(select(QuestionCalibration.question_id, QuestionCalibration.difficulty))
+    return dict(result.all())
+
+
+async def save_calibrations(db: AsyncSession, calibrations: Dict[str, Tuple[float, int, int]],
+                            skills: Dict[str, str]) -> int:
+    """Replace the stored parameters of every calibrated question (output of irt.calibrate)."""
+    if not calibrations:
+        return 0
+    ids = list(calibrations)
+    await db.execute(delete(QuestionCalibration).where(QuestionCalibration.question_id.in_(ids)))
+    await db.execute(insert(QuestionCalibration), [
+        {
+            "question_id": question_id,
+            "skill_name": skills.get(question_id, ""),
+            "difficulty": difficulty,
+            "responses": responses,
+            "correct_responses": correct,
+        }
+        for question_id, (difficulty, responses, correct) in calibrations.items()
+    ])
+    await db.commit()
+    item_bank.invalidate()
+    return len(ids)
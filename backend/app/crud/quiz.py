@@ -1,8 +1,10 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
-from app.models.models import Quiz, UserSkill, SkillGapRecord
+from sqlalchemy import and_, func, select, desc, update
+from app.models.models import Quiz, SkillGapRecord, UserSkill
+from app.crud import skill as skill_crud, skill_gap as skill_gap_crud
 import uuid
 
 
@@ -13,24 +15,31 @@ async def create_quiz(
     difficulty_level: str,
     question_count: int,
     questions_data: dict,
+    status: str = "not_started",
+    started_at: Optional[datetime] = None,
 ) -> Quiz:
     """Create a new quiz session."""
     quiz_id = f"quiz_{uuid.uuid4().hex[:12]}"
+    skill_id = await skill_crud.get_skill_id(db, skill_name, create=True)
+    skill_name = skill_crud.display_name(db, skill_id, skill_name)
     
     quiz = Quiz(
         id=quiz_id,
         user_id=user_id,
+        skill_id=skill_id,
         skill_name=skill_name,
         difficulty_level=difficulty_level,
         title=f"{skill_name} {difficulty_level} Quiz",
-        status="not_started",
+        status=status,
         question_count=question_count,
         questions_data=questions_data,
+        started_at=started_at,
+        # Set here rather than by the server default: no refresh round trip after the commit
+        created_at=datetime.utcnow(),
     )
     
     db.add(quiz)
     await db.commit()
-    await db.refresh(quiz)
     return quiz
 
 
@@ -40,39 +49,141 @@ async def get_quiz(db: AsyncSession, quiz_id: str) -> Optional[Quiz]:
     return result.scalars().first()
 
 
-async def start_quiz(db: AsyncSession, quiz_id: str) -> Optional[Quiz]:
-    """Start a quiz session."""
-    quiz = await get_quiz(db, quiz_id)
-    if quiz:
-        quiz.status = "in_progress"
-        quiz.started_at = datetime.utcnow()
-        await db.commit()
-        await db.refresh(quiz)
-    return quiz
+async def start_quiz(db: AsyncSession, quiz_id: str, started_at: datetime) -> bool:
+    """Start (or restart) a quiz session. A single UPDATE; False if the quiz is gone or completed."""
+    result = await db.execute(
+        update(Quiz)
+        .where(Quiz.id == quiz_id, Quiz.status != "completed")
+        .values(status="in_progress", started_at=started_at)
+    )
+    await db.commit()
+    return result.rowcount > 0
+
+
+@dataclass
+class QuizSubmission:
+    """Everything submission needs, loaded in one round trip."""
+    quiz: Quiz
+    gap: Optional[SkillGapRecord]  # The user's gap row for the quiz skill, if any
+    current_level: int  # The user's proficiency in the quiz skill
+
+
+async def get_quiz_for_submission(db: AsyncSession, quiz_id: str) -> Optional[QuizSubmission]:
+    """Quiz (row-locked where supported), its gap row and the user's level, in one query."""
+    result = await db.execute(
+        select(Quiz, SkillGapRecord, UserSkill.proficiency)
+        .outerjoin(SkillGapRecord, and_(SkillGapRecord.user_id == Quiz.user_id,
+                                        SkillGapRecord.skill_id == Quiz.skill_id))
+        .outerjoin(UserSkill, and_(UserSkill.user_id == Quiz.user_id, UserSkill.skill_id == Quiz.skill_id))
+        .where(Quiz.id == quiz_id)
+        .with_for_update(of=Quiz)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return QuizSubmission(quiz=row[0], gap=row[1], current_level=row[2] or 0)
 
 
 async def submit_quiz(
     db: AsyncSession,
-    quiz_id: str,
+    submission: QuizSubmission,
     answers: dict,
     correct_count: int,
     time_taken_seconds: int,
-    performance_data: dict
-) -> Optional[Quiz]:
-    """Submit quiz answers and record results."""
-    quiz = await get_quiz(db, quiz_id)
-    if quiz:
-        quiz.status = "completed"
-        quiz.answers_submitted = answers
-        quiz.correct_answers = correct_count
-        quiz.score = (correct_count / quiz.question_count * 100) if quiz.question_count > 0 else 0
-        quiz.time_taken_seconds = time_taken_seconds
-        quiz.performance_data = performance_data
-        quiz.completed_at = datetime.utcnow()
-        
-        await db.commit()
-        await db.refresh(quiz)
-    return quiz
+    performance_data: dict,
+    score: Optional[float] = None,
+    answer_log: Optional[list] = None
+) -> bool:
+    """
+    Record graded results and fold them into the skill gap, in one transaction.
+
+    The quiz UPDATE only matches if the quiz is not completed yet, so of two
+    concurrent submissions exactly one wins; the other gets False and nothing
+    is written.
+    """
+    quiz = submission.quiz
+    if score is None:
+        score = (correct_count / quiz.question_count * 100) if quiz.question_count > 0 else 0
+    values = dict(
+        status="completed",
+        answers_submitted=answers,
+        correct_answers=correct_count,
+        score=score,
+        time_taken_seconds=time_taken_seconds,
+        performance_data=performance_data,
+        completed_at=datetime.utcnow(),
+    )
+    if answer_log is not None:
+        values.update(answer_log=answer_log, answer_log_length=len(answer_log))
+    result = await db.execute(
+        update(Quiz)
+        .where(Quiz.id == quiz.id, Quiz.status != "completed")
+        .values(**values)
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        return False
+
+    # [GAPS] Incremental: one (user, skill) row updated, nothing rescanned
+    if quiz.skill_id is not None:
+        await skill_gap_crud.fold_quiz_score(db, quiz, submission.gap, submission.current_level)
+    await db.commit()
+    return True
+
+
+async def save_answer_log(db: AsyncSession, quiz_id: str, log: list, stored: int) -> Optional[list]:
+    """
+    Write a quiz's buffered answer log, of which the first `stored` entries are
+    already on the row. Guarded on answer_log_length: if another writer
+    appended first, the new entries are rebased onto its log and written again.
+    Returns the log now stored, or None if the quiz is completed or gone.
+    """
+    for _ in range(3):
+        result = await db.execute(
+            update(Quiz)
+            .where(Quiz.id == quiz_id, Quiz.status != "completed",
+                   func.coalesce(Quiz.answer_log_length, 0) == stored)
+            .values(answer_log=log, answer_log_length=len(log))
+        )
+        if result.rowcount:
+            await db.commit()
+            return log
+        row = (await db.execute(
+            select(Quiz.answer_log, Quiz.status).where(Quiz.id == quiz_id)
+        )).first()
+        await db.rollback()
+        if row is None or row.status == "completed":
+            return None
+        current = row.answer_log or []
+        log, stored = current + log[stored:], len(current)
+    raise RuntimeError(f"answer log of {quiz_id} kept changing while writing")
+
+
+async def record_adaptive_answer(
+    db: AsyncSession,
+    submission: QuizSubmission,
+    answers: dict,
+    questions_data: dict
+) -> bool:
+    """
+    Store one adaptive answer and the next question. Guarded on the question
+    count, so a second answer to the same question writes nothing (False).
+    """
+    quiz = submission.quiz
+    result = await db.execute(
+        update(Quiz)
+        .where(Quiz.id == quiz.id, Quiz.status != "completed", Quiz.question_count == quiz.question_count)
+        .values(
+            answers_submitted=answers,
+            questions_data=questions_data,
+            question_count=len(questions_data["questions"]),
+        )
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        return False
+    await db.commit()
+    return True
 
 
 async def get_user_quizzes(
@@ -86,7 +197,10 @@ async def get_user_quizzes(
     query = select(Quiz).where(Quiz.user_id == user_id)
     
     if skill_name:
-        query = query.where(Quiz.skill_name == skill_name)
+        skill_id = await skill_crud.get_skill_id(db, skill_name)
+        if skill_id is None:
+            return []
+        query = query.where(Quiz.skill_id == skill_id)
     
     query = query.order_by(desc(Quiz.created_at)).offset(skip).limit(limit)
     result = await db.execute(query)
@@ -126,93 +240,3 @@ async def get_quiz_statistics(db: AsyncSession, user_id: str) -> dict:
         "lowest_score": min(scores) if scores else None,
         "most_recent_quiz": max([q.created_at for q in quizzes]) if quizzes else None
     }
-
-
-async def identify_skill_gaps(db: AsyncSession, user_id: str) -> List[dict]:
-    """Identify skill gaps based on quiz performance and user skills."""
-    # Get user's current skills
-    user_skills_result = await db.execute(select(UserSkill).where(UserSkill.user_id == user_id))
-    user_skills = user_skills_result.scalars().all()
-    user_skills_dict = {skill.skill_name: skill.proficiency for skill in user_skills}
-    
-    # Get quiz performance for each skill
-    quiz_performance = {}
-    quizzes_result = await db.execute(
-        select(Quiz).where(
-            Quiz.user_id == user_id,
-            Quiz.status == "completed"
-        )
-    )
-    quizzes = quizzes_result.scalars().all()
-    
-    for quiz in quizzes:
-        if quiz.skill_name not in quiz_performance:
-            quiz_performance[quiz.skill_name] = []
-        quiz_performance[quiz.skill_name].append(quiz.score)
-    
-    # Identify gaps
-    skill_gaps = []
-    
-    # For skills with poor quiz performance
-    for skill_name, scores in quiz_performance.items():
-        avg_score = sum(scores) / len(scores) if scores else 0
-        current_level = user_skills_dict.get(skill_name, 0)
-        
-        # If average score is below 70%, there's a gap
-        if avg_score < 70:
-            required_level = min(10, max(current_level + 2, 5))
-            
-            gap = {
-                "skill_name": skill_name,
-                "current_level": current_level,
-                "required_level": required_level,
-                "gap_level": required_level - current_level,
-                "avg_score": avg_score
-            }
-            skill_gaps.append(gap)
-    
-    # Sort by gap level (highest priority first)
-    skill_gaps.sort(key=lambda x: x["gap_level"], reverse=True)
-    
-    return skill_gaps
-
-
-async def record_skill_gap(
-    db: AsyncSession,
-    user_id: str,
-    skill_name: str,
-    current_level: int,
-    required_level: int,
-    source: str,
-    source_id: Optional[str] = None
-) -> SkillGapRecord:
-    """Record a identified skill gap."""
-    gap_id = f"gap_{uuid.uuid4().hex[:12]}"
-    
-    gap_record = SkillGapRecord(
-        id=gap_id,
-        user_id=user_id,
-        skill_name=skill_name,
-        current_level=current_level,
-        required_level=required_level,
-        source=source,
-        source_id=source_id,
-    )
-    
-    db.add(gap_record)
-    await db.commit()
-    await db.refresh(gap_record)
-    return gap_record
-
-
-async def get_user_skill_gaps(db: AsyncSession, user_id: str) -> List[SkillGapRecord]:
-    """Get all identified skill gaps for a user."""
-    result = await db.execute(
-        select(SkillGapRecord)
-        .where(
-            SkillGapRecord.user_id == user_id,
-            SkillGapRecord.status == "open"
-        )
-        .order_by(desc(SkillGapRecord.identified_at))
-    )
-    return result.scalars().all()
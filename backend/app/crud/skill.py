@@ -0,0 +1,176 @@
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.orm import Session
+from app.models.models import Skill, SkillAlias
+from app.core.skill_registry import BUILTIN_ALIASES, normalize_skill, skill_registry
+
+
+# [CONSISTENCY] Skills interned inside a transaction are only published to the
+# process-wide registry once it commits; a rollback must not leave dangling ids.
+_PENDING = "pending_skills"
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_skills(session: Session) -> None:
+    for skill_id, name in session.info.pop(_PENDING, {}).values():
+        skill_registry.register(skill_id, name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_skills(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+
+def _lookup(db: AsyncSession, name: str) -> Optional[int]:
+    skill_id = skill_registry.lookup(name)
+    if skill_id is None:
+        pending = db.info.get(_PENDING, {}).get(normalize_skill(name))
+        skill_id = pending[0] if pending else None
+    return skill_id
+
+
+async def load_skill_registry(db: AsyncSession) -> None:
+    """Fill the in-process registry with every skill and alias (two queries)."""
+    skills = await db.execute(select(Skill.id, Skill.name))
+    for skill_id, name in skills:
+        skill_registry.register(skill_id, name)
+    aliases = await db.execute(select(SkillAlias.alias, SkillAlias.skill_id))
+    for alias, skill_id in aliases:
+        skill_registry.register(skill_id, skill_registry.name_of(skill_id) or alias, aliases=[alias])
+    skill_registry.loaded = True
+
+
+async def _fetch(db: AsyncSession, keys: Iterable[str]) -> None:
+    """Pull rows for keys this worker has not seen (e.g. created by another worker)."""
+    keys = list(keys)
+    if not keys:
+        return
+    skills = await db.execute(select(Skill.id, Skill.name).where(Skill.normalized_name.in_(keys)))
+    for skill_id, name in skills:
+        skill_registry.register(skill_id, name)
+    aliases = await db.execute(
+        select(SkillAlias.alias, Skill.id, Skill.name)
+        .join(Skill, Skill.id == SkillAlias.skill_id)
+        .where(SkillAlias.alias.in_(keys))
+    )
+    for alias, skill_id, name in aliases:
+        skill_registry.register(skill_id, name, aliases=[alias])
+
+
+# Canonical spellings of the BUILTIN_ALIASES targets, by lookup key
+_BUILTIN_NAMES = {normalize_skill(name): name for name in BUILTIN_ALIASES.values()}
+
+
+def _target(db: AsyncSession, name: str) -> str:
+    """The name to resolve `name` as: its BUILTIN_ALIASES target while no skill is spelled like the alias."""
+    if _lookup(db, name) is None:
+        return BUILTIN_ALIASES.get(normalize_skill(name), name)
+    return name
+
+
+async def resolve_skill_ids(db: AsyncSession, names: Iterable[str], create: bool = True) -> Dict[str, int]:
+    """
+    Map skill names to registry ids, interning unknown names when `create`.
+
+    Names are matched case-insensitively and through aliases, so "python",
+    " Python " and "py" all resolve to the same id. BUILTIN_ALIASES apply
+    without alias rows, and a new skill spelled like one of their targets is
+    interned with the target's spelling. Names that stay unknown
+    (create=False) are left out of the result. Does not commit.
+    """
+    if not skill_registry.loaded:
+        await load_skill_registry(db)
+
+    names = [n for n in dict.fromkeys(names) if n and n.strip()]
+    missing = {normalize_skill(n) for n in names if _lookup(db, n) is None}
+    missing |= {normalize_skill(BUILTIN_ALIASES[key]) for key in missing if key in BUILTIN_ALIASES}
+    await _fetch(db, missing)
+    targets = {name: _target(db, name) for name in names}
+
+    if create:
+        for name in dict.fromkeys(targets.values()):
+            if _lookup(db, name) is not None:
+                continue
+            display = " ".join(name.split())
+            display = _BUILTIN_NAMES.get(normalize_skill(display), display)
+            try:
+                async with db.begin_nested():
+                    skill = Skill(name=display, normalized_name=normalize_skill(display))
+                    db.add(skill)
+                    await db.flush()
+                db.info.setdefault(_PENDING, {})[skill.normalized_name] = (skill.id, skill.name)
+            except IntegrityError:
+                # Interned concurrently by another request or worker
+                await _fetch(db, [normalize_skill(display)])
+
+    resolved = {}
+    for name in names:
+        skill_id = _lookup(db, targets[name])
+        if skill_id is not None:
+            resolved[name] = skill_id
+    return resolved
+
+
+def display_name(db: AsyncSession, skill_id: int, fallback: str) -> str:
+    """Canonical spelling for an id returned by resolve_skill_ids."""
+    name = skill_registry.name_of(skill_id)
+    if name is None:
+        name = next((n for i, n in db.info.get(_PENDING, {}).values() if i == skill_id), None)
+    return name or " ".join(fallback.split())
+
+
+async def get_skill_id(db: AsyncSession, name: str, create: bool = False) -> Optional[int]:
+    return (await resolve_skill_ids(db, [name], create=create)).get(name)
+
+
+async def sync_skill_links(db: AsyncSession, link_model, entity_column, entity_id: str,
+                           names: Iterable[str]) -> List[str]:
+    """
+    Make the association rows (CourseSkill, ProjectSkill) of one entity match
+    `names`, touching only the skills that changed. The entity row must already
+    be flushed. Returns the canonical, de-duplicated names. Does not commit.
+    """
+    names = list(names or [])
+    ids = await resolve_skill_ids(db, names)
+    wanted: Dict[int, str] = {}
+    for name in names:
+        if name in ids:
+            wanted.setdefault(ids[name], display_name(db, ids[name], name))
+
+    result = await db.execute(select(link_model.skill_id).where(entity_column == entity_id))
+    current = set(result.scalars())
+    stale = current - wanted.keys()
+    if stale:
+        await db.execute(delete(link_model).where(entity_column == entity_id, link_model.skill_id.in_(stale)))
+    added = [skill_id for skill_id in wanted if skill_id not in current]
+    if added:
+        await db.execute(insert(link_model), [{entity_column.key: entity_id, "skill_id": s} for s in added])
+    return list(wanted.values())
+
+
+async def add_alias(db: AsyncSession, alias: str, skill_id: int) -> None:
+    """Make `alias` resolve to `skill_id`. Does not commit."""
+    key = normalize_skill(alias)
+    existing = await db.get(SkillAlias, key)
+    if existing is None:
+        db.add(SkillAlias(alias=key, skill_id=skill_id))
+    else:
+        existing.skill_id = skill_id
+    await db.flush()
+    if skill_registry.name_of(skill_id) is not None:
+        skill_registry.register(skill_id, skill_registry.name_of(skill_id), aliases=[key])
+
+
+async def ensure_builtin_aliases(db: AsyncSession) -> int:
+    """Create BUILTIN_ALIASES rows whose canonical skill exists. Returns how many were added."""
+    targets = await resolve_skill_ids(db, set(BUILTIN_ALIASES.values()), create=False)
+    existing = set((await db.execute(select(SkillAlias.alias))).scalars())
+    added = 0
+    for alias, canonical in BUILTIN_ALIASES.items():
+        # A real skill already spelled like the alias wins; leave it alone
+        if canonical in targets and alias not in existing and skill_registry.lookup(alias) is None:
+            await add_alias(db, alias, targets[canonical])
+            added += 1
+    return added
@@ -0,0 +1,119 @@
+from dataclasses import fields
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, desc, update
+from app.models.models import Quiz, SkillGapRecord
+from app.core.skill_gaps import ACTIVE_STATUSES, GapState
+import uuid
+
+_STATE_FIELDS = [f.name for f in fields(GapState)]
+
+
+def _state_of(record: SkillGapRecord) -> GapState:
+    return GapState(
+        quiz_count=record.quiz_count or 0,
+        avg_score=record.avg_score or 0.0,
+        recent_score=record.recent_score or 0.0,
+        current_level=record.current_level or 0,
+        required_level=record.required_level or 0,
+        status=record.status,
+    )
+
+
+def _write(record: SkillGapRecord, state: GapState) -> None:
+    for name in _STATE_FIELDS:
+        setattr(record, name, getattr(state, name))
+    record.updated_at = datetime.utcnow()
+
+
+async def _get_record(db: AsyncSession, user_id: str, skill_id: int) -> Optional[SkillGapRecord]:
+    # [CONSISTENCY] Row lock (where supported) so concurrent submissions don't lose an update
+    result = await db.execute(
+        select(SkillGapRecord)
+        .where(SkillGapRecord.user_id == user_id, SkillGapRecord.skill_id == skill_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
+
+
+def _gap_values(state: GapState, source_id: str) -> dict:
+    values = {name: getattr(state, name) for name in _STATE_FIELDS}
+    values.update(source="quiz", source_id=source_id, updated_at=datetime.utcnow())
+    return values
+
+
+async def fold_quiz_score(db: AsyncSession, quiz: Quiz, gap: Optional[SkillGapRecord], current_level: int) -> None:
+    """
+    Fold a completed quiz into the user's gap row for its skill. Does not commit.
+
+    `gap` and `current_level` come preloaded with the quiz (see
+    quiz_crud.get_quiz_for_submission), so the common case is a single
+    UPDATE, guarded on quiz_count: if another submission for the same skill
+    got in first, the row is re-read under lock and the score folded again.
+    """
+    if gap is None:
+        state = GapState(current_level=current_level or 0)
+        state.add_score(quiz.score)
+        try:
+            async with db.begin_nested():
+                db.add(SkillGapRecord(id=f"gap_{uuid.uuid4().hex[:12]}", user_id=quiz.user_id,
+                                      skill_id=quiz.skill_id, skill_name=quiz.skill_name,
+                                      **_gap_values(state, quiz.id)))
+                await db.flush()
+            return
+        except IntegrityError:
+            # Created concurrently by another quiz on this skill
+            gap = await _get_record(db, quiz.user_id, quiz.skill_id)
+
+    state = _state_of(gap)
+    state.add_score(quiz.score)
+    result = await db.execute(
+        update(SkillGapRecord)
+        .where(SkillGapRecord.id == gap.id, SkillGapRecord.quiz_count == gap.quiz_count)
+        .values(**_gap_values(state, quiz.id))
+    )
+    if result.rowcount == 0:
+        gap = await _get_record(db, quiz.user_id, quiz.skill_id)
+        state = _state_of(gap)
+        state.add_score(quiz.score)
+        _write(gap, state)
+        gap.source, gap.source_id = "quiz", quiz.id
+
+
+async def set_skill_levels(db: AsyncSession, user_id: str, levels: Dict[int, int]) -> None:
+    """Propagate proficiency changes ({skill_id: level}, 0 = removed) to existing gap rows. Does not commit."""
+    if not levels:
+        return
+    result = await db.execute(
+        select(SkillGapRecord)
+        .where(SkillGapRecord.user_id == user_id, SkillGapRecord.skill_id.in_(levels))
+        .with_for_update()
+    )
+    for record in result.scalars():
+        state = _state_of(record)
+        state.set_level(levels[record.skill_id])
+        _write(record, state)
+
+
+async def get_skill_gaps(db: AsyncSession, user_id: str) -> List[dict]:
+    """Open and in-progress gaps, largest first. An indexed read of the materialized rows."""
+    result = await db.execute(
+        select(SkillGapRecord)
+        .where(SkillGapRecord.user_id == user_id, SkillGapRecord.status.in_(ACTIVE_STATUSES))
+        .order_by(desc(SkillGapRecord.required_level - SkillGapRecord.current_level), SkillGapRecord.skill_id)
+    )
+    return [
+        {
+            "skill_id": record.skill_id,
+            "skill_name": record.skill_name,
+            "current_level": record.current_level,
+            "required_level": record.required_level,
+            "gap_level": max(record.required_level - record.current_level, 0),
+            "avg_score": record.avg_score,
+            "status": record.status,
+        }
+        for record in result.scalars()
+    ]
@@ -1,9 +1,11 @@
-from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from typing import Dict, List, Optional
+from sqlalchemy import delete, insert, select
 from app.models.models import User
 from app.schemas.user import UserCreate
 from app.core import security
+from app.core.career_matrix import career_progress
+from app.core.http_cache import response_cache, user_scope
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     # [PERFORMANCE] Index usage on email is critical (defined in model)
@@ -32,6 +34,7 @@ async def create_user(db: AsyncSession, user_in: UserCreate, user_id: str) -> Us
 
 from app.models.models import User, UserSkill
 from app.schemas.user import UserUpdate
+from app.crud import skill as skill_crud, skill_gap as skill_gap_crud
 
 async def update_user(db: AsyncSession, db_user: User, user_in: UserUpdate) -> User:
     update_data = user_in.model_dump(exclude_unset=True)
@@ -42,17 +45,66 @@ async def update_user(db: AsyncSession, db_user: User, user_in: UserUpdate) -> U
             setattr(db_user, field, update_data[field])
 
     # Update Skills
+    skills_changed = False
     if 'skills' in update_data and update_data['skills'] is not None:
-        # Ensure collection is loaded
-        await db.refresh(db_user, attribute_names=["skills"])
-        # Clear existing keys explicitly if needed, but managing the list is enough with cascade
-        # Simpler approach: Re-create list
-        new_skills_list = []
-        for skill_name in update_data['skills']:
-             new_skills_list.append(UserSkill(skill_name=skill_name, proficiency=5, verified=False))
-        db_user.skills = new_skills_list
+        skills_changed = await _sync_user_skills(db, db_user.id, update_data['skills'])
 
     db.add(db_user)
     await db.commit()
     await db.refresh(db_user, attribute_names=["skills"])
+    response_cache.invalidate(user_scope(db_user.id, "profile"))
+    if skills_changed:
+        _skills_changed(db_user.id)
     return db_user
+
+
+# Level given to a skill added from the profile form
+DEFAULT_PROFICIENCY = 5
+
+
+async def _sync_user_skills(db: AsyncSession, user_id: str, names: List[str]) -> bool:
+    """
+    Make the user's skill rows match `names`: insert the added skills, delete
+    the removed ones and leave the rest (and their proficiency and verified
+    flag) untouched, in at most two bulk statements. Returns whether anything
+    changed. Does not commit.
+    """
+    # [NORMALIZATION] "js" and "JavaScript" are one skill: dedupe on the registry id
+    skill_ids = await skill_crud.resolve_skill_ids(db, names)
+    wanted: Dict[int, str] = {}
+    for name in names:
+        if name in skill_ids:
+            wanted.setdefault(skill_ids[name], skill_crud.display_name(db, skill_ids[name], name))
+
+    result = await db.execute(select(UserSkill.id, UserSkill.skill_id).where(UserSkill.user_id == user_id))
+    kept = set()
+    stale_rows = []
+    removed = set()
+    for row_id, skill_id in result.all():
+        # Unresolved and duplicate rows go too
+        if skill_id in wanted and skill_id not in kept:
+            kept.add(skill_id)
+        else:
+            stale_rows.append(row_id)
+            if skill_id is not None and skill_id not in wanted:
+                removed.add(skill_id)
+    added = [skill_id for skill_id in wanted if skill_id not in kept]
+
+    if stale_rows:
+        await db.execute(delete(UserSkill).where(UserSkill.id.in_(stale_rows)))
+    if added:
+        await db.execute(insert(UserSkill), [
+            {"user_id": user_id, "skill_id": skill_id, "skill_name": wanted[skill_id],
+             "proficiency": DEFAULT_PROFICIENCY, "verified": False}
+            for skill_id in added
+        ])
+    # [GAPS] Removed skills drop to level 0; gap rows track the new levels
+    levels = {skill_id: 0 for skill_id in removed}
+    levels.update({skill_id: DEFAULT_PROFICIENCY for skill_id in added})
+    await skill_gap_crud.set_skill_levels(db, user_id, levels)
+    return bool(stale_rows or added)
+
+
+def _skills_changed(user_id: str) -> None:
+    """[EVENTS] Once per save that changed the user's skills: drop what was derived from them."""
+    career_progress.forget(user_id)
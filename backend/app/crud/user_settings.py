@@ -0,0 +1,65 @@
+from typing import Dict, Iterable
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update
+from app.models.models import UserSettings
+from app.core.user_settings import DEFAULT_FLAGS, user_settings_cache
+
+# Keeps the IN list well under SQLite's bound-parameter limit
+_BATCH = 500
+
+
+async def get_settings_for_users(db: AsyncSession, user_ids: Iterable[str]) -> Dict[str, int]:
+    """
+    Packed settings flags of many users, e.g. every recipient of a
+    notification: cached users cost nothing, the rest one query per 500.
+    Users without a row get DEFAULT_FLAGS.
+    """
+    found, missing = user_settings_cache.get_many(dict.fromkeys(user_ids))
+    for start in range(0, len(missing), _BATCH):
+        batch = missing[start:start + _BATCH]
+        result = await db.execute(
+            select(UserSettings.user_id, UserSettings.flags).where(UserSettings.user_id.in_(batch))
+        )
+        stored = dict(result.all())
+        for user_id in batch:
+            flags = stored.get(user_id, DEFAULT_FLAGS)
+            user_settings_cache.put(user_id, flags)
+            found[user_id] = flags
+    return found
+
+
+async def get_settings(db: AsyncSession, user_id: str) -> int:
+    return (await get_settings_for_users(db, [user_id]))[user_id]
+
+
+async def update_settings(db: AsyncSession, user_id: str, set_mask: int, clear_mask: int) -> int:
+    """
+    Atomically `flags = (flags | set_mask) & ~clear_mask`, creating the row
+    from the defaults on first save, and commit. Only the given bits change,
+    so concurrent notification and privacy updates do not overwrite each
+    other. Returns the new flags.
+    """
+    statement = (
+        update(UserSettings)
+        .where(UserSettings.user_id == user_id)
+        .values(flags=UserSettings.flags.op("|")(set_mask).op("&")(~clear_mask))
+        .returning(UserSettings.flags)
+        .execution_options(synchronize_session=False)
+    )
+    while True:
+        flags = (await db.execute(statement)).scalar()
+        if flags is not None:
+            break
+        try:
+            flags = (DEFAULT_FLAGS | set_mask) & ~clear_mask
+            async with db.begin_nested():
+                db.add(UserSettings(user_id=user_id, flags=flags))
+                await db.flush()
+            break
+        except IntegrityError:
+            # Created concurrently: update it instead
+            continue
+    await db.commit()
+    user_settings_cache.put(user_id, flags)
+    return flags
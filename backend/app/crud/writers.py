@@ -0,0 +1,30 @@
+from typing import Dict, Optional
+import structlog
+
+from app.core import db
+from app.crud import achievement as achievement_crud, endorsement as endorsement_crud, quiz as quiz_crud
+
+logger = structlog.get_logger()
+
+# Writers for the process-wide buffers in app.core: each opens its own session,
+# as flushes also run in background tasks and on shutdown, outside any request
+
+
+async def write_answer_log(quiz_id: str, log: list, stored: int) -> Optional[list]:
+    """Writer for answer_buffer (app.core.answer_buffer)."""
+    async with db.AsyncSessionLocal() as session:
+        return await quiz_crud.save_answer_log(session, quiz_id, log, stored)
+
+
+async def write_endorsement_counts(deltas: Dict[str, int]) -> None:
+    """Writer for endorsement_counts (app.core.counters)."""
+    async with db.AsyncSessionLocal() as session:
+        await endorsement_crud.apply_endorsement_counts(session, deltas)
+
+
+async def write_achievement_counters(deltas: dict) -> None:
+    """Writer for achievement_counters (app.core.achievements)."""
+    async with db.AsyncSessionLocal() as session:
+        awarded = await achievement_crud.apply_counter_deltas(session, deltas)
+    if awarded:
+        logger.info("achievements.awarded", count=awarded, counters=len(deltas))
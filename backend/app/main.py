@@ -1,10 +1,20 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import structlog
 import time
-from app.core import errors
-from app.api.endpoints import system, users, auth, assessments, achievements, projects, courses, mentorship, notifications, quiz, settings
+from app.core import errors, http_cache
+from app.core.answer_buffer import answer_buffer
+from app.core.quiz_assembly import assemble_quiz, default_pool_keys
+from app.core.quiz_pool import quiz_pool
+from app.core.counters import endorsement_counts
+from app.core.achievements import achievement_counters
+from app.core.health import blocking_detector, in_flight, loop_lag
+from app.core.serialization import FastJSONResponse
+from app.api.routers import include_routers
 from app.core.config import settings
+from app.crud.writers import write_achievement_counters, write_answer_log, write_endorsement_counts
 
 # [OBSERVABILITY] Configure structlog (simplified setup)
 structlog.configure(
@@ -17,12 +27,50 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    # [PERFORMANCE] Background writes of buffered quiz answers; the rest are written on shutdown
+    flusher = asyncio.create_task(answer_buffer.run_flusher(write_answer_log))
+    # [PERFORMANCE] Pre-generated quizzes for /quizzes/generate
+    # (LAZY_ROUTERS: not at startup, which would load the question bank; a key's
+    # first claim starts its pool)
+    if not settings.LAZY_ROUTERS:
+        quiz_pool.want(default_pool_keys())
+    filler = asyncio.create_task(quiz_pool.run_filler(assemble_quiz))
+    # [PERFORMANCE] Coalesced endorsement counts
+    counter_flusher = asyncio.create_task(endorsement_counts.run_flusher(write_endorsement_counts))
+    # [ACHIEVEMENTS] Counter increments from domain events, and the badges they earn
+    achievement_flusher = asyncio.create_task(achievement_counters.run_flusher(write_achievement_counters))
+    # [RESILIENCE] Event-loop lag for /system/ready
+    lag_sampler = asyncio.create_task(loop_lag.run())
+    # [OBSERVABILITY] Stack traces of blocking calls, exported on /system/metrics
+    watchdog = None
+    if settings.LOOP_DEBUG or settings.ENVIRONMENT == "staging":
+        blocking_detector.threshold_ms = settings.LOOP_BLOCK_THRESHOLD_MS
+        watchdog = asyncio.create_task(blocking_detector.run())
+    yield
+    lag_sampler.cancel()
+    if watchdog is not None:
+        watchdog.cancel()
+    flusher.cancel()
+    filler.cancel()
+    counter_flusher.cancel()
+    achievement_flusher.cancel()
+    await endorsement_counts.flush(write_endorsement_counts)
+    await achievement_counters.flush(write_achievement_counters)
+    await answer_buffer.flush_due(write_answer_log, force=True)
+
+
 def create_application() -> FastAPI:
     application = FastAPI(
         title="Skill Intelligence Platform API",
         version="0.1.0",
         docs_url="/docs",
-        openapi_url="/openapi.json"
+        openapi_url="/openapi.json",
+        # [PERFORMANCE] Render JSON with pydantic-core rather than the stdlib encoder
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan
     )
 
     # [SECURITY] CORS Middleware
@@ -34,11 +82,16 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # [PERFORMANCE] ETag / conditional GET for routes declaring http_cache.conditional_get
+    application.middleware("http")(http_cache.etag_middleware)
+
     # [PERFORMANCE] Request timing middleware
     @application.middleware("http")
     async def add_request_timing(request, call_next):
         start = time.time()
-        response = await call_next(request)
+        # [RESILIENCE] In-flight count feeds the /system/ready overload check
+        with in_flight:
+            response = await call_next(request)
         duration = time.time() - start
         response.headers["X-Process-Time"] = str(duration)
         logger.info("request", method=request.method, path=request.url.path, duration_ms=f"{duration*1000:.2f}")
@@ -46,23 +99,12 @@ def create_application() -> FastAPI:
 
     # Exception Handlers
     application.add_exception_handler(errors.AppError, errors.app_exception_handler)
+    application.add_exception_handler(http_cache.NotModified, http_cache.not_modified_handler)
     application.add_exception_handler(Exception, errors.general_exception_handler)
 
-    # Routers
-    application.include_router(system.router, prefix="/system", tags=["system"])
-    application.include_router(users.router, prefix="/users", tags=["users"])
-    # [AUTH] Mount auth routes
-    application.include_router(auth.router, prefix=settings.API_V1_STR + "/auth", tags=["auth"])
-    # [DOMAIN] Assessments
-    application.include_router(assessments.router, prefix=settings.API_V1_STR + "/assessments", tags=["assessments"])
-    # [NEW FEATURES] Additional endpoints
-    application.include_router(achievements.router, prefix=settings.API_V1_STR + "/achievements", tags=["achievements"])
-    application.include_router(projects.router, prefix=settings.API_V1_STR + "/projects", tags=["projects"])
-    application.include_router(courses.router, prefix=settings.API_V1_STR + "/courses", tags=["courses"])
-    application.include_router(mentorship.router, prefix=settings.API_V1_STR + "/mentorships", tags=["mentorships"])
-    application.include_router(notifications.router, prefix=settings.API_V1_STR + "/notifications", tags=["notifications"])
-    application.include_router(quiz.router, prefix=settings.API_V1_STR + "/quizzes", tags=["quizzes"])
-    application.include_router(settings.router, prefix=settings.API_V1_STR + "/users", tags=["settings"])
+    # Routers (app.api.routers.ROUTERS)
+    # [PERFORMANCE] LAZY_ROUTERS: import each endpoint module on its first request
+    include_routers(application, lazy=settings.LAZY_ROUTERS)
     
     return application
 
@@ -70,5 +112,5 @@ app = create_application()
 
 if __name__ == "__main__":
     import uvicorn
-    # [DEFAULTS] Run on port 8000
+    # [DEFAULTS] Run on port 8000 (development: auto-reload, one process; production: python serve.py)
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
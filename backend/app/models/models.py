@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, JSON, Float, Boolean
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, JSON, Float, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.core.db import Base
@@ -31,15 +31,52 @@ class User(Base):
     notifications: Mapped[List["Notification"]] = relationship(back_populates="user", cascade="all, delete-orphan")
     quizzes: Mapped[List["Quiz"]] = relationship(back_populates="user", cascade="all, delete-orphan")
 
+class UserSettings(Base):
+    """
+    Notification and privacy settings, one row per user. Each boolean is a
+    bit of `flags` (layout in app.core.user_settings); no row means defaults.
+    """
+    __tablename__ = "user_settings"
+
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    flags: Mapped[int] = mapped_column(Integer)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class Skill(Base):
+    """
+    Canonical skill registry. Other tables reference skills by integer id;
+    their skill name columns keep the canonical spelling for display.
+    """
+    __tablename__ = "skills"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String)  # Display spelling, e.g. "JavaScript"
+    normalized_name: Mapped[str] = mapped_column(String, unique=True, index=True)  # Case folded lookup key
+
+
+class SkillAlias(Base):
+    """
+    Alternative spellings ("js", "python3") resolving to a canonical skill.
+    """
+    __tablename__ = "skill_aliases"
+
+    alias: Mapped[str] = mapped_column(String, primary_key=True)  # Normalized, like Skill.normalized_name
+    skill_id: Mapped[int] = mapped_column(ForeignKey("skills.id"), index=True)
+
+
 class UserSkill(Base):
     """
     Link table for Users and Skills with proficiency data.
     """
     __tablename__ = "user_skills"
+    # [PERFORMANCE] "who has skill X" (mentor search) is an index range scan
+    __table_args__ = (Index("ix_user_skills_skill_user", "skill_id", "user_id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
-    skill_name: Mapped[str] = mapped_column(String, index=True) # Normalized name
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), index=True)
+    skill_id: Mapped[int] = mapped_column(ForeignKey("skills.id"), nullable=True)
+    skill_name: Mapped[str] = mapped_column(String, index=True) # Canonical name
     proficiency: Mapped[int] = mapped_column(Integer) # 1-10 scale
     verified: Mapped[bool] = mapped_column(default=False)
     
@@ -65,6 +102,23 @@ class Assessment(Base):
     user: Mapped["User"] = relationship(back_populates="assessments")
 
 
+class AssessmentDefinition(Base):
+    """
+    Content of an assessment: questions with their answer key, and per-domain
+    gap rules. Compiled into app.core.assessments at load time; bumping
+    `version` / `updated_at` makes every worker recompile it.
+    """
+    __tablename__ = "assessment_definitions"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    title: Mapped[str] = mapped_column(String)
+    # [FLEXIBILITY] Full definition: questions, domains, on_pass / on_fail
+    content: Mapped[dict] = mapped_column(JSON)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    version: Mapped[int] = mapped_column(Integer, default=1)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class Achievement(Base):
     """
     Represents user achievements and milestones.
@@ -82,6 +136,18 @@ class Achievement(Base):
     user: Mapped["User"] = relationship(back_populates="achievements")
 
 
+class AchievementCounter(Base):
+    """
+    Per-user event counters (quizzes passed, projects created, ...) that the
+    achievement rules in app.core.achievements are evaluated against.
+    """
+    __tablename__ = "achievement_counters"
+
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    counter: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, default=0)
+
+
 class CareerPath(Base):
     """
     Predefined career progression paths based on skills and roles.
@@ -120,6 +186,29 @@ class Project(Base):
     user: Mapped["User"] = relationship(back_populates="projects")
 
 
+class ProjectEndorsement(Base):
+    """
+    One endorsement of a project by a user; the primary key makes repeats a no-op.
+    Project.endorsement_count is the (buffered) count of these rows.
+    """
+    __tablename__ = "project_endorsements"
+
+    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    endorser_id: Mapped[str] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class ProjectSkill(Base):
+    """
+    Relational copy of Project.skills_used, for skill -> project lookups.
+    """
+    __tablename__ = "project_skills"
+    __table_args__ = (Index("ix_project_skills_skill_project", "skill_id", "project_id"),)
+
+    project_id: Mapped[str] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    skill_id: Mapped[int] = mapped_column(ForeignKey("skills.id"), primary_key=True)
+
+
 class Course(Base):
     """
     Learning resources/courses available on the platform.
@@ -138,6 +227,17 @@ class Course(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
+class CourseSkill(Base):
+    """
+    Relational copy of Course.skills_covered, for skill -> course lookups.
+    """
+    __tablename__ = "course_skills"
+    __table_args__ = (Index("ix_course_skills_skill_course", "skill_id", "course_id"),)
+
+    course_id: Mapped[str] = mapped_column(ForeignKey("courses.id", ondelete="CASCADE"), primary_key=True)
+    skill_id: Mapped[int] = mapped_column(ForeignKey("skills.id"), primary_key=True)
+
+
 class Mentorship(Base):
     """
     Mentorship connections between users.
@@ -148,6 +248,7 @@ class Mentorship(Base):
     mentor_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
     mentee_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
     skill_focus: Mapped[str] = mapped_column(String)  # The primary skill being mentored
+    skill_focus_id: Mapped[int] = mapped_column(ForeignKey("skills.id"), nullable=True, index=True)
     status: Mapped[str] = mapped_column(String, default="pending")  # pending, active, completed
     started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
     ended_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -195,11 +296,14 @@ class Quiz(Base):
     Quiz sessions for skill assessment and practice.
     """
     __tablename__ = "quizzes"
+    # Keyset order of the offline jobs over completed quizzes
+    __table_args__ = (Index("ix_quizzes_completed_at_id", "completed_at", "id"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
+    skill_id: Mapped[int] = mapped_column(ForeignKey("skills.id"), nullable=True, index=True)
     skill_name: Mapped[str] = mapped_column(String, index=True)
-    difficulty_level: Mapped[str] = mapped_column(String)  # Beginner, Intermediate, Advanced
+    difficulty_level: Mapped[str] = mapped_column(String)  # Beginner, Intermediate, Advanced, Adaptive
     title: Mapped[str] = mapped_column(String)
     status: Mapped[str] = mapped_column(String, default="not_started")  # not_started, in_progress, completed
     question_count: Mapped[int] = mapped_column(Integer)
@@ -211,6 +315,9 @@ class Quiz(Base):
     questions_data: Mapped[dict] = mapped_column(JSON, nullable=True)
     answers_submitted: Mapped[dict] = mapped_column(JSON, nullable=True)
     performance_data: Mapped[dict] = mapped_column(JSON, nullable=True)
+    # Append-only [question_id, option, ms spent] entries from incremental answering
+    answer_log: Mapped[list] = mapped_column(JSON, nullable=True)
+    answer_log_length: Mapped[int] = mapped_column(Integer, default=0)  # Guards concurrent appends
     
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -219,21 +326,93 @@ class Quiz(Base):
     user: Mapped["User"] = relationship(back_populates="quizzes")
 
 
+class QuestionCalibration(Base):
+    """
+    Rasch difficulty of a bank question, estimated offline from submitted
+    answers (calibrate_questions.py). Drives adaptive quizzes.
+    """
+    __tablename__ = "question_calibrations"
+
+    question_id: Mapped[str] = mapped_column(String, primary_key=True)
+    skill_name: Mapped[str] = mapped_column(String, index=True)
+    difficulty: Mapped[float] = mapped_column(Float)  # Logit scale, 0 = average ability
+    responses: Mapped[int] = mapped_column(Integer, default=0)
+    correct_responses: Mapped[int] = mapped_column(Integer, default=0)
+    calibrated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class QuestionStats(Base):
+    """
+    Classical item statistics per bank question, maintained incrementally by
+    compute_item_stats.py. The sum columns are the running sufficient
+    statistics; the derived columns are recomputed from them on every run.
+    """
+    __tablename__ = "question_stats"
+
+    question_id: Mapped[str] = mapped_column(String, primary_key=True)
+    skill_name: Mapped[str] = mapped_column(String, index=True)
+
+    # Derived
+    p_value: Mapped[float] = mapped_column(Float, nullable=True)  # Share answered correctly
+    discrimination: Mapped[float] = mapped_column(Float, nullable=True)  # Point-biserial vs rest score
+    mean_time_seconds: Mapped[float] = mapped_column(Float, nullable=True)
+    distractor_rates: Mapped[dict] = mapped_column(JSON, nullable=True)  # {"option index": share of responses}
+
+    # Running sums
+    responses: Mapped[int] = mapped_column(Integer, default=0)
+    correct: Mapped[int] = mapped_column(Integer, default=0)
+    option_counts: Mapped[list] = mapped_column(JSON, nullable=True)
+    timed_responses: Mapped[int] = mapped_column(Integer, default=0)
+    time_total: Mapped[float] = mapped_column(Float, default=0.0)
+    disc_n: Mapped[int] = mapped_column(Integer, default=0)
+    disc_sum_x: Mapped[float] = mapped_column(Float, default=0.0)
+    disc_sum_x2: Mapped[float] = mapped_column(Float, default=0.0)
+    disc_sum_xy: Mapped[float] = mapped_column(Float, default=0.0)
+    disc_sum_y: Mapped[float] = mapped_column(Float, default=0.0)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class JobWatermark(Base):
+    """
+    Resume point of an incremental batch job: the last (completed_at, id)
+    it folded in.
+    """
+    __tablename__ = "job_watermarks"
+
+    job: Mapped[str] = mapped_column(String, primary_key=True)
+    last_completed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_id: Mapped[str] = mapped_column(String, nullable=True)
+    rows_processed: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class SkillGapRecord(Base):
     """
-    Records of identified skill gaps for users.
+    Materialized skill gap: one row per (user, skill), updated in place on
+    quiz submission and skill changes (see app.core.skill_gaps).
     """
     __tablename__ = "skill_gap_records"
+    __table_args__ = (
+        Index("ux_skill_gap_records_user_skill", "user_id", "skill_id", unique=True),
+        Index("ix_skill_gap_records_user_status", "user_id", "status"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
+    skill_id: Mapped[int] = mapped_column(ForeignKey("skills.id"), nullable=True, index=True)
     skill_name: Mapped[str] = mapped_column(String, index=True)
     current_level: Mapped[int] = mapped_column(Integer)  # 0-10
     required_level: Mapped[int] = mapped_column(Integer)  # 0-10
     source: Mapped[str] = mapped_column(String)  # quiz, assessment, self-evaluation
-    source_id: Mapped[str] = mapped_column(String, nullable=True)  # Reference to quiz/assessment ID
-    
+    source_id: Mapped[str] = mapped_column(String, nullable=True)  # Last quiz/assessment ID folded in
+
+    quiz_count: Mapped[int] = mapped_column(Integer, default=0)
+    avg_score: Mapped[float] = mapped_column(Float, default=0.0)  # Mean of all quiz scores
+    recent_score: Mapped[float] = mapped_column(Float, default=0.0)  # Exponentially weighted, tracks progress
+
     identified_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=True)
     status: Mapped[str] = mapped_column(String, default="open")  # open, in_progress, addressed
     
     user: Mapped["User"] = relationship()
@@ -13,6 +13,10 @@ class CareerPathBase(BaseModel):
     difficulty_level: str  # Beginner, Intermediate, Advanced
 
 
+class CareerPathCreate(CareerPathBase):
+    pass
+
+
 class CareerPathResponse(CareerPathBase):
     id: str
 
@@ -0,0 +1,27 @@
+from typing import List
+from pydantic import BaseModel
+
+from app.schemas.achievement import AchievementResponse
+from app.schemas.course import RecommendedCourseResponse
+from app.schemas.mentorship import MentorshipResponse
+from app.schemas.notification import NotificationResponse
+from app.schemas.project import ProjectResponse
+from app.schemas.user import UserProfile
+
+
+class DashboardNotifications(BaseModel):
+    recent: List[NotificationResponse] = []
+    unread_count: int = 0
+
+
+class DashboardResponse(BaseModel):
+    """Everything the dashboard page needs, in one round trip."""
+    profile: UserProfile
+    achievements: List[AchievementResponse] = []
+    projects: List[ProjectResponse] = []
+    recommendations: List[RecommendedCourseResponse] = []
+    mentors: List[MentorshipResponse] = []
+    notifications: DashboardNotifications = DashboardNotifications()
+    # [EDGE:PARTIAL] Sections that failed or ran out of budget come back empty and are listed here
+    is_partial_data: bool = False
+    degraded_sections: List[str] = []
@@ -47,6 +47,15 @@ class QuizAnswerSubmission(BaseModel):
     """Submit answers for a quiz."""
     question_id: str
     selected_option_index: int
+    # Client-measured time on the question; only used to split a batch's server-measured time
+    time_spent_ms: Optional[int] = Field(default=None, ge=0)
+
+
+class QuizAnswerProgress(BaseModel):
+    """Progress of a quiz answered incrementally."""
+    quiz_id: str
+    answered: int  # Distinct questions answered so far
+    question_count: int
 
 
 class QuizScore(BaseModel):
@@ -79,6 +88,24 @@ class QuizResult(BaseModel):
     next_steps: List[str]  # Recommended actions
 
 
+class AdaptiveQuizCreate(BaseModel):
+    """Request to start an adaptive quiz: questions follow the user's estimated ability."""
+    skill_name: str
+    max_questions: int = Field(default=15, ge=3, le=50)
+
+
+class AdaptiveQuizState(BaseModel):
+    """Adaptive quiz after each answer: the next question, or the result once finished."""
+    quiz_id: str
+    skill_name: str
+    status: str
+    questions_answered: int
+    ability: float  # Logit scale, 0 = average
+    standard_error: float
+    question: Optional[QuizQuestion] = None
+    result: Optional[QuizResult] = None
+
+
 class SkillGap(BaseModel):
     """Identifies a skill gap for a user."""
     skill_name: str
@@ -0,0 +1,7 @@
+"""
+Reproducible load-test and benchmark suite for the API.
+
+Seeds a synthetic dataset, drives the real FastAPI app (in-process over ASGI
+or over HTTP from several processes) and writes a JSON report that can be
+compared against a stored baseline. See bench/README.md.
+"""
@@ -0,0 +1,223 @@
+"""
+Benchmark CLI.
+
+    python -m bench seed --scale small
+    python -m bench run --mode asgi --scale small --out bench/results/current.json
+    python -m bench run --mode http --url http://localhost:8000 --processes 4
+    python -m bench compare bench/results/current.json bench/results/baseline.json
+    python -m bench serialize --items 1000
+    python -m bench startup --budget-ms 750
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+DEFAULT_DB = "sqlite+aiosqlite:///./bench/.bench.db"
+
+
+def _configure_env(args) -> None:
+    # [DEFAULTS] Must run before anything imports app.core.config
+    os.environ["DATABASE_URL"] = args.database_url
+    # Keep SQL echo off: it would dominate the timings
+    os.environ.setdefault("ENVIRONMENT", "staging")
+
+
+def _quiet_logs() -> None:
+    import structlog
+    # Per-request logs would skew timings; errors still go to stderr
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING),
+        logger_factory=structlog.PrintLoggerFactory(sys.stderr),
+    )
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+async def _seed(args):
+    from app.core.db import engine
+    from bench.seed import SCALES, seed
+
+    counts = await seed(engine, SCALES[args.scale], seed=args.seed)
+    await engine.dispose()
+    return counts
+
+
+def cmd_seed(args) -> int:
+    counts = asyncio.run(_seed(args))
+    print(json.dumps({"scale": args.scale, "rows": counts}, indent=2))
+    return 0
+
+
+def cmd_run(args) -> int:
+    from bench.metrics import compare
+    from bench.scenarios import select_scenarios
+    from bench.seed import SCALES
+
+    scale = SCALES[args.scale]
+    scenarios = select_scenarios(args.only)
+
+    if args.mode == "asgi":
+        async def main():
+            from app.core.db import engine
+            from app.main import app
+            from bench.drivers import run_asgi
+            from bench.metrics import QueryCounter
+            from bench.seed import seed
+
+            _quiet_logs()
+            if not args.no_seed:
+                await seed(engine, scale, seed=args.seed)
+            counter = QueryCounter(engine).attach()
+            try:
+                return await run_asgi(app, scenarios, scale, args.requests, args.concurrency, counter, seed=args.seed)
+            finally:
+                counter.detach()
+                await engine.dispose()
+
+        results = asyncio.run(main())
+    else:
+        from bench.drivers import run_http
+
+        if not args.no_seed:
+            asyncio.run(_seed(args))
+        results = run_http(args.url, scenarios, scale, args.requests, args.concurrency, args.processes, seed=args.seed)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_rev": _git_rev(),
+            "python": platform.python_version(),
+            "mode": args.mode,
+            "scale": args.scale,
+            "database": args.database_url.split("://", 1)[0],
+            "requests_per_endpoint": args.requests,
+            "concurrency": args.concurrency,
+            "processes": args.processes if args.mode == "http" else 1,
+        },
+        "endpoints": {name: stats.summary() for name, stats in results.items()},
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['endpoint']} {r['metric']}: {r['baseline']} -> {r['current']} (+{r['change_pct']}%)",
+                  file=sys.stderr)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+def cmd_compare(args) -> int:
+    from bench.metrics import compare
+
+    with open(args.current) as f:
+        current = json.load(f)
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.threshold)
+    print(json.dumps(regressions, indent=2))
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+def cmd_serialize(args) -> int:
+    from bench.serialization import run
+
+    print(json.dumps({"items": args.items, "results": run(args.items, args.repeat, args.seed)}, indent=2))
+    return 0
+
+
+def cmd_startup(args) -> int:
+    from bench.startup import run
+
+    report = run(args.repeat, args.top)
+    print(json.dumps(report, indent=2))
+    if args.budget_ms is not None:
+        mode = "lazy" if args.lazy else "eager"
+        took = report[mode]["startup_ms"]
+        if took > args.budget_ms:
+            print(f"{mode} startup took {took} ms, over the {args.budget_ms} ms budget", file=sys.stderr)
+            return 1
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m bench", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def common(p):
+        p.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL", DEFAULT_DB),
+                       help="SQLAlchemy async URL (sqlite+aiosqlite:// or postgresql+asyncpg://)")
+        p.add_argument("--scale", default="small", choices=["tiny", "small", "medium", "large"])
+        p.add_argument("--seed", type=int, default=42)
+
+    p_seed = sub.add_parser("seed", help="Recreate tables and load the synthetic dataset")
+    common(p_seed)
+    p_seed.set_defaults(func=cmd_seed)
+
+    p_run = sub.add_parser("run", help="Run the benchmark and write a JSON report")
+    common(p_run)
+    p_run.add_argument("--mode", choices=["asgi", "http"], default="asgi")
+    p_run.add_argument("--url", default="http://localhost:8000", help="Server URL for --mode http")
+    p_run.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+    p_run.add_argument("--concurrency", type=int, default=16, help="In-flight requests (total)")
+    p_run.add_argument("--processes", type=int, default=os.cpu_count() or 2, help="Client processes for --mode http")
+    p_run.add_argument("--only", help="Comma separated scenario names or prefixes, e.g. courses,quizzes.get")
+    p_run.add_argument("--no-seed", action="store_true", help="Reuse the existing dataset")
+    p_run.add_argument("--out", help="Write the report here instead of stdout")
+    p_run.add_argument("--baseline", help="Report to compare against")
+    p_run.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    p_run.add_argument("--fail-on-regression", action="store_true")
+    p_run.set_defaults(func=cmd_run)
+
+    p_cmp = sub.add_parser("compare", help="Compare two reports")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("--threshold", type=float, default=10.0)
+    p_cmp.add_argument("--fail-on-regression", action="store_true")
+    p_cmp.set_defaults(func=cmd_compare)
+
+    p_ser = sub.add_parser("serialize", help="Micro-benchmark response serialization (no DB)")
+    p_ser.add_argument("--items", type=int, default=1000)
+    p_ser.add_argument("--repeat", type=int, default=20)
+    p_ser.add_argument("--seed", type=int, default=42)
+    p_ser.set_defaults(func=cmd_serialize)
+
+    p_start = sub.add_parser("startup", help="Profile worker startup (import, lifespan and first request)")
+    p_start.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per mode; the best is kept")
+    p_start.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    p_start.add_argument("--budget-ms", type=float, help="Exit 1 when startup takes longer (for CI)")
+    p_start.add_argument("--lazy", action="store_true", help="Check the budget against LAZY_ROUTERS=true")
+    p_start.set_defaults(func=cmd_startup)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if hasattr(args, "database_url"):
+        _configure_env(args)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
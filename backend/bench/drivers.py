@@ -0,0 +1,130 @@
+"""
+Load drivers: in-process ASGI and multi-process HTTP.
+"""
+import asyncio
+import multiprocessing
+import random
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.core import security
+from bench.metrics import EndpointStats, QueryCounter
+from bench.scenarios import Scenario, build_request
+from bench.seed import Scale
+
+
+@lru_cache(maxsize=None)
+def _auth_headers(user_id: str) -> Dict[str, str]:
+    # [AUTH] Mint tokens directly: the login endpoint is not what we measure
+    return {"Authorization": f"Bearer {security.create_access_token(subject=user_id)}"}
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    scale: Scale,
+    requests: int,
+    concurrency: int,
+    seed: int,
+) -> EndpointStats:
+    rng = random.Random(seed)
+    stats = EndpointStats()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        req = build_request(scenario, scale, rng)
+        headers = _auth_headers(req["user_id"]) if scenario.authenticated else {}
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.request(req["method"], req["url"], json=req["json"], headers=headers)
+                code = response.status_code
+            except Exception:
+                # Transport errors (and unhandled app errors in ASGI mode) count as 599
+                code = 599
+            stats.record(code, (time.perf_counter() - start) * 1000.0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    stats.wall_seconds = time.perf_counter() - start
+    return stats
+
+
+async def run_asgi(
+    app,
+    scenarios: List[Scenario],
+    scale: Scale,
+    requests: int,
+    concurrency: int,
+    counter: Optional[QueryCounter] = None,
+    probe_requests: int = 5,
+    seed: int = 42,
+) -> Dict[str, EndpointStats]:
+    """
+    Drive the app in-process through httpx's ASGI transport.
+
+    Each scenario first runs a short sequential probe to measure DB queries
+    per request (concurrent requests would interleave on the counter), then
+    the timed load pass.
+    """
+    results: Dict[str, EndpointStats] = {}
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for i, scenario in enumerate(scenarios):
+            queries = None
+            if counter is not None and probe_requests:
+                counter.reset()
+                await _drive(client, scenario, scale, probe_requests, 1, seed + i)
+                queries = round(counter.reset() / probe_requests, 2)
+            stats = await _drive(client, scenario, scale, requests, concurrency, seed + i)
+            stats.queries_per_request = queries
+            results[scenario.name] = stats
+    return results
+
+
+def _http_worker(args) -> EndpointStats:
+    base_url, scenario, scale, requests, concurrency, seed = args
+
+    async def main() -> EndpointStats:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+            return await _drive(client, scenario, scale, requests, concurrency, seed)
+
+    return asyncio.run(main())
+
+
+def run_http(
+    base_url: str,
+    scenarios: List[Scenario],
+    scale: Scale,
+    requests: int,
+    concurrency: int,
+    processes: int,
+    seed: int = 42,
+) -> Dict[str, EndpointStats]:
+    """
+    Drive a running server over HTTP from several client processes, so the
+    load generator itself is not limited to one core.
+
+    `requests` and `concurrency` are totals, split evenly across processes.
+    """
+    results: Dict[str, EndpointStats] = {}
+    per_proc_requests = max(1, requests // processes)
+    per_proc_concurrency = max(1, concurrency // processes)
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(processes) as pool:
+        for i, scenario in enumerate(scenarios):
+            jobs = [
+                (base_url, scenario, scale, per_proc_requests, per_proc_concurrency, seed + i * 1_000 + p)
+                for p in range(processes)
+            ]
+            start = time.perf_counter()
+            merged = EndpointStats()
+            for part in pool.map(_http_worker, jobs):
+                merged.merge(part)
+            merged.wall_seconds = time.perf_counter() - start
+            results[scenario.name] = merged
+    return results
@@ -0,0 +1,105 @@
+"""
+Latency statistics and DB query counting for benchmark reports.
+"""
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile over an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: Dict[int, int] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    queries_per_request: Optional[float] = None
+
+    def record(self, status_code: int, latency_ms: float) -> None:
+        self.latencies_ms.append(latency_ms)
+        self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+        if status_code >= 400:
+            self.errors += 1
+
+    def merge(self, other: "EndpointStats") -> None:
+        self.latencies_ms.extend(other.latencies_ms)
+        self.errors += other.errors
+        for code, count in other.status_codes.items():
+            self.status_codes[code] = self.status_codes.get(code, 0) + count
+        self.wall_seconds = max(self.wall_seconds, other.wall_seconds)
+
+    def summary(self) -> dict:
+        values = sorted(self.latencies_ms)
+        return {
+            "requests": len(values),
+            "errors": self.errors,
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items())},
+            "rps": round(len(values) / self.wall_seconds, 2) if self.wall_seconds else 0.0,
+            "p50_ms": round(percentile(values, 50), 3),
+            "p95_ms": round(percentile(values, 95), 3),
+            "p99_ms": round(percentile(values, 99), 3),
+            "max_ms": round(values[-1], 3) if values else 0.0,
+            "queries_per_request": self.queries_per_request,
+        }
+
+
+class QueryCounter:
+    """
+    Counts statements sent to the database through an engine.
+
+    Hooks the sync engine's cursor events, so it sees every statement the
+    async engine issues, including ones emitted by lazy loads.
+    """
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine.sync_engine
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def attach(self) -> "QueryCounter":
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def detach(self) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+    def reset(self) -> int:
+        count, self.count = self.count, 0
+        return count
+
+
+def compare(current: dict, baseline: dict, threshold_pct: float = 10.0) -> List[dict]:
+    """
+    List endpoints whose p95 latency or query count regressed by more than
+    threshold_pct versus the baseline report.
+    """
+    regressions = []
+    for name, stats in current.get("endpoints", {}).items():
+        base = baseline.get("endpoints", {}).get(name)
+        if not base:
+            continue
+        for metric in ("p95_ms", "queries_per_request"):
+            now, before = stats.get(metric), base.get(metric)
+            if not now or not before:
+                continue
+            change = (now - before) / before * 100.0
+            if change > threshold_pct:
+                regressions.append({
+                    "endpoint": name,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": now,
+                    "change_pct": round(change, 1),
+                })
+    return regressions
@@ -0,0 +1,75 @@
+"""
+Endpoints exercised by the benchmark, and how to build a request for each.
+
+IDs are derived from the scale alone (the seeder is deterministic), so HTTP
+load workers in other processes can build valid requests without touching
+the database.
+"""
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from bench.seed import Scale
+from datagen.config import SKILLS, career_path_id, course_id, quiz_id, user_id
+
+API = settings.API_V1_STR
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    path: str  # may reference {course_id}, {quiz_id}, {career_path_id}, {skill}
+    body: Optional[Callable[[random.Random], Any]] = None
+    authenticated: bool = True
+
+
+SCENARIOS = [
+    Scenario("health", "GET", "/system/health", authenticated=False),
+    Scenario("users.me", "GET", "/users/me"),
+    Scenario("assessments.available", "GET", f"{API}/assessments/available", authenticated=False),
+    Scenario("courses.list", "GET", f"{API}/courses?limit=50"),
+    Scenario("courses.get", "GET", f"{API}/courses/{{course_id}}"),
+    Scenario("courses.by_skill", "GET", f"{API}/courses/by-skill/{{skill}}"),
+    Scenario("courses.recommendations", "GET", f"{API}/courses/recommendations"),
+    Scenario("achievements.me", "GET", f"{API}/achievements/me"),
+    Scenario("projects.me", "GET", f"{API}/projects/me"),
+    Scenario("notifications.list", "GET", f"{API}/notifications?limit=20"),
+    Scenario("quizzes.list", "GET", f"{API}/quizzes?limit=20"),
+    Scenario("quizzes.get", "GET", f"{API}/quizzes/{{quiz_id}}"),
+    Scenario("quizzes.stats", "GET", f"{API}/quizzes/stats"),
+    Scenario("quizzes.gaps", "GET", f"{API}/quizzes/gaps"),
+    Scenario("dashboard", "GET", f"{API}/dashboard"),
+    Scenario("career_paths.matches", "GET", f"{API}/career-paths/me/matches"),
+    Scenario("career_paths.progress", "GET", f"{API}/career-paths/{{career_path_id}}/progress"),
+]
+
+
+def select_scenarios(names: Optional[str]) -> list:
+    """Filter SCENARIOS by a comma separated list of names (or name prefixes)."""
+    if not names:
+        return list(SCENARIOS)
+    wanted = [n.strip() for n in names.split(",") if n.strip()]
+    return [s for s in SCENARIOS if any(s.name == w or s.name.startswith(w + ".") for w in wanted)]
+
+
+def build_request(scenario: Scenario, scale: Scale, rng: random.Random) -> Dict[str, Any]:
+    """
+    Pick a random seeded user and fill the path placeholders with rows that
+    belong to (or are visible to) that user.
+    """
+    cfg = scale.gen_config()
+    index = rng.randrange(scale.users)
+    params = {
+        "course_id": course_id(cfg, rng.randrange(scale.courses)),
+        "quiz_id": quiz_id(cfg, index, rng.randrange(max(scale.quizzes_per_user, 1))),
+        "career_path_id": career_path_id(cfg, rng.randrange(max(scale.career_paths, 1))),
+        "skill": rng.choice(SKILLS),
+    }
+    return {
+        "user_id": user_id(cfg, index),
+        "method": scenario.method,
+        "url": scenario.path.format(**params),
+        "json": scenario.body(rng) if scenario.body else None,
+    }
@@ -0,0 +1,55 @@
+"""
+Synthetic dataset for benchmarks.
+
+Thin wrapper over `datagen` with fixed per-user counts, so two runs at the
+same scale produce identical data (and predictable IDs), which keeps reports
+comparable across commits.
+"""
+from dataclasses import dataclass
+from typing import Dict
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from datagen.config import GenConfig
+from datagen.generate import generate
+
+
+@dataclass(frozen=True)
+class Scale:
+    users: int
+    courses: int
+    quizzes_per_user: int
+    notifications_per_user: int
+    skills_per_user: int = 4
+    career_paths: int = 100
+
+    def gen_config(self, seed: int = 42) -> GenConfig:
+        return GenConfig(
+            users=self.users,
+            courses=self.courses,
+            quizzes_per_user=self.quizzes_per_user,
+            notifications_per_user=self.notifications_per_user,
+            skills_per_user=self.skills_per_user,
+            career_paths=self.career_paths,
+            exact_counts=True,
+            prefix="bench",
+            seed=seed,
+        )
+
+
+SCALES: Dict[str, Scale] = {
+    "tiny": Scale(users=10, courses=20, quizzes_per_user=2, notifications_per_user=5),
+    "small": Scale(users=200, courses=500, quizzes_per_user=5, notifications_per_user=20),
+    "medium": Scale(users=2_000, courses=5_000, quizzes_per_user=10, notifications_per_user=50,
+                    career_paths=1_000),
+    "large": Scale(users=20_000, courses=20_000, quizzes_per_user=20, notifications_per_user=100,
+                   career_paths=5_000),
+}
+
+
+async def seed(engine: AsyncEngine, scale: Scale, seed: int = 42) -> Dict[str, int]:
+    """
+    Drop and recreate all tables, then bulk-load the dataset. Returns row
+    counts per table.
+    """
+    return await generate(engine, scale.gen_config(seed), reset=True, progress_every=0)
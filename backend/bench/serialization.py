@@ -0,0 +1,132 @@
+"""
+Serialization micro-benchmark: cost of turning N rows into response bytes.
+
+Compares the per-item path the endpoints used to take (one model per row,
+then FastAPI re-validating against `response_model` and encoding with the
+stdlib `json`) with the current one (one list validation, no re-validation,
+pydantic-core rendering). No database: rows are ORM instances built from the
+datagen row builders, so attribute access costs the same as in a request.
+"""
+import json
+import random
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.quiz_assembly import build_questions
+from app.core.serialization import FastJSONResponse, validate_many
+from app.models.models import Course, Notification, Quiz
+from app.schemas.course import CourseList, CourseResponse
+from app.schemas.notification import NotificationList, NotificationResponse
+from app.schemas.quiz import QuizQuestion, QuizResponse
+from datagen.config import GenConfig
+from datagen.rows import course_row, user_rows
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def _legacy_encode(response_model: Any, content: Any) -> bytes:
+    """The default FastAPI path for a returned model: dump, re-validate, encode, json.dumps."""
+    validated = _adapter(response_model).validate_python(jsonable_encoder(content))
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _fast_encode(content: Any) -> bytes:
+    return FastJSONResponse(content).body
+
+
+def _rows(n: int, seed: int) -> Dict[str, list]:
+    cfg = GenConfig(users=n, courses=n, quizzes_per_user=1, notifications_per_user=1,
+                    exact_counts=True, prefix="ser", seed=seed)
+    rng = random.Random(seed)
+    courses = [Course(**course_row(cfg, rng, i)) for i in range(n)]
+    notifications: List[Notification] = []
+    quizzes: List[Quiz] = []
+    for i in range(n):
+        rows = user_rows(cfg, rng, i)
+        notifications.extend(Notification(**r) for r in rows["notifications"])
+        quizzes.extend(Quiz(**r) for r in rows["quizzes"])
+    return {"courses": courses, "notifications": notifications[:n], "quizzes": quizzes[:n]}
+
+
+def _quiz_legacy(quizzes: List[Quiz]) -> bytes:
+    response = []
+    for quiz in quizzes:
+        questions = [
+            QuizQuestion(
+                id=q["id"], text=q["text"], options=q["options"],
+                difficulty_level=quiz.difficulty_level, skill_tested=quiz.skill_name,
+                topic=q.get("topic", "General")
+            )
+            for q in quiz.questions_data["questions"]
+        ]
+        response.append(QuizResponse(
+            id=quiz.id, skill_name=quiz.skill_name, difficulty_level=quiz.difficulty_level,
+            title=quiz.title, status=quiz.status, question_count=quiz.question_count,
+            created_at=quiz.created_at, questions=questions
+        ))
+    return _legacy_encode(List[QuizResponse], response)
+
+
+def _quiz_fast(quizzes: List[Quiz]) -> bytes:
+    response = [
+        QuizResponse(
+            id=quiz.id, skill_name=quiz.skill_name, difficulty_level=quiz.difficulty_level,
+            title=quiz.title, status=quiz.status, question_count=quiz.question_count,
+            created_at=quiz.created_at,
+            questions=build_questions(quiz.questions_data["questions"], quiz.difficulty_level, quiz.skill_name)
+        )
+        for quiz in quizzes
+    ]
+    return _fast_encode(response)
+
+
+CASES: Dict[str, Dict[str, Callable[[list], bytes]]] = {
+    "courses": {
+        "legacy": lambda rows: _legacy_encode(CourseList, CourseList(
+            courses=[CourseResponse.model_validate(c) for c in rows], total_count=len(rows))),
+        "fast": lambda rows: _fast_encode(CourseList(
+            courses=validate_many(CourseResponse, rows), total_count=len(rows))),
+    },
+    "notifications": {
+        "legacy": lambda rows: _legacy_encode(NotificationList, NotificationList(
+            notifications=[NotificationResponse.model_validate(n) for n in rows],
+            total_count=len(rows), unread_count=0)),
+        "fast": lambda rows: _fast_encode(NotificationList(
+            notifications=validate_many(NotificationResponse, rows),
+            total_count=len(rows), unread_count=0)),
+    },
+    "quizzes": {
+        "legacy": _quiz_legacy,
+        "fast": _quiz_fast,
+    },
+}
+
+
+def run(items: int = 1000, repeat: int = 20, seed: int = 42) -> Dict[str, Dict[str, Any]]:
+    """Best-of-`repeat` milliseconds per `items` rows, per case and path."""
+    data = _rows(items, seed)
+    report: Dict[str, Dict[str, Any]] = {}
+    for name, paths in CASES.items():
+        rows = data[name]
+        timings = {}
+        for path, fn in paths.items():
+            fn(rows)  # warm up adapters / schema caches
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn(rows)
+                best = min(best, time.perf_counter() - start)
+            timings[f"{path}_ms"] = round(best * 1000, 2)
+        # Both paths must produce the same document
+        assert json.loads(paths["legacy"](rows)) == json.loads(paths["fast"](rows)), name
+        timings["items"] = len(rows)
+        timings["speedup"] = round(timings["legacy_ms"] / timings["fast_ms"], 2)
+        report[name] = timings
+    return report
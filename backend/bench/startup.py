@@ -0,0 +1,108 @@
+"""
+Worker startup profile: how long a fresh interpreter takes to serve its
+first request, and which modules that time goes to.
+
+Each run is a new `python -X importtime` process, with LAZY_ROUTERS off
+(every endpoint module imported) and on (each one on its first request). It
+times the three steps a cold worker takes before its first response:
+
+  import_ms         import app.main
+  lifespan_ms       the app's lifespan startup (background tasks, pool warm-up)
+  first_request_ms  GET /system/health through the ASGI app
+
+`startup_ms` is their sum. `-X importtime` reports per-module self and
+cumulative microseconds on stderr, covering imports made by the lifespan and
+the first request too; the report keeps the run with the best `startup_ms`
+of `--repeat` and that run's slowest modules by self time.
+"""
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child; the report is its last line of stdout (request logs come before it)
+_CHILD = """
+import asyncio, json, sys, time
+import httpx
+
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+
+async def main():
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            response = await client.get("/system/health")
+        served = time.perf_counter()
+        from app.core import question_bank
+        return {
+            "import_ms": (imported - start) * 1000,
+            "lifespan_ms": (started - imported) * 1000,
+            "first_request_ms": (served - started) * 1000,
+            "status": response.status_code,
+            "endpoint_modules": sorted(m.rsplit(".", 1)[1] for m in sys.modules if m.startswith("app.api.endpoints.")),
+            "question_bank_loaded": question_bank._bank is not None,
+        }
+
+
+print(json.dumps(asyncio.run(main())))
+"""
+
+
+def _parse_importtime(stderr: str) -> List[dict]:
+    """Lines look like 'import time:  self [us] | cumulative | imported package'."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append({"module": name.strip(), "self_us": int(self_us), "cumulative_us": int(cumulative_us)})
+    return modules
+
+
+def _start_once(lazy: bool) -> Dict:
+    env = dict(os.environ, LAZY_ROUTERS=str(lazy).lower(), PYTHONDONTWRITEBYTECODE="1")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr else "startup failed")
+    timings = json.loads(lines[-1])
+    timings["modules"] = _parse_importtime(completed.stderr)
+    return timings
+
+
+def _profile(lazy: bool, repeat: int, top: int) -> Dict:
+    best = None
+    for _ in range(repeat):
+        run = _start_once(lazy)
+        run["startup_ms"] = run["import_ms"] + run["lifespan_ms"] + run["first_request_ms"]
+        if best is None or run["startup_ms"] < best["startup_ms"]:
+            best = run
+    slowest = sorted(best["modules"], key=lambda m: m["self_us"], reverse=True)[:top]
+    return {
+        "startup_ms": round(best["startup_ms"], 1),
+        "import_ms": round(best["import_ms"], 1),
+        "lifespan_ms": round(best["lifespan_ms"], 1),
+        "first_request_ms": round(best["first_request_ms"], 1),
+        "first_request_status": best["status"],
+        "modules": len(best["modules"]),
+        "endpoint_modules": best["endpoint_modules"],
+        "question_bank_loaded": best["question_bank_loaded"],
+        "slowest": [
+            {"module": m["module"], "self_ms": round(m["self_us"] / 1000, 2),
+             "cumulative_ms": round(m["cumulative_us"] / 1000, 2)}
+            for m in slowest
+        ],
+    }
+
+
+def run(repeat: int = 3, top: int = 15) -> Dict[str, Dict]:
+    return {"eager": _profile(False, repeat, top), "lazy": _profile(True, repeat, top)}
@@ -0,0 +1,59 @@
+"""
+Batch calibration of question difficulties for adaptive quizzes.
+
+Reads every completed quiz's submitted answers, fits a Rasch model (one
+ability per user, one difficulty per bank question; see app.core.irt.calibrate)
+and stores the difficulties in question_calibrations. Questions nobody has
+answered keep their authored-level prior. Run it periodically, e.g. nightly:
+
+    python calibrate_questions.py
+"""
+import asyncio
+import time
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.core.question_bank import question_bank
+from app.core.config import settings
+from app.core.irt import DIFFICULTY_PRIOR, calibrate
+from app.crud import question_calibration as calibration_crud
+from app.models.models import Base, Quiz
+
+BATCH_SIZE = 1000
+
+
+async def calibrate_questions():
+    started = time.perf_counter()
+    answer_key, priors, skills = {}, {}, {}
+    for skill, levels in question_bank().items():
+        for level, questions in levels.items():
+            for q in questions:
+                answer_key[q["id"]] = q["correct"]
+                priors[q["id"]] = DIFFICULTY_PRIOR.get(level, 0.0)
+                skills[q["id"]] = skill
+
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        responses = []
+        result = await db.stream(
+            select(Quiz.user_id, Quiz.answers_submitted)
+            .where(Quiz.status == "completed", Quiz.answers_submitted.is_not(None))
+            .execution_options(yield_per=BATCH_SIZE)
+        )
+        async for user_id, answers in result:
+            for question_id, option in (answers or {}).items():
+                if question_id in answer_key:
+                    responses.append((user_id, question_id, answer_key[question_id] == option))
+
+        calibrations = calibrate(responses, priors)
+        saved = await calibration_crud.save_calibrations(db, calibrations, skills)
+
+    await engine.dispose()
+    print(f"Calibrated {saved} questions from {len(responses)} responses "
+          f"in {time.perf_counter() - started:.1f}s.")
+
+
+if __name__ == "__main__":
+    asyncio.run(calibrate_questions())
@@ -0,0 +1,90 @@
+"""
+Incremental item statistics over completed quizzes.
+
+Walks completed quizzes in (completed_at, id) order from the last watermark,
+CHUNK_SIZE at a time, and folds per-question response counts into
+question_stats: p-value, point-biserial discrimination against the rest of
+the quiz, distractor rates per wrong option and mean time per question. Each
+chunk's stats and the new watermark commit together, so an interrupted run
+resumes where it stopped and memory stays bounded by one chunk whatever the
+history size. Run it periodically, e.g. hourly:
+
+    python compute_item_stats.py
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.core.question_bank import question_bank
+from app.core.config import settings
+from app.core.answer_buffer import graded_answers
+from app.core.item_stats import ItemAccumulator
+from app.crud import item_stats as item_stats_crud
+from app.models.models import Base, Quiz
+
+JOB = "item_stats"
+CHUNK_SIZE = 1000
+# Quizzes completed this recently are left for the next run, so a submission
+# committing with an earlier completed_at than one already read is not skipped.
+SETTLE_SECONDS = 60
+
+
+def _fold(deltas: dict, answer_key: dict, answers: dict, time_taken_seconds, answer_log) -> None:
+    """Add one quiz's answers to the per-question deltas."""
+    keyed = [(qid, option) for qid, option in (answers or {}).items() if qid in answer_key]
+    if not keyed:
+        return
+    outcomes = [answer_key[qid] == option for qid, option in keyed]
+    total_correct = sum(outcomes)
+    # Per-question times from the answer log; quizzes submitted in one go only have the total
+    times = graded_answers(answer_log)[1] if answer_log else {}
+    even_split = time_taken_seconds / len(keyed) if time_taken_seconds and not answer_log else None
+    for (qid, option), correct in zip(keyed, outcomes):
+        rest = (total_correct - correct) / (len(keyed) - 1) if len(keyed) > 1 else None
+        delta = deltas.get(qid)
+        if delta is None:
+            delta = deltas[qid] = ItemAccumulator()
+        seconds = times[qid] / 1000 if qid in times else even_split
+        delta.add(option if isinstance(option, int) else -1, correct, rest, seconds)
+
+
+async def compute_item_stats():
+    started = time.perf_counter()
+    answer_key, skills = {}, {}
+    for skill, levels in question_bank().items():
+        for questions in levels.values():
+            for q in questions:
+                answer_key[q["id"]] = q["correct"]
+                skills[q["id"]] = skill
+
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # Databases created before the keyset index existed
+        for index in Quiz.__table__.indexes:
+            await conn.run_sync(index.create, checkfirst=True)
+
+    processed = chunks = 0
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        completed_at, last_id = await item_stats_crud.get_watermark(db, JOB)
+        before = datetime.utcnow() - timedelta(seconds=SETTLE_SECONDS)
+        while True:
+            rows = await item_stats_crud.get_completed_quizzes_after(db, completed_at, last_id, before, CHUNK_SIZE)
+            if not rows:
+                break
+            deltas = {}
+            for _, _, answers, time_taken_seconds, answer_log in rows:
+                _fold(deltas, answer_key, answers, time_taken_seconds, answer_log)
+            last_id, completed_at = rows[-1].id, rows[-1].completed_at
+            await item_stats_crud.save_chunk(db, JOB, deltas, skills, answer_key, completed_at, last_id, len(rows))
+            processed += len(rows)
+            chunks += 1
+            db.expunge_all()
+
+    await engine.dispose()
+    print(f"Folded {processed} quizzes in {chunks} chunks "
+          f"in {time.perf_counter() - started:.1f}s.")
+
+
+if __name__ == "__main__":
+    asyncio.run(compute_item_stats())
@@ -0,0 +1,7 @@
+"""
+Synthetic data generator for scale testing.
+
+Streams deterministic rows for every core table and bulk-loads them with
+batched executemany (COPY on Postgres), so production-sized datasets can be
+built on a laptop. See `python -m datagen --help`.
+"""
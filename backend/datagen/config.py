@@ -0,0 +1,88 @@
+"""
+Generator configuration, presets and the deterministic ID scheme.
+"""
+from dataclasses import dataclass, replace
+from typing import Dict
+
+# Ordered by popularity: weights below follow a Zipf-like curve, so the first
+# skills show up in far more profiles and courses than the tail.
+SKILLS = [
+    "Python", "JavaScript", "SQL", "Data Science", "Machine Learning",
+    "Web Development", "Cloud Infra", "React", "Project Management", "Data Ethics",
+    "FHIR", "HL7", "GIS", "IoT", "Spatial Analysis",
+    "Genomics", "Bio-Informatics", "Crop Systems", "Sustainability", "System Architecture",
+]
+SKILL_WEIGHTS = [1.0 / (rank + 1) for rank in range(len(SKILLS))]
+# Registry ids (skills table); fixed so generated rows can reference them directly
+SKILL_IDS = {name: i + 1 for i, name in enumerate(SKILLS)}
+
+DIFFICULTIES = ["Beginner", "Intermediate", "Advanced"]
+DIFFICULTY_WEIGHTS = [0.5, 0.35, 0.15]
+
+TITLES = [
+    "Data Analyst", "Software Engineer", "Urban Planner", "Bio Researcher",
+    "Agronomist", "Health Informatics Specialist", "Student", "ML Engineer",
+]
+PROVIDERS = ["Coursera", "Udemy", "edX", "Internal"]
+NOTIFICATION_TYPES = ["achievement", "mentorship", "course_recommendation", "connection_request"]
+MENTORSHIP_STATUSES = ["pending", "active", "completed"]
+INDUSTRIES = ["CS", "Agriculture", "Smart Cities", "Healthcare"]
+
+
+@dataclass(frozen=True)
+class GenConfig:
+    users: int
+    courses: int
+    quizzes_per_user: int
+    notifications_per_user: int
+    skills_per_user: int = 4
+    career_paths: int = 100
+    # Share of users that have a mentor; mentors are drawn from the first 10% of users
+    mentee_ratio: float = 0.1
+    # True: every user gets exactly the per-user counts (benchmarks need predictable IDs).
+    # False: counts vary per user around the configured mean.
+    exact_counts: bool = False
+    prefix: str = "gen"
+    seed: int = 42
+
+    def with_overrides(self, **kwargs) -> "GenConfig":
+        return replace(self, **{k: v for k, v in kwargs.items() if v is not None})
+
+
+PRESETS: Dict[str, GenConfig] = {
+    "dev": GenConfig(users=1_000, courses=500, quizzes_per_user=3, notifications_per_user=10),
+    "staging": GenConfig(users=100_000, courses=10_000, quizzes_per_user=5, notifications_per_user=20,
+                         career_paths=1_000),
+    "laptop": GenConfig(users=1_000_000, courses=50_000, quizzes_per_user=5, notifications_per_user=10,
+                        career_paths=5_000),
+    "prod": GenConfig(users=5_000_000, courses=100_000, quizzes_per_user=8, notifications_per_user=25,
+                      career_paths=10_000),
+}
+
+
+def user_id(cfg: GenConfig, index: int) -> str:
+    return f"{cfg.prefix}-user-{index:08d}"
+
+
+def course_id(cfg: GenConfig, index: int) -> str:
+    return f"{cfg.prefix}-course-{index:08d}"
+
+
+def career_path_id(cfg: GenConfig, index: int) -> str:
+    return f"{cfg.prefix}-career-{index:08d}"
+
+
+def quiz_id(cfg: GenConfig, user_index: int, n: int) -> str:
+    return f"quiz_{cfg.prefix}_{user_index:08d}_{n:04d}"
+
+
+def skill_gap_id(cfg: GenConfig, user_index: int, skill_id: int) -> str:
+    return f"gap_{cfg.prefix}_{user_index:08d}_{skill_id:04d}"
+
+
+def notification_id(cfg: GenConfig, user_index: int, n: int) -> str:
+    return f"notif_{cfg.prefix}_{user_index:08d}_{n:05d}"
+
+
+def mentorship_id(cfg: GenConfig, user_index: int) -> str:
+    return f"{cfg.prefix}-mentorship-{user_index:08d}"
@@ -0,0 +1,113 @@
+"""
+Generation driver: streams rows from `datagen.rows` into a `BulkWriter`.
+
+Memory stays bounded by the batch size no matter how many users are
+generated, because rows are produced per user and flushed as they fill up.
+"""
+import random
+import time
+from typing import Dict
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.db import Base
+from app.models.models import (
+    CareerPath, Course, CourseSkill, Mentorship, Notification, Quiz, Skill, SkillAlias, SkillGapRecord, User,
+    UserSkill,
+)
+from datagen.config import SKILL_IDS, GenConfig
+from datagen.rows import career_path_row, course_row, course_skill_rows, skill_rows, user_rows
+from datagen.writer import BulkWriter
+
+logger = structlog.get_logger()
+
+# Parents before children (see BulkWriter)
+TABLES = {
+    "skills": Skill.__table__,
+    "skill_aliases": SkillAlias.__table__,
+    "users": User.__table__,
+    "courses": Course.__table__,
+    "course_skills": CourseSkill.__table__,
+    "career_paths": CareerPath.__table__,
+    "user_skills": UserSkill.__table__,
+    "quizzes": Quiz.__table__,
+    "skill_gap_records": SkillGapRecord.__table__,
+    "notifications": Notification.__table__,
+    "mentorships": Mentorship.__table__,
+}
+
+
+async def reset_schema(engine: AsyncEngine) -> None:
+    """[DESTRUCTIVE] Drop and recreate every table."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def _registry_loaded(conn: AsyncConnection) -> bool:
+    """True if an earlier run already wrote the skill registry (it is shared across prefixes)."""
+    existing = dict((await conn.execute(select(Skill.name, Skill.id))).all())
+    if not existing:
+        return False
+    if any(existing.get(name) != skill_id for name, skill_id in SKILL_IDS.items()):
+        raise RuntimeError("skills table does not match datagen.config.SKILL_IDS; rerun with --reset")
+    return True
+
+
+async def generate(
+    engine: AsyncEngine,
+    cfg: GenConfig,
+    batch_size: int = 5_000,
+    reset: bool = False,
+    progress_every: int = 50_000,
+) -> Dict[str, int]:
+    """
+    Load a dataset described by `cfg`. Returns inserted row counts per table.
+
+    Without `reset` the tables must exist and must not already contain rows
+    with the same prefix.
+    """
+    if reset:
+        await reset_schema(engine)
+    else:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    # One stream per entity: changing --courses does not reshuffle the user
+    # data and vice versa.
+    course_rng = random.Random(f"{cfg.seed}:courses")
+    career_rng = random.Random(f"{cfg.seed}:career_paths")
+    user_rng = random.Random(f"{cfg.seed}:users")
+    started = time.perf_counter()
+
+    async with engine.connect() as conn:
+        if conn.dialect.name == "sqlite":
+            # [PERFORMANCE] Bulk-load settings; durability is irrelevant for throwaway data
+            await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+            await conn.exec_driver_sql("PRAGMA synchronous=OFF")
+            await conn.exec_driver_sql("PRAGMA cache_size=-200000")
+
+        writer = BulkWriter(conn, TABLES, batch_size=batch_size)
+        if not await _registry_loaded(conn):
+            for table, rows in skill_rows().items():
+                await writer.add_many(table, rows)
+        for i in range(cfg.courses):
+            course = course_row(cfg, course_rng, i)
+            await writer.add_many("courses", [course])
+            await writer.add_many("course_skills", course_skill_rows(course))
+        for i in range(cfg.career_paths):
+            await writer.add_many("career_paths", [career_path_row(cfg, career_rng, i)])
+
+        for i in range(cfg.users):
+            for table, rows in user_rows(cfg, user_rng, i).items():
+                if rows:
+                    await writer.add_many(table, rows)
+            if progress_every and (i + 1) % progress_every == 0:
+                writer.progress()
+
+        counts = await writer.close()
+
+    logger.info("datagen.done", seconds=round(time.perf_counter() - started, 1), **counts)
+    return counts
@@ -0,0 +1,283 @@
+"""
+Row builders. Every function draws only from the `rng` it is given, so the
+output is fully determined by the config seed and the call order.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from app.core.question_bank import question_bank
+from app.core.skill_gaps import GapState
+from app.core.skill_registry import BUILTIN_ALIASES, normalize_skill
+from datagen.config import (
+    DIFFICULTIES, DIFFICULTY_WEIGHTS, INDUSTRIES, MENTORSHIP_STATUSES, NOTIFICATION_TYPES,
+    PROVIDERS, SKILL_IDS, SKILL_WEIGHTS, SKILLS, TITLES, GenConfig, career_path_id, course_id, mentorship_id,
+    notification_id, quiz_id, skill_gap_id, user_id,
+)
+
+# Fixed reference point instead of now(): keeps reruns byte-identical
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+DIFFICULTY_OFFSET = {"Beginner": 0.1, "Intermediate": 0.0, "Advanced": -0.15}
+
+
+def weighted_sample(rng: random.Random, population: List[str], weights: List[float], k: int) -> List[str]:
+    """k distinct items, drawn proportionally to weights."""
+    chosen: List[str] = []
+    while len(chosen) < min(k, len(population)):
+        item = rng.choices(population, weights)[0]
+        if item not in chosen:
+            chosen.append(item)
+    return chosen
+
+
+def _vary(rng: random.Random, cfg: GenConfig, mean: int) -> int:
+    if cfg.exact_counts or mean == 0:
+        return mean
+    return rng.randint(0, 2 * mean)
+
+
+def skill_rows() -> Dict[str, List[dict]]:
+    """The skill registry: every generated skill plus the built-in aliases that point at one."""
+    return {
+        "skills": [
+            {"id": skill_id, "name": name, "normalized_name": normalize_skill(name)}
+            for name, skill_id in SKILL_IDS.items()
+        ],
+        "skill_aliases": [
+            {"alias": alias, "skill_id": SKILL_IDS[target]}
+            for alias, target in BUILTIN_ALIASES.items() if target in SKILL_IDS
+        ],
+    }
+
+
+def course_row(cfg: GenConfig, rng: random.Random, index: int) -> dict:
+    skills = weighted_sample(rng, SKILLS, SKILL_WEIGHTS, rng.choice([1, 1, 2, 2, 3, 4]))
+    difficulty = rng.choices(DIFFICULTIES, DIFFICULTY_WEIGHTS)[0]
+    return {
+        "id": course_id(cfg, index),
+        "title": f"{skills[0]} {difficulty} Course {index}",
+        "description": f"Covers {', '.join(skills)} at {difficulty.lower()} level.",
+        "provider": rng.choice(PROVIDERS),
+        "url": f"https://courses.example.com/{cfg.prefix}/{index}",
+        "difficulty_level": difficulty,
+        "duration_hours": rng.randint(1, 80),
+        "skills_covered": skills,
+        # Ratings cluster around 4.2 like real course catalogues
+        "rating": round(min(5.0, max(1.0, rng.gauss(4.2, 0.5))), 1),
+        "created_at": EPOCH - timedelta(days=rng.randint(0, 1_000)),
+    }
+
+
+def course_skill_rows(course: dict) -> List[dict]:
+    """course_skills association rows for a row built by course_row."""
+    return [{"course_id": course["id"], "skill_id": SKILL_IDS[s]} for s in course["skills_covered"]]
+
+
+def career_path_row(cfg: GenConfig, rng: random.Random, index: int) -> dict:
+    skills = weighted_sample(rng, SKILLS, SKILL_WEIGHTS, rng.randint(3, 6))
+    difficulty = rng.choices(DIFFICULTIES, DIFFICULTY_WEIGHTS)[0]
+    role = rng.choice(TITLES)
+    return {
+        "id": career_path_id(cfg, index),
+        "title": f"{difficulty} {role} Track {index}",
+        "description": f"Become a {role.lower()} through {', '.join(skills)}.",
+        "target_role": role,
+        "industry": rng.choice(INDUSTRIES),
+        "required_skills": {skill: rng.randint(4, 9) for skill in skills},
+        "estimated_months": rng.randint(3, 36),
+        "difficulty_level": difficulty,
+    }
+
+
+def _pick_questions(rng: random.Random, skill: str, difficulty: str, count: int) -> List[Tuple[dict, int]]:
+    """(question as stored in questions_data, correct option index) pairs."""
+    bank = question_bank().get(skill, {}).get(difficulty, [])
+    if bank:
+        picked = rng.sample(bank, min(count, len(bank)))
+        return [
+            ({"id": q["id"], "text": q["text"], "options": q["options"], "topic": q.get("topic", "General")},
+             q["correct"])
+            for q in picked
+        ]
+    # Same shape as the generic questions the quiz endpoint generates
+    return [
+        ({
+            "id": f"q_generic_{skill[:3].lower()}_{difficulty[0].lower()}_{n}",
+            "text": f"In {skill} at {difficulty} level, what is the best practice for topic {n + 1}?",
+            "options": [f"Best practice for {skill} concept {c}" for c in "ABCD"],
+            "topic": "General",
+        }, rng.randint(0, 3))
+        for n in range(count)
+    ]
+
+
+def _performance(score: float, correct: int, total: int) -> dict:
+    if score >= 80:
+        level = "Excellent"
+    elif score >= 60:
+        level = "Good"
+    elif score >= 40:
+        level = "Needs Improvement"
+    else:
+        level = "Review Required"
+    return {
+        "score_percentage": score,
+        "performance_level": level,
+        "correct_answers": correct,
+        "incorrect_answers": total - correct,
+        "total_questions": total,
+    }
+
+
+def quiz_row(cfg: GenConfig, rng: random.Random, user_index: int, n: int, skills: List[str], ability: float) -> dict:
+    # Users mostly quiz themselves on skills they list, sometimes on new ones
+    skill = rng.choice(skills) if skills and rng.random() < 0.8 else rng.choices(SKILLS, SKILL_WEIGHTS)[0]
+    difficulty = rng.choices(DIFFICULTIES, DIFFICULTY_WEIGHTS)[0]
+    questions = _pick_questions(rng, skill, difficulty, rng.choice([5, 5, 10, 10, 15]))
+    count = len(questions)
+    created = EPOCH - timedelta(days=rng.randint(0, 730), seconds=rng.randint(0, 86_399))
+
+    status = rng.choices(["completed", "in_progress", "not_started"], [0.75, 0.1, 0.15])[0]
+    row = {
+        "id": quiz_id(cfg, user_index, n),
+        "user_id": user_id(cfg, user_index),
+        "skill_id": SKILL_IDS[skill],
+        "skill_name": skill,
+        "difficulty_level": difficulty,
+        "title": f"{skill} {difficulty} Quiz",
+        "status": status,
+        "question_count": count,
+        "score": None,
+        "correct_answers": 0,
+        "time_taken_seconds": None,
+        "questions_data": {"questions": [q for q, _ in questions]},
+        "answers_submitted": None,
+        "performance_data": None,
+        "created_at": created,
+        "started_at": None,
+        "completed_at": None,
+    }
+    if status == "not_started":
+        return row
+
+    row["started_at"] = created + timedelta(seconds=rng.randint(5, 3_600))
+    if status == "in_progress":
+        return row
+
+    p_correct = min(0.98, max(0.05, ability + DIFFICULTY_OFFSET[difficulty]))
+    answers: Dict[str, int] = {}
+    correct = 0
+    for question, answer_key in questions:
+        if rng.random() < p_correct:
+            answers[question["id"]] = answer_key
+            correct += 1
+        else:
+            answers[question["id"]] = rng.choice([i for i in range(len(question["options"])) if i != answer_key])
+    score = correct / count * 100 if count else 0
+    elapsed = sum(rng.randint(15, 120) for _ in range(count))
+    row.update({
+        "score": score,
+        "correct_answers": correct,
+        "time_taken_seconds": elapsed,
+        "answers_submitted": answers,
+        "performance_data": _performance(score, correct, count),
+        "completed_at": row["started_at"] + timedelta(seconds=elapsed),
+    })
+    return row
+
+
+def skill_gap_rows(cfg: GenConfig, index: int, user_skills: List[dict], quizzes: List[dict]) -> List[dict]:
+    """Materialized gap rows, folded from the completed quizzes in order like the app does on submit."""
+    levels = {s["skill_id"]: s["proficiency"] for s in user_skills}
+    states: Dict[int, GapState] = {}
+    first: Dict[int, dict] = {}
+    last: Dict[int, dict] = {}
+    for quiz in sorted((q for q in quizzes if q["status"] == "completed"), key=lambda q: q["completed_at"]):
+        state = states.setdefault(quiz["skill_id"], GapState(current_level=levels.get(quiz["skill_id"], 0)))
+        state.add_score(quiz["score"])
+        first.setdefault(quiz["skill_id"], quiz)
+        last[quiz["skill_id"]] = quiz
+    return [
+        {
+            "id": skill_gap_id(cfg, index, skill_id),
+            "user_id": user_id(cfg, index),
+            "skill_id": skill_id,
+            "skill_name": last[skill_id]["skill_name"],
+            "source": "quiz",
+            "source_id": last[skill_id]["id"],
+            "identified_at": first[skill_id]["completed_at"],
+            "updated_at": last[skill_id]["completed_at"],
+            **vars(state),
+        }
+        for skill_id, state in states.items()
+    ]
+
+
+def user_rows(cfg: GenConfig, rng: random.Random, index: int) -> Dict[str, List[dict]]:
+    """The user plus every row that hangs off it, keyed by table name."""
+    uid = user_id(cfg, index)
+    joined = EPOCH - timedelta(days=rng.randint(0, 1_000))
+    ability = rng.uniform(0.3, 0.95)
+    skills = weighted_sample(rng, SKILLS, SKILL_WEIGHTS, _vary(rng, cfg, cfg.skills_per_user) or 1)
+
+    out: Dict[str, List[dict]] = {
+        "users": [{
+            "id": uid,
+            "email": f"{uid}@example.com",
+            # Not a valid hash: generated users cannot log in with a password
+            "hashed_password": "!",
+            "full_name": f"User {index}",
+            "title": rng.choice(TITLES),
+            "bio": None,
+            "avatar_url": None,
+            "created_at": joined,
+        }],
+        "user_skills": [
+            {
+                "user_id": uid,
+                "skill_id": SKILL_IDS[skill],
+                "skill_name": skill,
+                # Proficiency tracks quiz ability so gaps and scores are correlated
+                "proficiency": max(1, min(10, round(ability * 10 + rng.gauss(0, 1.5)))),
+                "verified": rng.random() < 0.2,
+            }
+            for skill in skills
+        ],
+        "quizzes": [
+            quiz_row(cfg, rng, index, n, skills, ability)
+            for n in range(_vary(rng, cfg, cfg.quizzes_per_user))
+        ],
+        "notifications": [
+            {
+                "id": notification_id(cfg, index, n),
+                "user_id": uid,
+                "type": rng.choice(NOTIFICATION_TYPES),
+                "title": f"Notification {n}",
+                "message": "You have a new update.",
+                "related_id": None,
+                "is_read": rng.random() < 0.6,
+                "created_at": EPOCH - timedelta(minutes=n * rng.randint(1, 600)),
+            }
+            for n in range(_vary(rng, cfg, cfg.notifications_per_user))
+        ],
+        "mentorships": [],
+    }
+    out["skill_gap_records"] = skill_gap_rows(cfg, index, out["user_skills"], out["quizzes"])
+
+    mentors = max(1, cfg.users // 10)
+    if index >= mentors and rng.random() < cfg.mentee_ratio:
+        status = rng.choice(MENTORSHIP_STATUSES)
+        focus = rng.choice(skills)
+        started = joined + timedelta(days=rng.randint(1, 60)) if status != "pending" else None
+        out["mentorships"].append({
+            "id": mentorship_id(cfg, index),
+            "mentor_id": user_id(cfg, rng.randrange(mentors)),
+            "mentee_id": uid,
+            "skill_focus": focus,
+            "skill_focus_id": SKILL_IDS[focus],
+            "status": status,
+            "started_at": started,
+            "ended_at": started + timedelta(days=rng.randint(30, 180)) if status == "completed" else None,
+            "created_at": joined,
+        })
+    return out
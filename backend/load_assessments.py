@@ -0,0 +1,64 @@
+"""
+Create or replace assessment definitions from JSON files.
+
+Each file holds one definition or a list of them (see DEFAULT_DEFINITIONS in
+app/api/endpoints/assessments.py for the format). Definitions are compiled
+before anything is written, so a broken file changes nothing. Running
+workers pick the new versions up within RELOAD_CHECK_S, without a restart.
+
+    python load_assessments.py definitions/healthcare.json [...]
+    python load_assessments.py --deactivate asm_python_ds
+"""
+import argparse
+import asyncio
+import json
+
+from sqlalchemy import select
+
+from app.core.assessments import CompiledAssessment, InvalidDefinition
+from app.core.db import AsyncSessionLocal, engine, Base
+from app.crud import assessment as assessment_crud
+from app.models.models import AssessmentDefinition
+
+
+def _read(paths):
+    definitions = []
+    for path in paths:
+        with open(path) as f:
+            data = json.load(f)
+        definitions.extend(data if isinstance(data, list) else [data])
+    for definition in definitions:
+        # Fail fast: the same compile the workers run
+        CompiledAssessment(definition)
+    return definitions
+
+
+async def load_assessments(paths, deactivate):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    definitions = _read(paths)
+    async with AsyncSessionLocal() as db:
+        for definition in definitions:
+            version = await assessment_crud.upsert_definition(db, definition)
+            print(f"{definition['id']}: version {version}")
+        for definition_id in deactivate:
+            content = (await db.execute(
+                select(AssessmentDefinition.content).where(AssessmentDefinition.id == definition_id)
+            )).scalar()
+            if content is None:
+                print(f"{definition_id}: not found")
+                continue
+            await assessment_crud.upsert_definition(db, content, is_active=False)
+            print(f"{definition_id}: deactivated")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="JSON files with definitions")
+    parser.add_argument("--deactivate", nargs="*", default=[], metavar="ID", help="definition ids to retire")
+    args = parser.parse_args()
+    try:
+        asyncio.run(load_assessments(args.paths, args.deactivate))
+    except InvalidDefinition as exc:
+        raise SystemExit(f"Invalid definition: {exc}")
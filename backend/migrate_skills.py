@@ -0,0 +1,203 @@
+"""
+Migration to the canonical skill registry.
+
+Creates the `skills` / `skill_aliases` tables, the integer skill columns and
+the course_skills / project_skills association tables, interns every skill
+name found in existing rows, then backfills the ids and links and rewrites
+names to their canonical spelling. Safe to re-run: only rows whose id is
+still NULL, and courses / projects without any links, are touched.
+
+skill_gap_records used to be an append-only log; it becomes one materialized
+row per (user, skill). The old rows are dropped and the table is rebuilt from
+completed quizzes, folding scores in completion order as quiz submission does.
+
+Also adds columns and indexes that later features introduced on existing
+tables (the quiz answer log, the completed-quiz keyset index).
+
+    python migrate_skills.py
+"""
+import asyncio
+import uuid
+from datetime import datetime
+from sqlalchemy import bindparam, insert, inspect, select, update, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.models.models import (
+    Base, CareerPath, Course, CourseSkill, Mentorship, Project, ProjectSkill, Quiz, SkillGapRecord, UserSkill,
+)
+from app.core.config import settings
+from app.crud import skill as skill_crud
+from app.core.skill_registry import BUILTIN_ALIASES, normalize_skill
+from app.core.skill_gaps import GapState
+
+# (model, name column, id column) pairs that reference one skill per row
+REFERENCES = [
+    (UserSkill, UserSkill.skill_name, UserSkill.skill_id),
+    (Quiz, Quiz.skill_name, Quiz.skill_id),
+    (SkillGapRecord, SkillGapRecord.skill_name, SkillGapRecord.skill_id),
+    (Mentorship, Mentorship.skill_focus, Mentorship.skill_focus_id),
+]
+# (entity model, JSON list column, association model, association entity column)
+LINKS = [
+    (Course, Course.skills_covered, CourseSkill, CourseSkill.course_id),
+    (Project, Project.skills_used, ProjectSkill, ProjectSkill.project_id),
+]
+# Columns added to skill_gap_records when it became a materialized (user, skill) table
+GAP_COLUMNS = [
+    SkillGapRecord.quiz_count, SkillGapRecord.avg_score, SkillGapRecord.recent_score, SkillGapRecord.updated_at,
+]
+# Columns added to quizzes for incremental answering
+QUIZ_COLUMNS = [Quiz.answer_log, Quiz.answer_log_length]
+BATCH_SIZE = 1000
+
+
+def _add_missing_columns(sync_conn) -> None:
+    """create_all only creates missing tables: add the new columns and indexes by hand."""
+    inspector = inspect(sync_conn)
+    for model, _, id_column in REFERENCES:
+        table = model.__table__
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        if id_column.key not in existing:
+            sync_conn.execute(text(
+                f"ALTER TABLE {table.name} ADD COLUMN {id_column.key} INTEGER REFERENCES skills(id)"
+            ))
+    gap_table = SkillGapRecord.__table__
+    existing = {c["name"] for c in inspector.get_columns(gap_table.name)}
+    if SkillGapRecord.quiz_count.key not in existing:
+        for column in GAP_COLUMNS:
+            ddl = column.type.compile(dialect=sync_conn.dialect)
+            sync_conn.execute(text(f"ALTER TABLE {gap_table.name} ADD COLUMN {column.key} {ddl}"))
+        # Duplicated, never-closed log rows: rebuilt from quizzes below (before the unique index exists)
+        sync_conn.execute(gap_table.delete())
+    existing = {c["name"] for c in inspector.get_columns(Quiz.__tablename__)}
+    for column in QUIZ_COLUMNS:
+        if column.key not in existing:
+            ddl = column.type.compile(dialect=sync_conn.dialect)
+            sync_conn.execute(text(f"ALTER TABLE {Quiz.__tablename__} ADD COLUMN {column.key} {ddl}"))
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+async def _collect_names(db: AsyncSession) -> set:
+    names = set()
+    for _, name_column, _ in REFERENCES:
+        result = await db.execute(select(name_column).distinct())
+        names.update(n for n in result.scalars() if n)
+    for _, column, _, _ in LINKS:
+        result = await db.stream(select(column).execution_options(yield_per=BATCH_SIZE))
+        async for (values,) in result:
+            names.update(n for n in values or [] if n)
+    result = await db.stream(select(CareerPath.required_skills).execution_options(yield_per=BATCH_SIZE))
+    async for (required,) in result:
+        names.update(n for n in (required or {}) if n)
+    return names
+
+
+async def _backfill_links(db: AsyncSession, ids: dict, model, json_column, link_model, entity_column) -> int:
+    """Link rows for entities that have none yet, and canonical spellings in the JSON list."""
+    linked = select(entity_column).distinct()
+    result = await db.stream(
+        select(model.id, json_column)
+        .where(model.id.not_in(linked))
+        .execution_options(yield_per=BATCH_SIZE)
+    )
+    links, renamed = [], []
+    async for entity_id, values in result:
+        canonical = {}
+        for name in values or []:
+            if name in ids:
+                canonical.setdefault(ids[name], skill_crud.display_name(db, ids[name], name))
+        links.extend({entity_column.key: entity_id, "skill_id": skill_id} for skill_id in canonical)
+        if list(canonical.values()) != list(values or []):
+            renamed.append({"entity_id": entity_id, "names": list(canonical.values())})
+    if links:
+        await db.execute(insert(link_model), links)
+    if renamed:
+        await db.execute(
+            update(model.__table__)
+            .where(model.__table__.c.id == bindparam("entity_id"))
+            .values({json_column.key: bindparam("names")}),
+            renamed,
+        )
+    return len(links)
+
+
+async def _rebuild_skill_gaps(db: AsyncSession) -> int:
+    """Fold every completed quiz into gap rows, if the table is empty."""
+    if (await db.execute(select(SkillGapRecord.id).limit(1))).first() is not None:
+        return 0
+    levels = {}
+    result = await db.stream(
+        select(UserSkill.user_id, UserSkill.skill_id, UserSkill.proficiency)
+        .where(UserSkill.skill_id.is_not(None))
+        .execution_options(yield_per=BATCH_SIZE)
+    )
+    async for user_id, skill_id, proficiency in result:
+        levels[(user_id, skill_id)] = proficiency
+
+    result = await db.stream(
+        select(Quiz.id, Quiz.user_id, Quiz.skill_id, Quiz.skill_name, Quiz.score, Quiz.completed_at)
+        .where(Quiz.status == "completed", Quiz.skill_id.is_not(None))
+        .order_by(Quiz.user_id, Quiz.skill_id, Quiz.completed_at)
+        .execution_options(yield_per=BATCH_SIZE)
+    )
+    rows = {}
+    async for quiz in result:
+        key = (quiz.user_id, quiz.skill_id)
+        if key not in rows:
+            rows[key] = (GapState(current_level=levels.get(key, 0)), {
+                "id": f"gap_{uuid.uuid4().hex[:12]}",
+                "user_id": quiz.user_id,
+                "skill_id": quiz.skill_id,
+                "skill_name": quiz.skill_name,
+                "source": "quiz",
+                "identified_at": quiz.completed_at,
+            })
+        state, row = rows[key]
+        state.add_score(quiz.score)
+        row["source_id"] = quiz.id
+        row["updated_at"] = quiz.completed_at or datetime.utcnow()
+
+    values = [{**row, **vars(state)} for state, row in rows.values()]
+    for start in range(0, len(values), BATCH_SIZE):
+        await db.execute(insert(SkillGapRecord), values[start:start + BATCH_SIZE])
+    return len(values)
+
+
+async def migrate_skills():
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        # Sorted: "Python" is interned before "python", so the capitalised spelling wins
+        names = sorted(await _collect_names(db))
+        # Alias spellings ("js") wait until the aliases exist, or they would become skills of their own
+        await skill_crud.resolve_skill_ids(db, [n for n in names if normalize_skill(n) not in BUILTIN_ALIASES])
+        await db.commit()
+        aliases = await skill_crud.ensure_builtin_aliases(db)
+        ids = await skill_crud.resolve_skill_ids(db, names)
+        await db.commit()
+
+        updated = 0
+        for model, name_column, id_column in REFERENCES:
+            for name, skill_id in ids.items():
+                result = await db.execute(
+                    update(model)
+                    .where(name_column == name, id_column.is_(None))
+                    .values({id_column.key: skill_id, name_column.key: skill_crud.display_name(db, skill_id, name)})
+                )
+                updated += result.rowcount or 0
+        linked = 0
+        for model, json_column, link_model, entity_column in LINKS:
+            linked += await _backfill_links(db, ids, model, json_column, link_model, entity_column)
+        gaps = await _rebuild_skill_gaps(db)
+        await db.commit()
+
+    await engine.dispose()
+    print(f"Skill registry: {len(set(ids.values()))} skills, {aliases} aliases added, {updated} rows backfilled, {linked} links added, {gaps} skill gaps rebuilt.")
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_skills())
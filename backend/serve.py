@@ -0,0 +1,241 @@
+"""
+Production server: one worker process per core on a shared listening socket.
+
+    python serve.py --host 0.0.0.0 --port 8000
+    python serve.py --workers 8 --graceful-timeout 30 --max-requests 50000
+
+The master binds the socket, imports the app and builds its read-only data
+(every router, the OpenAPI schema, the question bank), freezes it out of the
+garbage collector and only then forks the workers, so those pages stay
+shared copy-on-write. Each worker runs uvicorn on uvloop with the httptools
+parser (falling back to asyncio / h11 where they are not installed).
+
+Signals to the master:
+  TERM, INT  graceful stop: workers stop accepting, finish the requests in
+             flight (up to --graceful-timeout), then run the app's shutdown,
+             which writes buffered answers and counters. Workers still alive
+             SHUTDOWN_MARGIN_S later are killed.
+  HUP        rolling restart: fresh workers are forked from the preloaded
+             master, then the old ones stop gracefully. Drops every
+             in-process cache; it does not reload code.
+
+A worker that exits is replaced (e.g. after --max-requests). Caches are per
+worker: see "Production Mode" in the README for how each converges.
+"""
+import argparse
+import gc
+import importlib.util
+import os
+import signal
+import time
+
+# [SCALING] A cached quiz is re-read this often when several workers serve it
+MULTI_WORKER_QUIZ_SESSION_MAX_AGE_S = 5
+# Time the app's shutdown (buffer flushes) gets after the graceful timeout
+SHUTDOWN_MARGIN_S = 10
+# A worker dying sooner than this after its start is a crash loop: respawn slowly
+CRASH_WINDOW_S = 5
+
+
+def default_workers() -> int:
+    """One per core this process may run on (its affinity mask, e.g. a container cpuset)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _implementation(preferred: str, fallback: str) -> str:
+    return preferred if importlib.util.find_spec(preferred) else fallback
+
+
+def preload():
+    """Import the app and build its read-only data in the master, before forking."""
+    from app.main import app
+    from app.api.routers import load_all
+    from app.core.question_bank import question_bank
+
+    load_all(app)
+    app.openapi()
+    question_bank()
+    return app
+
+
+def build_config(app, args):
+    import uvicorn
+
+    return uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        uds=args.uds,
+        backlog=args.backlog,
+        loop=_implementation("uvloop", "asyncio"),
+        http=_implementation("httptools", "h11"),
+        lifespan="on",
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        limit_max_requests=args.max_requests or None,
+        # Workers started together are not recycled together
+        limit_max_requests_jitter=(args.max_requests or 0) // 10,
+        proxy_headers=True,
+        forwarded_allow_ips=args.forwarded_allow_ips,
+        # The request timing middleware already logs every request
+        access_log=False,
+    )
+
+
+def run_worker(config, sock) -> None:
+    import uvicorn
+    from app.core.db import engine
+
+    gc.enable()
+    # Pooled connections must not cross a fork (the master opens none, but keep it that way)
+    engine.sync_engine.dispose(close=False)
+    # uvicorn handles TERM / INT while serving; outside of that they are the master's business
+    for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+        signal.signal(sig, signal.SIG_IGN)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class Master:
+    """Forks the workers, replaces those that exit, and stops or restarts them on signals."""
+    def __init__(self, config, sock, workers: int, graceful_timeout: int):
+        import structlog
+
+        self.config = config
+        self.sock = sock
+        self.size = workers
+        self.graceful_timeout = graceful_timeout
+        self.workers = {}  # pid -> monotonic start time
+        self.retiring = set()  # Old workers draining after a restart
+        self.stopping = False
+        self.restart = False
+        self.logger = structlog.get_logger()
+
+    def spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_worker(self.config, self.sock)
+            except BaseException as exc:
+                self.logger.error("server.worker_failed", error=repr(exc))
+                code = 1
+            os._exit(code)
+        self.workers[pid] = time.monotonic()
+
+    def _signal(self, pids, sig) -> None:
+        for pid in pids:
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            self.retiring.discard(pid)
+            started = self.workers.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            # Exit 0 outside a stop: recycled after --max-requests
+            (self.logger.info if code == 0 else self.logger.warning)("server.worker_exited", pid=pid, code=code)
+            if time.monotonic() - started < CRASH_WINDOW_S:
+                time.sleep(1)
+            self.spawn()
+
+    def _rolling_restart(self) -> None:
+        self.restart = False
+        old = list(self.workers)
+        self.retiring.update(old)
+        self.workers = {}
+        for _ in range(self.size):
+            self.spawn()
+        self._signal(old, signal.SIGTERM)
+        self.logger.info("server.restarted", workers=list(self.workers), retiring=old)
+
+    def _shutdown(self) -> None:
+        pids = set(self.workers) | self.retiring
+        self.logger.info("server.stopping", workers=sorted(pids))
+        self._signal(pids, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout + SHUTDOWN_MARGIN_S
+        while (self.workers or self.retiring) and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        left = set(self.workers) | self.retiring
+        if left:
+            self.logger.error("server.killed", workers=sorted(left))
+            self._signal(left, signal.SIGKILL)
+            for pid in left:
+                os.waitpid(pid, 0)
+        self.logger.info("server.stopped")
+
+    def _on_stop(self, sig, frame) -> None:
+        self.stopping = True
+
+    def _on_hup(self, sig, frame) -> None:
+        self.restart = True
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_hup)
+        for _ in range(self.size):
+            self.spawn()
+        gc.enable()
+        self.logger.info("server.started", workers=list(self.workers), pid=os.getpid())
+        while not self.stopping:
+            if self.restart:
+                self._rolling_restart()
+            self._reap()
+            time.sleep(0.2)
+        self._shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--uds", help="Listen on this unix socket instead")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WEB_CONCURRENCY", 0)) or default_workers(),
+                        help="Worker processes (default: $WEB_CONCURRENCY, else one per core)")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--keep-alive", type=int, default=5, help="Idle keep-alive timeout in seconds")
+    parser.add_argument("--graceful-timeout", type=int, default=30,
+                        help="Seconds in-flight requests get to finish on stop")
+    parser.add_argument("--max-requests", type=int, default=0,
+                        help="Replace a worker after about this many requests (0: never)")
+    parser.add_argument("--forwarded-allow-ips", default=os.environ.get("FORWARDED_ALLOW_IPS", "127.0.0.1"),
+                        help="Proxies trusted for X-Forwarded-For / -Proto")
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        # [SCALING] Must be set before anything imports app.core.config (see config.py)
+        os.environ.setdefault("ANSWER_FLUSH_BATCH", "1")
+        os.environ.setdefault("QUIZ_SESSION_MAX_AGE_S", str(MULTI_WORKER_QUIZ_SESSION_MAX_AGE_S))
+
+    if not hasattr(os, "fork"):
+        # Windows: no fork, so one worker and nothing to share
+        import uvicorn
+        from app.main import app
+        uvicorn.Server(build_config(app, args)).run()
+        return
+
+    # Objects built by the preload must not be touched by the collector afterwards,
+    # or the pages they live on are copied into every worker
+    gc.disable()
+    app = preload()
+    config = build_config(app, args)
+    sock = config.bind_socket()
+    gc.freeze()
+    Master(config, sock, args.workers, args.graceful_timeout).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Skill names are interned by whichever spelling comes first; quizzes must
+still be served and graded from the question bank, and builtin aliases must
+resolve without running migrate_skills.py.
+
+    cd backend && python -m pytest -q tests
+"""
+import asyncio
+import os
+import tempfile
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "test.db")
+# [DEFAULTS] Must run before anything imports app.core.config
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("ENVIRONMENT", "staging")
+
+import httpx
+
+from app.core import security
+from app.core.db import Base, AsyncSessionLocal, engine
+from app.core.question_bank import question_bank
+from app.core.skill_registry import skill_registry
+from app.main import app
+from app.models.models import User
+
+USERS = ["user-a", "user-b"]
+
+
+async def _reset() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    skill_registry.clear()
+    async with AsyncSessionLocal() as session:
+        session.add_all(User(id=u, email=f"{u}@example.com", hashed_password="x") for u in USERS)
+        await session.commit()
+
+
+def _client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def _auth(user_id: str) -> dict:
+    return {"Authorization": "Bearer " + security.create_access_token(subject=user_id)}
+
+
+def test_variant_spelling_interned_first_still_grades_from_the_bank():
+    async def flow():
+        await _reset()
+        async with _client() as client:
+            response = await client.patch("/users/me", json={"skills": ["python"]}, headers=_auth("user-a"))
+            assert response.status_code == 200
+
+            headers = _auth("user-b")
+            response = await client.post("/api/v1/quizzes/generate", headers=headers, json={
+                "config_id": "c", "skill_name": "Python", "difficulty_level": "Beginner", "question_count": 5,
+            })
+            assert response.status_code == 200
+            quiz = response.json()
+            correct = {q["id"]: q["correct"] for q in question_bank()["Python"]["Beginner"]}
+            assert {q["id"] for q in quiz["questions"]} <= correct.keys()
+
+            assert (await client.post(f"/api/v1/quizzes/{quiz['id']}/start", headers=headers)).status_code == 200
+            answers = [{"question_id": q["id"], "selected_option_index": correct[q["id"]]} for q in quiz["questions"]]
+            response = await client.post(f"/api/v1/quizzes/{quiz['id']}/submit", json=answers, headers=headers)
+            assert response.status_code == 200
+            assert response.json()["correct_answers"] == 5
+            assert response.json()["score"] == 100.0
+
+            response = await client.post("/api/v1/quizzes/adaptive", json={"skill_name": "Python"}, headers=headers)
+            assert response.status_code == 200
+            assert response.json()["question"]["id"] in correct.keys() | {
+                q["id"] for levels in question_bank()["Python"].values() for q in levels
+            }
+
+    asyncio.run(flow())
+
+
+def test_builtin_aliases_resolve_on_a_fresh_database():
+    async def flow():
+        await _reset()
+        async with _client() as client:
+            response = await client.post("/api/v1/projects", headers=_auth("user-a"), json={
+                "title": "t", "description": "d", "skills_used": ["Python", "py", "python"],
+            })
+            assert response.status_code in (200, 201)
+            assert response.json()["skills_used"] == ["Python"]
+
+    asyncio.run(flow())
@@ -71,6 +71,26 @@ export interface Notification {
     created_at: string;
 }
 
+export interface Dashboard {
+    profile: ApiUser & { is_partial_data: boolean; details?: string };
+    achievements: Achievement[];
+    projects: Project[];
+    recommendations: { course: Course; relevance_score: number; match_reason: string }[];
+    mentors: Mentorship[];
+    notifications: { recent: Notification[]; unread_count: number };
+    is_partial_data: boolean;
+    degraded_sections: string[];
+}
+
+export interface CareerProgress {
+    path_id: string;
+    path_title: string;
+    progress_percentage: number;
+    current_skills: string[];
+    missing_skills: string[];
+    estimated_completion_months: number;
+}
+
 let authToken: string | null = null;
 
 export const api = {
@@ -300,6 +320,24 @@ export const api = {
         return response.json();
     },
 
+    // Dashboard (one request instead of one per section)
+    async getDashboard(token: string): Promise<Dashboard> {
+        const response = await fetch(`${API_URL}/dashboard`, {
+            headers: { Authorization: `Bearer ${token}` }
+        });
+        if (!response.ok) throw new Error("Failed to fetch dashboard");
+        return response.json();
+    },
+
+    // Career paths
+    async getCareerMatches(token: string, limit = 5): Promise<CareerProgress[]> {
+        const response = await fetch(`${API_URL}/career-paths/me/matches?limit=${limit}`, {
+            headers: { Authorization: `Bearer ${token}` }
+        });
+        if (!response.ok) throw new Error("Failed to fetch career paths");
+        return response.json();
+    },
+
     // Settings
     async getSettings(token: string) {
         const response = await fetch(`${API_URL}/users/settings`, {